@@ -11,7 +11,9 @@ from .svmlightcorpus import SvmLightCorpus
 from .lowcorpus import LowCorpus
 from .dictionary import Dictionary
 from .hashdictionary import HashDictionary
+from .compactdictionary import CompactDictionary
 from .wikicorpus import WikiCorpus
 from .textcorpus import TextCorpus
 from .ucicorpus import UciCorpus
 from .malletcorpus import MalletCorpus
+from .csrcorpus import CsrCorpus
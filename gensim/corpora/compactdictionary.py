@@ -0,0 +1,342 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Licensed under the GNU LGPL v2.1 - http://www.gnu.org/licenses/lgpl.html
+
+
+"""
+This module implements `CompactDictionary`, a :class:`Dictionary` for very large,
+long-tailed corpora.
+
+Unlike `Dictionary`, which keeps `token2id`, `id2token` and `dfs` as Python dicts and
+prunes its vocabulary every 10,000 documents, `CompactDictionary`:
+
+* stores the document frequencies in a numpy array and the tokens in a utf8 string table
+  (also a numpy array), with token ids assigned in order of decreasing document frequency,
+* counts the documents within a fixed memory budget: at most `prune_at` candidate tokens
+  are kept while counting, evicting the least frequent ones (the space-saving algorithm),
+  with a count-min sketch bounding the counts of tokens that come back after an eviction.
+
+"""
+
+from __future__ import with_statement
+
+from collections import Counter, Mapping
+import logging
+
+import numpy as np
+
+from gensim import utils
+from gensim.corpora.dictionary import Dictionary, _count_tokens
+from gensim.matutils import argsort
+from six import iteritems, iterkeys, itervalues
+from six.moves import xrange, zip as izip
+
+
+logger = logging.getLogger(__name__)
+
+
+class CountMinSketch(object):
+    """
+    Approximate counts of a stream of hashable items (tokens) in a fixed `depth` x `width`
+    table of counters.
+
+    Each item adds its count to one counter per row, picked by multiply-shift hashing of
+    `hash(item)`; its estimated count is the smallest of its counters. Estimates never
+    undercount, and overcount by at most `e * total / width` with probability
+    `1 - exp(-depth)`, where `total` is the sum of all counts added.
+
+    Because it relies on the built-in `hash`, a sketch is only meaningful within one
+    Python process.
+    """
+    def __init__(self, width=2 ** 20, depth=4, seed=0):
+        if width < 2 or width & (width - 1):
+            raise ValueError("sketch width must be a power of two, not %i" % width)
+        random_state = np.random.RandomState(seed)
+        # one odd 64bit multiplier per row
+        multipliers = random_state.randint(0, 2 ** 63 - 1, size=depth, dtype=np.int64).astype(np.uint64)
+        self.multipliers = multipliers * np.uint64(2) + np.uint64(1)
+        self.shift = np.uint64(64 - (int(width).bit_length() - 1))
+        self.table = np.zeros((depth, width), dtype=np.uint32)
+
+    def positions(self, items):
+        """Return the counters of `items` in each row, as a `depth` x `len(items)` array."""
+        hashes = np.fromiter((hash(item) for item in items), dtype=np.int64, count=len(items)).view(np.uint64)
+        return ((self.multipliers[:, None] * hashes[None, :]) >> self.shift).astype(np.intp)
+
+    def add(self, positions, counts):
+        """Add `counts` to the items at `positions` (see `positions()`)."""
+        counts = np.asarray(counts).astype(self.table.dtype)
+        for row, table_row in enumerate(self.table):
+            np.add.at(table_row, positions[row], counts)  # several items may share a counter
+
+    def estimate(self, positions):
+        """Return the estimated counts of the items at `positions` (see `positions()`)."""
+        return self.table[np.arange(len(self.table))[:, None], positions].min(axis=0)
+#endclass CountMinSketch
+
+
+class DocFreqs(Mapping):
+    """
+    Read-only `token id -> document frequency` mapping over the `docfreqs` array of a
+    `CompactDictionary`, so it can be used wherever `Dictionary.dfs` is.
+    """
+    def __init__(self, docfreqs):
+        self.docfreqs = docfreqs
+
+    def __getitem__(self, tokenid):
+        if not 0 <= tokenid < len(self.docfreqs):
+            raise KeyError(tokenid)
+        return int(self.docfreqs[tokenid])
+
+    def __iter__(self):
+        return iter(xrange(len(self.docfreqs)))
+
+    def __len__(self):
+        return len(self.docfreqs)
+
+    def copy(self):
+        """Return the mapping as a plain dict."""
+        return dict(izip(xrange(len(self.docfreqs)), self.docfreqs.tolist()))
+#endclass DocFreqs
+
+
+class CompactDictionary(Dictionary):
+    """
+    Memory-efficient `Dictionary`, with token ids in order of decreasing document
+    frequency (id 0 is the most frequent token).
+
+    The document frequencies are stored in the `docfreqs` array, the tokens in the
+    `token_bytes` string table (utf8, the token of id `i` being
+    `token_bytes[token_offsets[i]:token_offsets[i + 1]]`). `dfs` is a read-only view
+    of `docfreqs`. `token2id` is not saved, but rebuilt on `load`.
+
+    The dictionary is built with `add_documents` only; `doc2bow(allow_update=True)`
+    is not supported.
+
+    >>> dictionary = CompactDictionary(texts, prune_at=1000000)
+    >>> dictionary.filter_extremes(no_below=5, no_above=0.5, keep_n=100000)  # a prefix of the ids
+    >>> corpus = [dictionary.doc2bow(text) for text in texts]
+
+    """
+    def __init__(self, documents=None, prune_at=2000000, sketch_width=2 ** 20, sketch_depth=4):
+        """
+        If `documents` are given, use them to initialize the dictionary (see `add_documents()`).
+
+        While counting, keep at most `prune_at` tokens (`None` = count all tokens exactly).
+        Tokens that come back after being evicted are bounded by a count-min sketch of
+        `sketch_depth` x `sketch_width` 32bit counters.
+        """
+        self.prune_at = prune_at
+        self.sketch_width, self.sketch_depth = sketch_width, sketch_depth
+
+        self.token2id = {}
+        self.docfreqs = np.zeros(0, dtype=np.int64)
+        self.token_bytes = np.zeros(0, dtype=np.uint8)
+        self.token_offsets = np.zeros(1, dtype=np.int64)
+        self.df_error = 0  # document frequencies may be overestimated by up to this much
+        self.sketch = None  # sketch of all documents counted so far, if any
+
+        self.num_docs = 0  # number of documents processed
+        self.num_pos = 0  # total number of corpus positions
+        self.num_nnz = 0  # total number of non-zeroes in the BOW matrix
+
+        if documents is not None:
+            self.add_documents(documents)
+
+    @property
+    def dfs(self):
+        return DocFreqs(self.docfreqs)
+
+    def __getitem__(self, tokenid):
+        if not 0 <= tokenid < len(self.docfreqs):
+            raise KeyError(tokenid)
+        start, end = self.token_offsets[tokenid], self.token_offsets[tokenid + 1]
+        return self.token_bytes[start:end].tobytes().decode('utf8')
+
+    def keys(self):
+        """Return a list of all token ids."""
+        return list(xrange(len(self.docfreqs)))
+
+    def __str__(self):
+        some_tokens = [self[tokenid] for tokenid in xrange(min(5, len(self)))]
+        return "CompactDictionary(%i unique tokens: %s%s)" % (len(self), some_tokens, '...' if len(self) > 5 else '')
+
+    def iter_tokens(self):
+        """Iterate over all tokens, in order of their ids."""
+        blob = self.token_bytes.tobytes()
+        offsets = self.token_offsets.tolist()
+        for start, end in izip(offsets[:-1], offsets[1:]):
+            yield blob[start:end].decode('utf8')
+
+    def add_documents(self, documents, chunksize=10000):
+        """
+        Update the dictionary from a collection of documents (lists of **tokenized and
+        normalized** strings, either utf8 or unicode), counted `chunksize` documents at
+        a time.
+
+        While counting, at most `prune_at` tokens (plus the new tokens of one chunk) are
+        kept: whenever there are more, the tokens with the lowest document frequencies
+        are evicted. A token that comes back after an eviction restarts from an upper
+        bound of its lost count: `df_error`, the largest count evicted so far, or its
+        count-min sketch estimate, if lower. So the document frequency of every token is
+        overestimated by at most `df_error`, and every token with a document frequency
+        above `df_error` is kept. With no eviction, the counts are exact.
+
+        **Note**: the token ids are reassigned afterwards, in order of decreasing
+        document frequency, so the same word may have a different id before and after
+        the call to this function!
+        """
+        candidates = dict(izip(self.iter_tokens(), self.docfreqs.tolist()))
+        if self.prune_at is not None and self.sketch is None and self.num_docs == 0:
+            self.sketch = CountMinSketch(self.sketch_width, self.sketch_depth)
+
+        for chunk in utils.grouper(documents, chunksize):
+            logger.info("adding document #%i to %s (%i candidate tokens)", self.num_docs, self, len(candidates))
+            chunk_dfs = Counter()
+            for document in chunk:
+                counter = _count_tokens(document)
+                chunk_dfs.update(iterkeys(counter))
+                self.num_pos += sum(itervalues(counter))
+                self.num_nnz += len(counter)
+            self.num_docs += len(chunk)
+            self._add_counts(candidates, chunk_dfs)
+
+        self._set_tokens(candidates)
+        logger.info(
+            "built %s from %i documents (total %i corpus positions, document frequencies exact up to %i)",
+            self, self.num_docs, self.num_pos, self.df_error)
+
+    def _add_counts(self, candidates, dfs):
+        """Add the `token -> document frequency` mapping `dfs` to the `candidates` being counted."""
+        tokens = list(dfs)
+        counts = np.fromiter(itervalues(dfs), dtype=np.int64, count=len(tokens))
+        positions = self.sketch.positions(tokens) if self.sketch is not None else None
+        if self.df_error:
+            # tokens not among the candidates may have been evicted before
+            new = np.flatnonzero(np.fromiter(
+                (token not in candidates for token in tokens), dtype=bool, count=len(tokens)))
+            priors = np.full(len(new), self.df_error, dtype=np.int64)
+            if positions is not None:
+                priors = np.minimum(priors, self.sketch.estimate(positions[:, new]))
+            candidates.update(izip([tokens[i] for i in new], priors.tolist()))
+        for token, count in izip(tokens, counts.tolist()):
+            candidates[token] = candidates.get(token, 0) + count
+        if positions is not None:
+            self.sketch.add(positions, counts)
+
+        if self.prune_at is not None and len(candidates) > self.prune_at:
+            tokens = list(candidates)
+            counts = np.fromiter(itervalues(candidates), dtype=np.int64, count=len(tokens))
+            evicted = argsort(counts, len(tokens) - self.prune_at)
+            self.df_error = max(self.df_error, int(counts[evicted].max()))
+            for i in evicted.tolist():
+                del candidates[tokens[i]]
+
+    def _set_tokens(self, candidates):
+        """Rebuild all mappings from a `token -> document frequency` dict, in frequency order."""
+        items = sorted(iteritems(candidates), key=lambda item: (-item[1], item[0]))
+        self.token2id = dict((token, tokenid) for tokenid, (token, _) in enumerate(items))
+        self.docfreqs = np.fromiter((df for _, df in items), dtype=np.int64, count=len(items))
+        encoded = [utils.to_utf8(token) for token, _ in items]
+        self.token_offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum(np.fromiter((len(token) for token in encoded), dtype=np.int64, count=len(encoded)),
+                  out=self.token_offsets[1:])
+        self.token_bytes = np.frombuffer(b''.join(encoded), dtype=np.uint8).copy()
+
+    def doc2bow(self, document, allow_update=False, return_missing=False):
+        """
+        Convert `document` (a list of words) into the bag-of-words format, see
+        `Dictionary.doc2bow`. `allow_update` is not supported; use `add_documents`.
+        """
+        if allow_update:
+            raise NotImplementedError("CompactDictionary can only be updated with add_documents")
+        return super(CompactDictionary, self).doc2bow(document, return_missing=return_missing)
+
+    def doc2bow_many(self, documents, allow_update=False, as_csr=False):
+        """
+        Convert a chunk of documents into the bag-of-words format, see
+        `Dictionary.doc2bow_many`. `allow_update` is not supported; use `add_documents`.
+        """
+        if allow_update:
+            raise NotImplementedError("CompactDictionary can only be updated with add_documents")
+        return super(CompactDictionary, self).doc2bow_many(documents, as_csr=as_csr)
+
+    def filter_extremes(self, no_below=5, no_above=0.5, keep_n=100000, keep_tokens=None):
+        """
+        Filter out tokens by document frequency, see `Dictionary.filter_extremes`.
+
+        The tokens are in order of decreasing document frequency already, so `keep_n`
+        keeps a prefix of the remaining ids.
+        """
+        no_above_abs = int(no_above * self.num_docs)  # convert fractional threshold to absolute threshold
+
+        good = (self.docfreqs >= no_below) & (self.docfreqs <= no_above_abs)
+        if keep_tokens:
+            good[[self.token2id[token] for token in keep_tokens if token in self.token2id]] = True
+        good_ids = np.flatnonzero(good)
+        if keep_n is not None:
+            good_ids = good_ids[:keep_n]
+        logger.info(
+            "keeping %i tokens which were in no less than %i and no more than %i (=%.1f%%) documents",
+            len(good_ids), no_below, no_above_abs, 100.0 * no_above)
+
+        self.filter_tokens(good_ids=good_ids)
+        logger.info("resulting dictionary: %s", self)
+
+    def filter_tokens(self, bad_ids=None, good_ids=None):
+        """
+        Remove the selected `bad_ids` tokens, or keep the selected `good_ids` tokens and
+        remove the rest, then reassign the ids (see `Dictionary.filter_tokens`).
+        """
+        keep = np.ones(len(self.docfreqs), dtype=bool)
+        if bad_ids is not None:
+            keep[np.asarray(list(bad_ids), dtype=np.int64)] = False
+        if good_ids is not None:
+            good = np.zeros(len(self.docfreqs), dtype=bool)
+            good[np.asarray(list(good_ids), dtype=np.int64)] = True
+            keep &= good
+        tokens, docfreqs = list(self.iter_tokens()), self.docfreqs.tolist()
+        self._set_tokens(dict((tokens[tokenid], docfreqs[tokenid]) for tokenid in np.flatnonzero(keep).tolist()))
+
+    def compactify(self):
+        """Do nothing: the ids of a `CompactDictionary` never have gaps."""
+        pass
+
+    def merge_counts(self, other):
+        """
+        Add the tokens and counts of `other`, a `Dictionary` or `CompactDictionary` built
+        from another collection of documents, to this dictionary, keeping at most
+        `prune_at` tokens. The ids are reassigned, in order of decreasing document frequency.
+        """
+        candidates = dict(izip(self.iter_tokens(), self.docfreqs.tolist()))
+        # the sketch doesn't cover the documents of `other`
+        self.sketch = None
+        self._add_counts(candidates, dict(
+            (token, other.dfs.get(tokenid, 0)) for token, tokenid in iteritems(other.token2id)))
+        self.df_error += getattr(other, 'df_error', 0)
+        self.num_docs += other.num_docs
+        self.num_pos += other.num_pos
+        self.num_nnz += other.num_nnz
+        self._set_tokens(candidates)
+
+    def merge_with(self, other):
+        raise NotImplementedError("use merge_counts to merge into a CompactDictionary")
+
+    def save(self, fname_or_handle, separately=None, sep_limit=10 * 1024**2,
+             ignore=frozenset(), pickle_protocol=2):
+        """
+        Save the dictionary to file, see `SaveLoad.save`. `token2id` and the counting
+        sketch are not stored; `token2id` is rebuilt from the string table on `load`.
+        """
+        super(CompactDictionary, self).save(
+            fname_or_handle, separately=separately, sep_limit=sep_limit,
+            ignore=frozenset(ignore) | frozenset(['token2id', 'sketch']), pickle_protocol=pickle_protocol)
+
+    @classmethod
+    def load(cls, fname, mmap=None):
+        result = super(CompactDictionary, cls).load(fname, mmap=mmap)
+        if result.token2id is None:
+            result.token2id = dict((token, tokenid) for tokenid, token in enumerate(result.iter_tokens()))
+        return result
+#endclass CompactDictionary
@@ -0,0 +1,266 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Licensed under the GNU LGPL v2.1 - http://www.gnu.org/licenses/lgpl.html
+
+
+"""
+Corpus in a binary CSR (compressed sparse row) format, stored as numpy arrays.
+
+Unlike the text formats (`MmCorpus`, `SvmLightCorpus`...), nothing is parsed when reading
+the corpus: the arrays are memory-mapped, so that iterating over the corpus, `corpus[docno]`
+and `corpus[start:stop]` only slice them::
+
+>>> CsrCorpus.serialize('corpus.csr', corpus)
+>>> csr = CsrCorpus('corpus.csr')
+>>> print(csr[42])  # O(1) random access
+>>> sub = csr[1000:2000]  # O(1) sub-corpus, no copying
+>>> matutils.corpus2csc(csr)  # scipy.sparse matrix over the stored arrays
+
+"""
+
+
+import logging
+import os
+
+import numpy
+import scipy.sparse
+import six
+from six.moves import xrange, zip as izip
+
+from gensim import utils
+from gensim.corpora import IndexedCorpus
+
+
+logger = logging.getLogger('gensim.corpora.csrcorpus')
+
+# how many documents to convert from the arrays at once when iterating over the corpus
+CHUNKSIZE = 1024
+
+
+class CsrCorpus(IndexedCorpus):
+    """
+    Corpus in binary CSR format.
+
+    A corpus saved to `fname` is stored in four files:
+
+    * `fname`: the number of features, pickled,
+    * `fname.indptr.npy`: the documents of the corpus, as positions into the two arrays below;
+      document #i is `indptr[i]:indptr[i + 1]`,
+    * `fname.indices.npy`: the feature ids of all documents, as int32,
+    * `fname.data.npy`: their weights, float32 by default.
+
+    This is the layout of a `scipy.sparse.csr_matrix` of documents x features: the corpus is
+    converted to the equivalent `scipy.sparse.csc_matrix` of features x documents by
+    `matutils.corpus2csc` without copying the arrays.
+
+    """
+
+    def __init__(self, fname, mmap='r'):
+        """
+        Load the corpus saved to `fname` by `serialize()`. The arrays are memory-mapped with
+        mode `mmap` (see `numpy.load`); use `mmap=None` to load them into RAM instead.
+
+        """
+        logger.info("loading corpus from %s" % fname)
+        self.fname = fname
+        self.length = None
+        self.num_terms = utils.unpickle(fname)['num_terms']
+        indptr = numpy.load(fname + '.indptr.npy', mmap_mode=mmap)
+        self.indices = numpy.load(fname + '.indices.npy', mmap_mode=mmap)
+        self.data = numpy.load(fname + '.data.npy', mmap_mode=mmap)
+        # document #i is `starts[i]:ends[i]` in `indices` and `data`; slicing the corpus only slices these two
+        self.starts, self.ends = indptr[:-1], indptr[1:]
+        # the position of each document in `indices`/`data` plays the role of the byte offsets of text corpora
+        self.index = self.starts
+
+    @property
+    def num_docs(self):
+        return len(self.starts)
+
+    @property
+    def num_nnz(self):
+        return int((self.ends - self.starts).sum())
+
+    def __len__(self):
+        return len(self.starts)
+
+    def __str__(self):
+        return "%s<%i documents, %i features>" % (self.__class__.__name__, len(self), self.num_terms)
+
+    def __iter__(self):
+        """
+        Iterate over the corpus, returning one sparse vector at a time.
+        """
+        for chunk_start in xrange(0, len(self), CHUNKSIZE):
+            starts = self.starts[chunk_start: chunk_start + CHUNKSIZE]
+            ends = self.ends[chunk_start: chunk_start + CHUNKSIZE]
+            lo, hi = starts.min(), ends.max()
+            if hi - lo > 2 * (ends - starts).sum():
+                # scattered documents (fancy-indexed corpus): don't convert everything in between
+                for start, end in izip(starts, ends):
+                    yield self.docbyoffset(start, end)
+                continue
+            termids, weights = self.indices[lo: hi].tolist(), self.data[lo: hi].tolist()
+            for start, end in izip((starts - lo).tolist(), (ends - lo).tolist()):
+                yield list(izip(termids[start: end], weights[start: end]))
+
+    def docbyoffset(self, offset, end=None):
+        """
+        Return the document stored at position `offset` in the arrays, up to `end` (by default,
+        up to the next stored document).
+        """
+        if end is None:
+            end = self.ends[numpy.searchsorted(self.starts, offset, side='right') - 1]
+        return list(izip(self.indices[offset: end].tolist(), self.data[offset: end].tolist()))
+
+    def __getitem__(self, docno):
+        """
+        Return document #`docno`, or a sub-corpus if `docno` is a slice, list or numpy array
+        of document numbers. Sub-corpora share the (memory-mapped) arrays of this corpus.
+        """
+        if isinstance(docno, (slice, list, numpy.ndarray)):
+            corpus = object.__new__(self.__class__)
+            corpus.__dict__.update(self.__dict__)
+            corpus.starts, corpus.ends = self.starts[docno], self.ends[docno]
+            corpus.index = corpus.starts
+            return corpus
+        elif isinstance(docno, six.integer_types + (numpy.integer,)):
+            return self.docbyoffset(self.starts[docno], self.ends[docno])
+        else:
+            raise ValueError('Unrecognised value for docno, use either a single integer, a slice or a numpy.ndarray')
+
+    def to_csc(self, num_terms=None, dtype=None):
+        """
+        Return the corpus as a `scipy.sparse.csc_matrix` of features x documents, like
+        `matutils.corpus2csc`. If the documents are stored contiguously (the whole corpus or
+        a slice of it), the matrix is built over the stored arrays without copying them.
+        """
+        lengths = self.ends - self.starts
+        indptr = numpy.zeros(len(lengths) + 1, dtype=numpy.int64)
+        numpy.cumsum(lengths, out=indptr[1:])
+        if not len(self) or (self.starts[1:] == self.ends[:-1]).all():
+            start = self.starts[0] if len(self) else 0
+            indices, data = self.indices[start: start + indptr[-1]], self.data[start: start + indptr[-1]]
+        else:
+            positions = numpy.arange(indptr[-1]) + numpy.repeat(self.starts - indptr[:-1], lengths)
+            indices, data = self.indices[positions], self.data[positions]
+        if dtype is not None:
+            data = data.astype(dtype, copy=False)
+        num_terms = self.num_terms if num_terms is None else num_terms
+        return scipy.sparse.csc_matrix((data, indices, indptr), shape=(num_terms, len(self)))
+
+    def iter_chunks(self, chunksize, num_terms=None, dtype=numpy.float64):
+        """
+        Iterate over the corpus in chunks of `chunksize` documents, as `scipy.sparse.csc_matrix`
+        of features x documents (see `interfaces.CorpusABC.iter_chunks`), built by `to_csc()`.
+        """
+        for chunk_start in xrange(0, len(self), chunksize):
+            yield self[chunk_start: chunk_start + chunksize].to_csc(num_terms=num_terms, dtype=dtype)
+
+    @staticmethod
+    def save_corpus(fname, corpus, id2word=None, progress_cnt=10000, metadata=False, dtype=numpy.float32):
+        """
+        Save a corpus in the CSR format to disk, with feature weights as `dtype`.
+
+        The corpus is written out in chunks, so it may be larger than the available RAM.
+
+        This function is automatically called by `CsrCorpus.serialize`; don't
+        call it directly, call `serialize` instead.
+        """
+        logger.info("storing corpus in CSR format to %s" % fname)
+        files = dict((name, '%s.%s.npy' % (fname, name)) for name in ['indptr', 'indices', 'data'])
+        dtypes = {'indptr': numpy.int64, 'indices': numpy.int32, 'data': dtype}
+        counts = dict((name, 0) for name in files)
+        max_termid = -1
+
+        if hasattr(corpus, 'metadata'):
+            orig_metadata = corpus.metadata
+            corpus.metadata = metadata
+            if metadata:
+                docno2metadata = {}
+        else:
+            metadata = False
+
+        # write the arrays as raw binary files first, as their lengths are not known upfront
+        raw = dict((name, open(path + '.tmp', 'wb')) for name, path in files.items())
+        try:
+            lengths, termids, weights = [], [], []
+            for docno, doc in enumerate(corpus):
+                if metadata:
+                    doc, data = doc
+                    docno2metadata[docno] = data
+                if docno % progress_cnt == 0:
+                    logger.info("PROGRESS: saving document #%i" % docno)
+                length = len(termids)
+                for termid, weight in doc:
+                    termids.append(termid)
+                    weights.append(weight)
+                lengths.append(len(termids) - length)
+                if len(termids) >= 1024 * 1024 or len(lengths) >= 1024 * 1024:
+                    max_termid = CsrCorpus._write_chunk(raw, counts, dtypes, lengths, termids, weights, max_termid)
+                    lengths, termids, weights = [], [], []
+            max_termid = CsrCorpus._write_chunk(raw, counts, dtypes, lengths, termids, weights, max_termid)
+        finally:
+            for fout in raw.values():
+                fout.close()
+
+        # convert the raw files to .npy files, which can be memory-mapped
+        for name, path in files.items():
+            if counts[name]:
+                values = numpy.memmap(path + '.tmp', dtype=dtypes[name], mode='r', shape=(counts[name],))
+            else:
+                values = numpy.zeros(0, dtype=dtypes[name])
+            if name == 'indptr':
+                values = numpy.concatenate([[0], numpy.cumsum(values)]).astype(numpy.int64)
+            numpy.save(path, values)
+            del values
+            os.remove(path + '.tmp')
+        num_terms = max_termid + 1 if id2word is None else len(id2word)
+        utils.pickle({'num_terms': num_terms}, fname)
+        logger.info("saved %ix%i matrix, density=%.3f%% (%i/%i)" % (
+            counts['indptr'], num_terms, 100.0 * counts['indices'] / max(1, counts['indptr'] * num_terms),
+            counts['indices'], counts['indptr'] * num_terms))
+
+        if metadata:
+            utils.pickle(docno2metadata, fname + '.metadata.cpickle')
+            corpus.metadata = orig_metadata
+
+    @staticmethod
+    def _write_chunk(raw, counts, dtypes, lengths, termids, weights, max_termid):
+        """
+        Append the document `lengths` and their `termids` and `weights` to the `raw` files.
+        Return the largest term id seen so far.
+        """
+        termids = numpy.asarray(termids, dtype=numpy.int64)
+        if len(termids):
+            max_termid = max(max_termid, int(termids.max()))
+            if max_termid > numpy.iinfo(numpy.int32).max:
+                raise ValueError("feature ids must fit in 32 bits, found %i" % max_termid)
+        for name, values in [('indptr', lengths), ('indices', termids), ('data', weights)]:
+            values = numpy.asarray(values, dtype=dtypes[name])
+            values.tofile(raw[name])
+            counts[name] += len(values)
+        return max_termid
+
+    @classmethod
+    def serialize(serializer, fname, corpus, id2word=None, index_fname=None, progress_cnt=None, labels=None,
+                  metadata=False, **kwargs):
+        """
+        Iterate through the document stream `corpus`, saving the documents to `fname`
+        in the CSR format. Extra keyword arguments (such as `dtype`) are passed on to `save_corpus`.
+
+        The stored arrays double as the document index, so no separate index file is written
+        and `index_fname` is ignored, as is `labels`.
+
+        >>> CsrCorpus.serialize('test.csr', corpus)
+        >>> csr = CsrCorpus('test.csr')  # `csr` document stream now has random access
+        >>> print(csr[42])  # retrieve document no. 42, etc.
+        """
+        if getattr(corpus, 'fname', None) == fname:
+            raise ValueError("identical input vs. output corpus filename, refusing to serialize: %s" % fname)
+        if progress_cnt is not None:
+            kwargs['progress_cnt'] = progress_cnt
+        serializer.save_corpus(fname, corpus, id2word, metadata=metadata, **kwargs)
+
+# endclass CsrCorpus
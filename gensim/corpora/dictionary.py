@@ -17,11 +17,15 @@ with other dictionary (:func:`Dictionary.merge_with`) etc.
 
 from __future__ import with_statement
 
-from collections import Mapping, defaultdict
+import collections
+from collections import Counter, Mapping, defaultdict
 import sys
 import logging
 import itertools
 
+import numpy
+import scipy.sparse
+
 from gensim import utils
 
 if sys.version_info[0] >= 3:
@@ -29,7 +33,7 @@ if sys.version_info[0] >= 3:
 
 from six import PY3, iteritems, iterkeys, itervalues, string_types
 from six.moves import xrange
-from six.moves import zip as izip
+from six.moves import map as imap, zip as izip
 
 
 logger = logging.getLogger('gensim.corpora.dictionary')
@@ -42,7 +46,7 @@ class Dictionary(utils.SaveLoad, Mapping):
     The main function is `doc2bow`, which converts a collection of words to its
     bag-of-words representation: a list of (word_id, word_frequency) 2-tuples.
     """
-    def __init__(self, documents=None, prune_at=2000000):
+    def __init__(self, documents=None, prune_at=2000000, workers=1):
         """
         If `documents` are given, use them to initialize Dictionary (see `add_documents()`).
         """
@@ -55,7 +59,7 @@ class Dictionary(utils.SaveLoad, Mapping):
         self.num_nnz = 0  # total number of non-zeroes in the BOW matrix
 
         if documents is not None:
-            self.add_documents(documents, prune_at=prune_at)
+            self.add_documents(documents, prune_at=prune_at, workers=workers)
 
     def __getitem__(self, tokenid):
         if len(self.id2token) != len(self.token2id):
@@ -95,7 +99,7 @@ class Dictionary(utils.SaveLoad, Mapping):
     def from_documents(documents):
         return Dictionary(documents=documents)
 
-    def add_documents(self, documents, prune_at=2000000):
+    def add_documents(self, documents, prune_at=2000000, workers=1, chunksize=10000):
         """
         Update dictionary from a collection of documents. Each document is a list
         of tokens = **tokenized and normalized** strings (either utf8 or unicode).
@@ -105,23 +109,58 @@ class Dictionary(utils.SaveLoad, Mapping):
         total number of unique words <= `prune_at`. This is to save memory on very
         large inputs. To disable this pruning, set `prune_at=None`.
 
+        With `workers` > 1, the documents are counted by a pool of `workers` processes,
+        in chunks of `chunksize` documents. The partial dictionary of each chunk is
+        merged into this one with `merge_counts`, in document order, and pruning is
+        checked before each merge. With the default `chunksize`, the result (token
+        ids included) is the same as with a single process.
+
         >>> print(Dictionary(["máma mele maso".split(), "ema má máma".split()]))
         Dictionary(5 unique tokens)
         """
-        for docno, document in enumerate(documents):
-            # log progress & run a regular check for pruning, once every 10k docs
-            if docno % 10000 == 0:
+        if workers > 1:
+            for docno, partial in _count_chunks(documents, workers, chunksize):
                 if prune_at is not None and len(self) > prune_at:
                     self.filter_extremes(no_below=0, no_above=1.0, keep_n=prune_at)
                 logger.info("adding document #%i to %s", docno, self)
+                self.merge_counts(partial)
+        else:
+            for docno, document in enumerate(documents):
+                # log progress & run a regular check for pruning, once every 10k docs
+                if docno % 10000 == 0:
+                    if prune_at is not None and len(self) > prune_at:
+                        self.filter_extremes(no_below=0, no_above=1.0, keep_n=prune_at)
+                    logger.info("adding document #%i to %s", docno, self)
 
-            # update Dictionary with the document
-            self.doc2bow(document, allow_update=True)  # ignore the result, here we only care about updating token ids
+                # update Dictionary with the document
+                self.doc2bow(document, allow_update=True)  # ignore the result, here we only care about updating token ids
 
         logger.info(
             "built %s from %i documents (total %i corpus positions)",
             self, self.num_docs, self.num_pos)
 
+    def merge_counts(self, other):
+        """
+        Add the tokens and counts of `other`, a Dictionary built from another
+        collection of documents, to this dictionary, as if those documents had
+        been added with `add_documents` (without pruning).
+
+        Tokens that are new to this dictionary get new ids in the order of their
+        ids in `other`, so that merging the same dictionaries in the same order
+        always gives the same ids. Unlike `merge_with`, no transformation of the
+        old ids is returned.
+        """
+        token2id, dfs = self.token2id, self.dfs
+        for token, other_id in sorted(iteritems(other.token2id), key=lambda item: item[1]):
+            tokenid = token2id.get(token)
+            if tokenid is None:
+                # new id = number of ids made so far, like in `doc2bow`
+                tokenid = token2id[token] = len(token2id)
+            dfs[tokenid] = dfs.get(tokenid, 0) + other.dfs.get(other_id, 0)
+        self.num_docs += other.num_docs
+        self.num_pos += other.num_pos
+        self.num_nnz += other.num_nnz
+
     def doc2bow(self, document, allow_update=False, return_missing=False):
         """
         Convert `document` (a list of words) into the bag-of-words format = list
@@ -137,13 +176,7 @@ class Dictionary(utils.SaveLoad, Mapping):
 
         If `allow_update` is **not** set, this function is `const`, aka read-only.
         """
-        if isinstance(document, string_types):
-            raise TypeError("doc2bow expects an array of unicode tokens on input, not a single string")
-
-        # Construct (word, frequency) mapping.
-        counter = defaultdict(int)
-        for w in document:
-            counter[w if isinstance(w, unicode) else unicode(w, 'utf-8')] += 1
+        counter = _count_tokens(document)
 
         token2id = self.token2id
         if allow_update or return_missing:
@@ -154,24 +187,89 @@ class Dictionary(utils.SaveLoad, Mapping):
                     # NOTE this assumes there are no gaps in the id sequence!
                     token2id[w] = len(token2id)
 
-        result = dict((token2id[w], freq) for w, freq in iteritems(counter) if w in token2id)
-
         if allow_update:
+            # all tokens have an id now
+            result = [(token2id[w], freq) for w, freq in iteritems(counter)]
             self.num_docs += 1
             self.num_pos += sum(itervalues(counter))
             self.num_nnz += len(result)
             # increase document count for each unique token that appeared in the document
             dfs = self.dfs
-            for tokenid in iterkeys(result):
+            for tokenid, _ in result:
                 dfs[tokenid] = dfs.get(tokenid, 0) + 1
+        else:
+            result = [(token2id[w], freq) for w, freq in iteritems(counter) if w in token2id]
 
         # return tokenids, in ascending id order
-        result = sorted(iteritems(result))
+        result.sort()
         if return_missing:
             return result, missing
         else:
             return result
 
+    def doc2bow_many(self, documents, allow_update=False, as_csr=False):
+        """
+        Convert a chunk of `documents` (lists of words) into the bag-of-words format
+        at once, like calling `doc2bow` on each document.
+
+        Return a list with the `(token_id, token_count)` 2-tuples of each document,
+        in ascending id order. If `as_csr` is set, return a scipy.sparse.csr_matrix
+        of token counts instead, with one row per document; `result.indptr`,
+        `result.indices` and `result.data` are the CSR arrays of the chunk.
+
+        If `allow_update` is set, also update the dictionary in the process, as in
+        `doc2bow`.
+
+        The whole chunk is counted in one pass: the ids of its unique tokens are looked
+        up once, and the (document, token id) pairs are counted with numpy. Chunks of
+        thousands of documents are faster than calling `doc2bow` on each of them,
+        especially with `as_csr`.
+        """
+        documents = list(documents)
+        if any(isinstance(document, string_types) for document in documents):
+            raise TypeError("doc2bow expects an array of unicode tokens on input, not a single string")
+        documents = [document if isinstance(document, list) else list(document) for document in documents]
+        lengths = numpy.fromiter((len(document) for document in documents), dtype=numpy.int64, count=len(documents))
+        tokens = list(itertools.chain.from_iterable(documents))
+
+        # look up the ids of the chunk's unique tokens only; when updating, in order of first
+        # appearance, which is the order `doc2bow` would add them to the dictionary in
+        token2id = self.token2id
+        lookup = {}
+        for w in (collections.OrderedDict.fromkeys(tokens) if allow_update else set(tokens)):
+            word = w if isinstance(w, unicode) else unicode(w, 'utf-8')
+            tokenid = token2id.get(word)
+            if tokenid is None and allow_update:
+                # new id = number of ids made so far (see `doc2bow`)
+                tokenid = token2id[word] = len(token2id)
+            lookup[w] = -1 if tokenid is None else tokenid
+
+        # count the (document, token id) pairs of the whole chunk at once; sorting their keys
+        # also sorts the token ids within each document
+        tokenids = numpy.fromiter(imap(lookup.__getitem__, tokens), dtype=numpy.int64, count=len(tokens))
+        docnos = numpy.repeat(numpy.arange(len(documents), dtype=numpy.int64), lengths)
+        known = tokenids >= 0
+        num_ids = max(len(token2id), 1)
+        keys, counts = numpy.unique(docnos[known] * num_ids + tokenids[known], return_counts=True)
+        docnos, tokenids = keys // num_ids, keys % num_ids
+        indptr = numpy.zeros(len(documents) + 1, dtype=numpy.int64)
+        numpy.cumsum(numpy.bincount(docnos, minlength=len(documents)), out=indptr[1:])
+
+        if allow_update:
+            self.num_docs += len(documents)
+            self.num_pos += int(counts.sum())
+            self.num_nnz += len(keys)
+            dfs = self.dfs
+            for tokenid, df in izip(*(arr.tolist() for arr in numpy.unique(tokenids, return_counts=True))):
+                dfs[tokenid] = dfs.get(tokenid, 0) + df
+
+        if as_csr:
+            return scipy.sparse.csr_matrix(
+                (counts, tokenids.astype(numpy.int32), indptr), shape=(len(documents), len(token2id)))
+        pairs = list(izip(tokenids.tolist(), counts.tolist()))
+        indptr = indptr.tolist()
+        return [pairs[indptr[docno]:indptr[docno + 1]] for docno in xrange(len(documents))]
+
     def filter_extremes(self, no_below=5, no_above=0.5, keep_n=100000, keep_tokens=None):
         """
         Filter out tokens that appear in
@@ -408,3 +506,59 @@ class Dictionary(utils.SaveLoad, Mapping):
             "built %s from %i documents (total %i corpus positions)",
             result, result.num_docs, result.num_pos)
         return result
+
+
+def _count_tokens(document):
+    """
+    Return a token -> count mapping of `document` (a list of words), with utf8
+    tokens decoded to unicode, in order of first appearance.
+    """
+    if isinstance(document, string_types):
+        raise TypeError("doc2bow expects an array of unicode tokens on input, not a single string")
+
+    counter = Counter(document)
+    # check the types of the unique tokens only, not of every token of the document
+    if not all(isinstance(w, unicode) for w in counter):
+        decoded = defaultdict(int)
+        for w, freq in iteritems(counter):
+            decoded[w if isinstance(w, unicode) else unicode(w, 'utf-8')] += freq
+        counter = decoded
+    return counter
+
+
+def _count_documents(documents):
+    """
+    Return a Dictionary built from `documents`, without pruning. Run in the worker
+    processes of `Dictionary.add_documents`.
+    """
+    partial = Dictionary()
+    partial.doc2bow_many(documents, allow_update=True)
+    return partial
+
+
+def _count_chunks(documents, workers, chunksize):
+    """
+    Split `documents` into chunks of `chunksize` documents, count each chunk with
+    `_count_documents` in a pool of `workers` processes and yield (number of the
+    first document of the chunk, partial Dictionary of the chunk) 2-tuples, in
+    document order.
+
+    At most 2 * `workers` chunks are in flight at any time, so that a fast stream of
+    documents doesn't pile up in memory.
+    """
+    import multiprocessing
+
+    pool = multiprocessing.Pool(workers)
+    try:
+        pending, docno = collections.deque(), 0
+        for chunk in utils.grouper(documents, chunksize):
+            pending.append((docno, pool.apply_async(_count_documents, (chunk,))))
+            docno += len(chunk)
+            if len(pending) >= 2 * workers:
+                chunk_docno, result = pending.popleft()
+                yield chunk_docno, result.get()
+        while pending:
+            chunk_docno, result = pending.popleft()
+            yield chunk_docno, result.get()
+    finally:
+        pool.terminate()
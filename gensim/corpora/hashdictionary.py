@@ -19,20 +19,84 @@ advantage: HashDictionary can be used with non-repeatable (once-only) streams of
 A disadvantage of HashDictionary is that, unlike plain :class:`Dictionary`, several words may map
 to the same id, causing hash collisions. The word<->id mapping is no longer a bijection.
 
+For high-throughput feature hashing of unbounded corpora, use `myhash=murmurhash3` (hashed
+by a compiled extension, if available) and `debug=False` (no per-word statistics are kept),
+and convert documents in batches with `doc2bow_many`. With `signed=True`, each word also
+gets a pseudo-random sign, so that colliding words tend to cancel out rather than add up.
+
 """
 
 from __future__ import with_statement
 
 import logging
-import itertools
+import struct
 import zlib
+from collections import Counter
+
+import numpy as np
+import scipy.sparse
 
 from gensim import utils
-from six import iteritems, iterkeys
+from six import iteritems, iterkeys, itervalues
+from six.moves import zip as izip
+
+try:
+    from gensim.corpora.hashdictionary_inner import murmurhash3 as _murmurhash3, hash_tokens as _hash_tokens
+except ImportError:
+    # failed... fall back to the pure Python implementation below, which gives the same hashes
+    _murmurhash3 = _hash_tokens = None
 
 
 logger = logging.getLogger(__name__)
 
+SIGN_SEED = 0x5eed  # seed of the hash whose highest bit gives the sign of a word, with `signed=True`
+
+
+def _murmurhash3_py(data, seed=0):
+    """Pure Python version of `hashdictionary_inner.murmurhash3`."""
+    c1, c2, mask = 0xcc9e2d51, 0x1b873593, 0xffffffff
+    h = seed & mask
+    nblocks = len(data) // 4
+    for k in struct.unpack('<%iI' % nblocks, data[:4 * nblocks]):
+        k = (k * c1) & mask
+        k = (((k << 15) | (k >> 17)) * c2) & mask
+        h ^= k
+        h = ((((h << 13) | (h >> 19)) & mask) * 5 + 0xe6546b64) & mask
+    k = 0
+    for shift, byte in enumerate(bytearray(data[4 * nblocks:])):
+        k ^= byte << (8 * shift)
+    if len(data) % 4:
+        k = (k * c1) & mask
+        h ^= (((k << 15) | (k >> 17)) * c2) & mask
+    h ^= len(data)
+    h ^= h >> 16
+    h = (h * 0x85ebca6b) & mask
+    h ^= h >> 13
+    h = (h * 0xc2b2ae35) & mask
+    return h ^ (h >> 16)
+
+
+def murmurhash3(data, seed=0):
+    """
+    Return the 32bit MurmurHash3 (x86 variant) of `data`, a utf8 bytestring or unicode string,
+    as an unsigned int.
+
+    This is a fast, well distributed non-cryptographic hash, to be used as `myhash` in
+    `HashDictionary`.
+    """
+    data = utils.to_utf8(data)
+    if _murmurhash3 is not None:
+        return _murmurhash3(data, seed)
+    return _murmurhash3_py(data, seed)
+
+
+def hash_tokens(tokens, seed=0):
+    """Return `murmurhash3` of each of `tokens` (a list of strings), as a uint32 array."""
+    if _hash_tokens is not None:
+        return _hash_tokens(tokens, seed)
+    return np.fromiter((_murmurhash3_py(utils.to_utf8(token), seed) for token in tokens),
+                       dtype=np.uint32, count=len(tokens))
+
 
 class HashDictionary(utils.SaveLoad, dict):
     """
@@ -47,15 +111,23 @@ class HashDictionary(utils.SaveLoad, dict):
     bag-of-words representation: a list of (word_id, word_frequency) 2-tuples.
 
     """
-    def __init__(self, documents=None, id_range=32000, myhash=zlib.adler32, debug=True):
+    def __init__(self, documents=None, id_range=32000, myhash=zlib.adler32, debug=True, signed=False):
         """
         By default, keep track of debug statistics and mappings. If you find yourself
         running out of memory (or are sure you don't need the debug info), set
         `debug=False`.
+
+        `myhash=murmurhash3` is much faster than the default adler32 and spreads short
+        words more evenly over the ids.
+
+        If `signed` is set, the count of each word is multiplied by a +1/-1 sign derived
+        from another hash of the word, so that the expected value of colliding counts is
+        zero ("signed hashing"). Feature values may then be negative.
         """
         self.myhash = myhash  # hash fnc: string->integer
         self.id_range = id_range  # hash range: id = myhash(key) % id_range
         self.debug = debug
+        self.signed = signed
 
         # the following (potentially massive!) dictionaries are only formed if `debug` is True
         self.token2id = {}
@@ -90,6 +162,20 @@ class HashDictionary(utils.SaveLoad, dict):
             self.id2token.setdefault(h, set()).add(token)
         return h
 
+    def hash_tokens(self, tokens):
+        """
+        Return the ids of `tokens` (a list of unique words) as a list, and their signs
+        (a list of +1/-1) if `self.signed`, else None. Don't update any debug mappings.
+        """
+        if self.myhash is murmurhash3:
+            tokenids = (hash_tokens(tokens) % self.id_range).tolist()
+        else:
+            tokenids = [self.myhash(utils.to_utf8(token)) % self.id_range for token in tokens]
+        signs = None
+        if self.signed:
+            signs = np.where(hash_tokens(tokens, SIGN_SEED) >> 31, -1, 1).tolist()
+        return tokenids, signs
+
     def __len__(self):
         """
         Return the number of distinct ids = the entire dictionary size.
@@ -107,18 +193,19 @@ class HashDictionary(utils.SaveLoad, dict):
     def from_documents(*args, **kwargs):
         return HashDictionary(*args, **kwargs)
 
-    def add_documents(self, documents):
+    def add_documents(self, documents, chunksize=10000):
         """
         Build dictionary from a collection of documents. Each document is a list
         of tokens = **tokenized and normalized** utf-8 encoded strings.
 
-        This is only a convenience wrapper for calling `doc2bow` on each document
-        with `allow_update=True`.
+        This is only a convenience wrapper for calling `doc2bow_many` on each chunk
+        of `chunksize` documents with `allow_update=True`.
         """
-        for docno, document in enumerate(documents):
-            if docno % 10000 == 0:
-                logger.info("adding document #%i to %s" % (docno, self))
-            _ = self.doc2bow(document, allow_update=True)  # ignore the result, here we only care about updating token ids
+        docno = 0
+        for chunk in utils.chunkize_serial(documents, chunksize, as_numpy=False):
+            logger.info("adding document #%i to %s" % (docno, self))
+            self.doc2bow_many(chunk, allow_update=True)  # ignore the result, here we only care about updating token ids
+            docno += len(chunk)
         logger.info(
             "built %s from %i documents (total %i corpus positions)",
             self, self.num_docs, self.num_pos)
@@ -137,20 +224,32 @@ class HashDictionary(utils.SaveLoad, dict):
         (`self.dfs`) by one.
 
         """
+        counts = Counter(document)  # also works for iterators, `document` is consumed here
+        num_pos = sum(itervalues(counts))
+        tokens = list(counts)
+        tokenids, signs = self.hash_tokens(tokens)
+        if signs is None:
+            counts = [counts[token] for token in tokens]
+        else:
+            counts = [sign * counts[token] for token, sign in izip(tokens, signs)]
+
         result = {}
-        missing = {}
-        document = sorted(document)  # convert the input to plain list (needed below)
-        for word_norm, group in itertools.groupby(document):
-            frequency = len(list(group))  # how many times does this word appear in the input document
-            tokenid = self.restricted_hash(word_norm)
-            result[tokenid] = result.get(tokenid, 0) + frequency
-            if self.debug:
+        for tokenid, count in izip(tokenids, counts):
+            result[tokenid] = result.get(tokenid, 0) + count
+        if self.signed:
+            # colliding words of opposite signs may have cancelled out
+            result = dict((tokenid, count) for tokenid, count in iteritems(result) if count)
+
+        if self.debug:
+            for token, tokenid in izip(tokens, tokenids):
+                self.token2id[token] = tokenid
+                self.id2token.setdefault(tokenid, set()).add(token)
                 # increment document count for each unique token that appeared in the document
-                self.dfs_debug[word_norm] = self.dfs_debug.get(word_norm, 0) + 1
+                self.dfs_debug[token] = self.dfs_debug.get(token, 0) + 1
 
         if allow_update or self.allow_update:
             self.num_docs += 1
-            self.num_pos += len(document)
+            self.num_pos += num_pos
             self.num_nnz += len(result)
             if self.debug:
                 # increment document count for each unique tokenid that appeared in the document
@@ -161,10 +260,63 @@ class HashDictionary(utils.SaveLoad, dict):
         # return tokenids, in ascending id order
         result = sorted(iteritems(result))
         if return_missing:
-            return result, missing
+            return result, {}
         else:
             return result
 
+    def doc2bow_many(self, documents, allow_update=False, as_csr=False):
+        """
+        Convert a batch of `documents` (a list of lists of words) into bag-of-words, like
+        calling `doc2bow` on each, but hashing each distinct word of the batch only once.
+
+        Return a list of bag-of-words documents, or a `scipy.sparse.csr_matrix` of shape
+        `(len(documents), self.id_range)` if `as_csr` is set.
+
+        Debug statistics are updated as in `doc2bow`; switch `debug` off for speed.
+        """
+        if self.debug:
+            result = [self.doc2bow(document, allow_update=allow_update) for document in documents]
+            if not as_csr:
+                return result
+            indptr = np.cumsum([0] + [len(bow) for bow in result])
+            indices = [tokenid for bow in result for tokenid, _ in bow]
+            data = [count for bow in result for _, count in bow]
+        else:
+            doc_counts = [Counter(document) for document in documents]
+            words, counts = [], []
+            for document in doc_counts:
+                words.extend(document)
+                counts.extend(document.values())
+            tokens = list(dict.fromkeys(words))  # each distinct word of the batch is hashed once
+            tokenids, signs = self.hash_tokens(tokens)
+            tokenids = list(map(dict(izip(tokens, tokenids)).__getitem__, words))
+            counts = np.array(counts, dtype=np.int64)
+            num_pos = int(counts.sum())
+            if signs is not None:
+                counts *= np.array(list(map(dict(izip(tokens, signs)).__getitem__, words)), dtype=np.int64)
+            docnos = np.repeat(
+                np.arange(len(doc_counts)), np.array([len(document) for document in doc_counts], dtype=np.int64))
+            # the COO -> CSR conversion sums the counts of words colliding within a document
+            matrix = scipy.sparse.coo_matrix(
+                (counts, (docnos, np.array(tokenids, dtype=np.int64))),
+                shape=(len(doc_counts), self.id_range)).tocsr()
+            matrix.sum_duplicates()
+            if self.signed:
+                matrix.eliminate_zeros()
+            if allow_update or self.allow_update:
+                self.num_docs += len(doc_counts)
+                self.num_pos += num_pos
+                self.num_nnz += matrix.nnz
+            if as_csr:
+                return matrix
+            indptr, indices, data = matrix.indptr.tolist(), matrix.indices.tolist(), matrix.data.tolist()
+
+        if as_csr:
+            return scipy.sparse.csr_matrix(
+                (np.array(data, dtype=np.int64), np.array(indices, dtype=np.int64), indptr),
+                shape=(len(result), self.id_range))
+        return [list(izip(indices[start:end], data[start:end])) for start, end in izip(indptr, indptr[1:])]
+
     def filter_extremes(self, no_below=5, no_above=0.5, keep_n=100000):
         """
         Remove document frequency statistics for tokens that appear in
@@ -0,0 +1,69 @@
+#!/usr/bin/env cython
+# cython: boundscheck=False
+# cython: wraparound=False
+# coding: utf-8
+#
+# Licensed under the GNU LGPL v2.1 - http://www.gnu.org/licenses/lgpl.html
+
+"""
+Optimized token hashing (32bit MurmurHash3, x86 variant), used by `gensim.corpora.hashdictionary`.
+"""
+
+import numpy as np
+cimport numpy as np
+
+from libc.stdint cimport uint32_t
+
+
+cdef inline uint32_t rotl32(uint32_t x, int r) nogil:
+    return (x << r) | (x >> (32 - r))
+
+
+cdef uint32_t murmurhash3_32(const unsigned char *data, Py_ssize_t length, uint32_t seed) nogil:
+    cdef uint32_t c1 = 0xcc9e2d51U, c2 = 0x1b873593U
+    cdef uint32_t h = seed, k
+    cdef Py_ssize_t i, nblocks = length // 4
+    cdef const unsigned char *tail = data + 4 * nblocks
+
+    for i in range(nblocks):
+        k = (<uint32_t>data[4 * i] | (<uint32_t>data[4 * i + 1] << 8) |
+             (<uint32_t>data[4 * i + 2] << 16) | (<uint32_t>data[4 * i + 3] << 24))
+        k = rotl32(k * c1, 15) * c2
+        h = rotl32(h ^ k, 13) * 5 + 0xe6546b64U
+
+    k = 0
+    if length & 3 >= 3:
+        k ^= <uint32_t>tail[2] << 16
+    if length & 3 >= 2:
+        k ^= <uint32_t>tail[1] << 8
+    if length & 3 >= 1:
+        k ^= <uint32_t>tail[0]
+        h ^= rotl32(k * c1, 15) * c2
+
+    h ^= <uint32_t>length
+    h ^= h >> 16
+    h *= 0x85ebca6bU
+    h ^= h >> 13
+    h *= 0xc2b2ae35U
+    h ^= h >> 16
+    return h
+
+
+def murmurhash3(bytes data, uint32_t seed=0):
+    """Return the 32bit MurmurHash3 of the bytestring `data`, as an unsigned int."""
+    return murmurhash3_32(data, len(data), seed)
+
+
+def hash_tokens(tokens, uint32_t seed=0):
+    """
+    Return the 32bit MurmurHash3 of each of `tokens` (a list of unicode or utf8 bytestrings),
+    as a uint32 array.
+    """
+    cdef Py_ssize_t i, n = len(tokens)
+    cdef bytes token
+    result = np.empty(n, dtype=np.uint32)
+    cdef np.uint32_t[:] hashes = result
+    for i in range(n):
+        token = tokens[i] if isinstance(tokens[i], bytes) else tokens[i].encode('utf8')
+        hashes[i] = murmurhash3_32(token, len(token), seed)
+    return result
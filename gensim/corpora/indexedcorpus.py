@@ -56,7 +56,8 @@ class IndexedCorpus(interfaces.CorpusABC):
         self.length = None
 
     @classmethod
-    def serialize(serializer, fname, corpus, id2word=None, index_fname=None, progress_cnt=None, labels=None, metadata=False):
+    def serialize(serializer, fname, corpus, id2word=None, index_fname=None, progress_cnt=None, labels=None, metadata=False,
+                  workers=None):
         """
         Iterate through the document stream `corpus`, saving the documents to `fname`
         and recording byte offset of each document. Save the resulting index
@@ -71,6 +72,9 @@ class IndexedCorpus(interfaces.CorpusABC):
           positioned at `offset` bytes within the persistent storage (file).
         * metadata if set to true will ensure that serialize will write out article titles to a pickle file.
 
+        If `workers` is set, it is passed on to `save_corpus`, for formats that can
+        encode the documents in several processes in parallel (`MmCorpus`).
+
         Example:
 
         >>> MmCorpus.serialize('test.mm', corpus)
@@ -83,16 +87,14 @@ class IndexedCorpus(interfaces.CorpusABC):
         if index_fname is None:
             index_fname = utils.smart_extension(fname, '.index')
 
+        kwargs = {'metadata': metadata}
         if progress_cnt is not None:
-            if labels is not None:
-                offsets = serializer.save_corpus(fname, corpus, id2word, labels=labels, progress_cnt=progress_cnt, metadata=metadata)
-            else:
-                offsets = serializer.save_corpus(fname, corpus, id2word, progress_cnt=progress_cnt, metadata=metadata)
-        else:
-            if labels is not None:
-                offsets = serializer.save_corpus(fname, corpus, id2word, labels=labels, metadata=metadata)
-            else:
-                offsets = serializer.save_corpus(fname, corpus, id2word, metadata=metadata)
+            kwargs['progress_cnt'] = progress_cnt
+        if labels is not None:
+            kwargs['labels'] = labels
+        if workers is not None:
+            kwargs['workers'] = workers
+        offsets = serializer.save_corpus(fname, corpus, id2word, **kwargs)
 
         if offsets is None:
             raise NotImplementedError("called serialize on class %s which doesn't support indexing!" %
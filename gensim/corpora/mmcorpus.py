@@ -37,15 +37,19 @@ class MmCorpus(matutils.MmReader, IndexedCorpus):
             yield doc  # get rid of doc id, return the sparse vector only
 
     @staticmethod
-    def save_corpus(fname, corpus, id2word=None, progress_cnt=1000, metadata=False):
+    def save_corpus(fname, corpus, id2word=None, progress_cnt=1000, metadata=False, workers=1):
         """
         Save a corpus in the Matrix Market format to disk.
 
+        With `workers` > 1, the documents are formatted by `workers` processes in
+        parallel (see `MmWriter.write_corpus`).
+
         This function is automatically called by `MmCorpus.serialize`; don't
         call it directly, call `serialize` instead.
         """
         logger.info("storing corpus in Matrix Market format to %s" % fname)
         num_terms = len(id2word) if id2word is not None else None
-        return matutils.MmWriter.write_corpus(fname, corpus, num_terms=num_terms, index=True, progress_cnt=progress_cnt, metadata=metadata)
+        return matutils.MmWriter.write_corpus(fname, corpus, num_terms=num_terms, index=True, progress_cnt=progress_cnt,
+                                              metadata=metadata, workers=workers)
 
 # endclass MmCorpus
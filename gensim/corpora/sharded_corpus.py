@@ -779,6 +779,30 @@ class ShardedCorpus(IndexedCorpus):
         for i in xrange(len(self)):
             yield self[i]
 
+    def iter_chunks(self, chunksize, num_terms=None, dtype=numpy.float64):
+        """
+        Iterate over the dataset in chunks of `chunksize` documents, yielding
+        each chunk as a scipy.sparse.csc_matrix of `num_terms` (by default,
+        `self.dim`) x #documents in the chunk, retrieved from the shards as
+        sparse matrices (see `gensim.interfaces.CorpusABC.iter_chunks`).
+
+        """
+        for start in xrange(0, len(self), chunksize):
+            retrieval = self.gensim, self.sparse_retrieval
+            self.gensim, self.sparse_retrieval = False, True
+            try:
+                chunk = self[start:min(start + chunksize, len(self))]
+            finally:
+                self.gensim, self.sparse_retrieval = retrieval
+            # documents x features CSR => features x documents CSC, same arrays
+            chunk = chunk.T
+            if chunk.dtype != dtype:
+                chunk = chunk.astype(dtype)
+            if num_terms is not None and num_terms != chunk.shape[0]:
+                chunk = sparse.csc_matrix((chunk.data, chunk.indices, chunk.indptr),
+                                          shape=(num_terms, chunk.shape[1]))
+            yield chunk
+
     def save(self, *args, **kwargs):
         """
         Save itself (the wrapper) in clean state (after calling `reset()`)
@@ -15,12 +15,21 @@ tokenizer). The package is available at https://github.com/clips/pattern .
 
 See scripts/process_wiki.py for a canned (example) script based on this
 module.
+
+Wikimedia also publishes "multistream" dumps (\*pages-articles-multistream.xml.bz2), which
+are concatenations of independent bz2 streams of 100 pages each. These are decompressed and
+parsed in parallel, by `processes` worker processes, which is several times faster than the
+single stream dumps.
 """
 
 
 import bz2
+import collections
+import itertools
 import logging
+import os
 import re
+from io import BytesIO
 from xml.etree.cElementTree import iterparse  # LXML isn't faster, so let's go with the built-in solution
 import multiprocessing
 
@@ -54,6 +63,16 @@ RE_P14 = re.compile('\[\[Category:[^][]*\]\]', re.UNICODE)  # categories
 # Remove File and Image template
 RE_P15 = re.compile('\[\[([fF]ile:|[iI]mage)[^]]*(\]\])', re.UNICODE)
 
+# start of a bz2 stream: the stream header "BZh" + block size, directly followed by the first block's magic number
+RE_BZ2_STREAM = re.compile(b'BZh[1-9]1AY&SY')
+
+# decompress and parse multistream dumps in tasks of (at least) this many compressed bytes
+STREAM_CHUNK_BYTES = 1024 * 1024
+
+# a dump whose first bz2 stream doesn't end within this many compressed bytes is taken to be
+# a single stream dump; in multistream dumps, the first stream only holds the <siteinfo>
+MULTISTREAM_PROBE_BYTES = 1024 * 1024
+
 # MediaWiki namespaces (https://www.mediawiki.org/wiki/Manual:Namespace) that
 # ought to be ignored
 IGNORED_NAMESPACES = ['Wikipedia', 'Category', 'File', 'Portal', 'Template',
@@ -249,6 +268,140 @@ def process_article(args):
     return result, title, pageid
 
 
+def find_streams(fname, index_fname=None, bufsize=16 * 1024 * 1024):
+    """
+    Return the byte offsets of the bz2 streams in the dump `fname`, as a sorted list.
+
+    Multistream dumps come with an index file (\*multistream-index.txt.bz2) of
+    `offset:pageid:title` lines; if `index_fname` is given, read the offsets from it.
+    Otherwise, scan `fname` for bz2 stream headers. A single stream dump gives `[0]`,
+    without a scan.
+    """
+    if index_fname is not None:
+        offsets = set([0])
+        with utils.smart_open(index_fname) as fin:
+            for line in fin:
+                offsets.add(int(line.split(b':', 1)[0]))
+        return sorted(offsets)
+    if not is_multistream(fname):
+        return [0]
+
+    offsets, pos, tail = [], 0, b''
+    with open(fname, 'rb') as fin:
+        while True:
+            buf = fin.read(bufsize)
+            if not buf:
+                break
+            data = tail + buf
+            offsets.extend(pos - len(tail) + match.start() for match in RE_BZ2_STREAM.finditer(data))
+            tail = data[-9:]  # too short to contain a whole header, so nothing gets found twice
+            pos += len(buf)
+    return offsets or [0]
+
+
+def is_multistream(fname, probe_bytes=None):
+    """
+    Return True if the first bz2 stream of the dump `fname` is followed by more data,
+    within its first `probe_bytes` compressed bytes (default `MULTISTREAM_PROBE_BYTES`).
+    """
+    if probe_bytes is None:
+        probe_bytes = MULTISTREAM_PROBE_BYTES
+    decompressor = bz2.BZ2Decompressor()
+    with open(fname, 'rb') as fin:
+        while probe_bytes > 0:
+            buf = fin.read(min(probe_bytes, 64 * 1024))
+            if not buf:
+                return False
+            probe_bytes -= len(buf)
+            try:
+                decompressor.decompress(buf)
+            except EOFError:  # the first stream ended exactly at the end of the previous `buf`
+                return True
+            if decompressor.unused_data:
+                return True
+    return False
+
+
+def get_root_tag(fname):
+    """Return the opening <mediawiki> tag of the dump `fname`, as a utf8 bytestring."""
+    with bz2.BZ2File(fname) as fin:
+        head = fin.read(64 * 1024)
+    match = re.search(b'<mediawiki[^>]*>', head)
+    if match is None:
+        raise ValueError("%s is not a MediaWiki dump" % fname)
+    return match.group(0)
+
+
+def decompress_streams(data):
+    """Decompress `data`, a concatenation of complete bz2 streams."""
+    result = []
+    while data:
+        decompressor = bz2.BZ2Decompressor()
+        result.append(decompressor.decompress(data))
+        data = decompressor.unused_data
+    return b''.join(result)
+
+
+def process_streams(args):
+    """
+    Decompress the bz2 streams in bytes `start`..`end` of the dump `fname`, and parse
+    their pages with `process_article`. Return a list of (tokens, title, pageid) 3-tuples.
+    """
+    fname, start, end, root_tag, lemmatize, filter_namespaces = args
+    with open(fname, 'rb') as fin:
+        fin.seek(start)
+        xml = decompress_streams(fin.read(end - start))
+    # the streams hold a sequence of <page>s; the first one also holds the <siteinfo>
+    # header and the last one the closing </mediawiki>
+    first, last = xml.find(b'<page>'), xml.rfind(b'</page>')
+    if first < 0 or last < 0:
+        return []
+    xml = root_tag + xml[first: last + len(b'</page>')] + b'</mediawiki>'
+    return [
+        process_article((text, lemmatize, title, pageid))
+        for title, text, pageid in extract_pages(BytesIO(xml), filter_namespaces)
+    ]
+
+
+def _process_stream_chunks(fname, streams, root_tag, lemmatize, filter_namespaces, processes, ordered=True):
+    """
+    Group the bz2 `streams` of the dump `fname` into chunks of about `STREAM_CHUNK_BYTES`,
+    decompress and parse them with `process_streams` in a pool of `processes` processes,
+    and yield (byte offset of the chunk, list of its (tokens, title, pageid) 3-tuples) 2-tuples.
+
+    If `ordered` is set, yield the chunks in dump order; otherwise in the order they
+    are finished. At most 2 * `processes` chunks are in flight at any time.
+    """
+    size = os.path.getsize(fname)
+    boundaries = [streams[0]]
+    for offset in streams[1:]:
+        if offset - boundaries[-1] >= STREAM_CHUNK_BYTES:
+            boundaries.append(offset)
+    boundaries.append(size)
+
+    def next_result(pending):
+        if not ordered:
+            for i, (start, result) in enumerate(pending):
+                if result.ready():
+                    del pending[i]
+                    return start, result.get()
+        start, result = pending.popleft()
+        return start, result.get()
+
+    pool = multiprocessing.Pool(processes)
+    try:
+        pending = collections.deque()
+        for start, end in zip(boundaries, boundaries[1:]):
+            args = (fname, start, end, root_tag, lemmatize, filter_namespaces)
+            pending.append((start, pool.apply_async(process_streams, (args,))))
+            if len(pending) >= 2 * processes:
+                yield next_result(pending)
+        while pending:
+            yield next_result(pending)
+    finally:
+        pool.terminate()
+
+
 class WikiCorpus(TextCorpus):
     """
     Treat a wikipedia articles dump (\*articles.xml.bz2) as a (read-only) corpus.
@@ -259,8 +412,14 @@ class WikiCorpus(TextCorpus):
     >>> wiki = WikiCorpus('enwiki-20100622-pages-articles.xml.bz2') # create word->word_id mapping, takes almost 8h
     >>> MmCorpus.serialize('wiki_en_vocab200k.mm', wiki) # another 8h, creates a file in MatrixMarket format plus file with id->word
 
+    Multistream dumps are decompressed and parsed in parallel:
+
+    >>> wiki = WikiCorpus('enwiki-latest-pages-articles-multistream.xml.bz2',
+    ...                   index_fname='enwiki-latest-pages-articles-multistream-index.txt.bz2')
+
     """
-    def __init__(self, fname, processes=None, lemmatize=utils.has_pattern(), dictionary=None, filter_namespaces=('0',)):
+    def __init__(self, fname, processes=None, lemmatize=utils.has_pattern(), dictionary=None, filter_namespaces=('0',),
+                 index_fname=None, ordered=True, dictionary_workers=None):
         """
         Initialize the corpus. Unless a dictionary is provided, this scans the
         corpus once, to determine its vocabulary.
@@ -270,6 +429,14 @@ class WikiCorpus(TextCorpus):
         this automatic logic by forcing the `lemmatize` parameter explicitly.
         self.metadata if set to true will ensure that serialize will write out article titles to a pickle file.
 
+        The bz2 streams of a multistream dump are located using its index file `index_fname`,
+        if given, or else by scanning the dump once, on the first iteration over the corpus.
+        With `ordered=False`, the articles of a multistream dump are returned in the order
+        their worker processes finish them, rather than in dump order.
+
+        The dictionary is counted by `dictionary_workers` processes (default: half of `processes`),
+        besides the `processes` processes parsing the dump.
+
         """
         self.fname = fname
         self.filter_namespaces = filter_namespaces
@@ -278,12 +445,19 @@ class WikiCorpus(TextCorpus):
             processes = max(1, multiprocessing.cpu_count() - 1)
         self.processes = processes
         self.lemmatize = lemmatize
+        self.ordered = ordered
+        self.position = None
+        self.index_fname = index_fname
+        self.streams = None  # located by `process_articles`, when first needed
         if dictionary is None:
-            self.dictionary = Dictionary(self.get_texts())
+            if dictionary_workers is None:
+                # the parsing and counting processes share the cores
+                dictionary_workers = max(1, processes // 2)
+            self.dictionary = Dictionary(self.get_texts(), workers=dictionary_workers)
         else:
             self.dictionary = dictionary
 
-    def get_texts(self):
+    def get_texts(self, position=None):
         """
         Iterate over the dump, returning text version of each article as a list
         of tokens.
@@ -291,6 +465,9 @@ class WikiCorpus(TextCorpus):
         Only articles of sufficient length are returned (short articles & redirects
         etc are ignored).
 
+        If `position` is set, start right after the article at which `self.position`
+        had this value, instead of at the beginning of the dump.
+
         Note that this iterates over the **texts**; if you want vectors, just use
         the standard corpus interface instead of this function::
 
@@ -299,28 +476,66 @@ class WikiCorpus(TextCorpus):
         """
         articles, articles_all = 0, 0
         positions, positions_all = 0, 0
-        texts = ((text, self.lemmatize, title, pageid) for title, text, pageid in extract_pages(bz2.BZ2File(self.fname), self.filter_namespaces))
-        pool = multiprocessing.Pool(self.processes)
-        # process the corpus in smaller chunks of docs, because multiprocessing.Pool
-        # is dumb and would load the entire input into RAM at once...
-        for group in utils.chunkize(texts, chunksize=10 * self.processes, maxsize=1):
-            for tokens, title, pageid in pool.imap(process_article, group):  # chunksize=10):
-                articles_all += 1
-                positions_all += len(tokens)
-                # article redirects and short stubs are pruned here
-                if len(tokens) < ARTICLE_MIN_WORDS or any(title.startswith(ignore + ':') for ignore in IGNORED_NAMESPACES):
-                    continue
-                articles += 1
-                positions += len(tokens)
-                if self.metadata:
-                    yield (tokens, (pageid, title))
-                else:
-                    yield tokens
-        pool.terminate()
+        for tokens, title, pageid in self.process_articles(position):
+            articles_all += 1
+            positions_all += len(tokens)
+            # article redirects and short stubs are pruned here
+            if len(tokens) < ARTICLE_MIN_WORDS or any(title.startswith(ignore + ':') for ignore in IGNORED_NAMESPACES):
+                continue
+            articles += 1
+            positions += len(tokens)
+            if self.metadata:
+                yield (tokens, (pageid, title))
+            else:
+                yield tokens
 
         logger.info(
             "finished iterating over Wikipedia corpus of %i documents with %i positions"
             " (total %i articles, %i positions before pruning articles shorter than %i words)",
             articles, positions, articles_all, positions_all, ARTICLE_MIN_WORDS)
-        self.length = articles  # cache corpus length
+        if position is None:
+            self.length = articles  # cache corpus length
+
+    def process_articles(self, position=None):
+        """
+        Iterate over all pages of the dump, as (tokens, title, pageid) 3-tuples parsed
+        by `process_article`, before any filtering. Start at `position`, if set.
+
+        The position of the next page is kept in `self.position`, as (byte offset of a bz2
+        stream, number of pages from the start of that stream); the pages to skip when
+        resuming are parsed, but not tokenized. Positions are only tracked in dump order,
+        not with `self.ordered` off.
+        """
+        if position is not None and not self.ordered:
+            raise ValueError("cannot resume from a position with ordered=False")
+        if self.streams is None:
+            self.streams = find_streams(self.fname, self.index_fname)
+            if len(self.streams) > 1:
+                logger.info("found %i bz2 streams in %s, parsing them in parallel", len(self.streams), self.fname)
+        offset, skip = position or (self.streams[0], 0)
+        self.position = position
+
+        if len(self.streams) > 1:
+            root_tag = get_root_tag(self.fname)
+            streams = [stream for stream in self.streams if stream >= offset]
+            chunks = _process_stream_chunks(
+                self.fname, streams, root_tag, self.lemmatize, self.filter_namespaces, self.processes, self.ordered)
+            for start, articles in chunks:
+                first = skip if start == offset else 0
+                for pageno in range(first, len(articles)):
+                    self.position = (start, pageno + 1) if self.ordered else None
+                    yield articles[pageno]
+            return
+
+        pages = itertools.islice(extract_pages(bz2.BZ2File(self.fname), self.filter_namespaces), skip, None)
+        texts = ((text, self.lemmatize, title, pageid) for title, text, pageid in pages)
+        pool = multiprocessing.Pool(self.processes)
+        # process the corpus in smaller chunks of docs, because multiprocessing.Pool
+        # is dumb and would load the entire input into RAM at once...
+        for group in utils.chunkize(texts, chunksize=10 * self.processes, maxsize=1):
+            for article in pool.imap(process_article, group):  # chunksize=10):
+                skip += 1
+                self.position = (offset, skip)
+                yield article
+        pool.terminate()
 # endclass WikiCorpus
@@ -16,6 +16,8 @@ from __future__ import with_statement
 import logging
 import itertools
 
+import numpy
+
 from gensim import utils, matutils
 from six.moves import xrange
 
@@ -72,6 +74,22 @@ class CorpusABC(utils.SaveLoad):
 #        logger.warning("performing full corpus scan to determine its length; was this intended?")
 #        return sum(1 for doc in self) # sum(empty generator) == 0, so this works even for an empty corpus
 
+    def iter_chunks(self, chunksize, num_terms=None, dtype=numpy.float64):
+        """
+        Iterate over the corpus in chunks of `chunksize` documents (the last chunk may be
+        smaller), yielding each chunk as a `scipy.sparse.csc_matrix` of `num_terms` x #documents
+        in the chunk, with documents as columns, like `matutils.corpus2csc`.
+
+        Models trained on chunks of documents get them through `matutils.corpus2csc_chunks`,
+        which calls this method. This default implementation converts the documents of each chunk
+        with `corpus2csc`; corpora that can build the sparse matrices directly, without going
+        through `(fieldId, fieldValue)` 2-tuples, override it. They also fill in `num_terms`
+        with their number of features when it is not given.
+        """
+        for chunk in utils.grouper(self, chunksize):
+            yield matutils.corpus2csc(
+                chunk, num_terms=num_terms, num_docs=len(chunk), num_nnz=sum(len(doc) for doc in chunk), dtype=dtype)
+
     @staticmethod
     def save_corpus(fname, corpus, id2word=None, metadata=False):
         """
@@ -262,11 +280,18 @@ class SimilarityABC(utils.SaveLoad):
                 # (unlike numpy). so, clip the end of the chunk explicitly to make
                 # scipy.sparse happy
                 chunk_end = min(self.index.shape[0], chunk_start + self.chunksize)
-                chunk = self.index[chunk_start : chunk_end]
+                # classes storing the index in another form (e.g. with reduced precision)
+                # return the actual document vectors from `vectors()`
+                if hasattr(self, 'vectors'):
+                    chunk = self.vectors(chunk_start, chunk_end)
+                else:
+                    chunk = self.index[chunk_start : chunk_end]
                 for sim in self[chunk]:
                     yield sim
         else:
-            for doc in self.index:
+            for docno, doc in enumerate(self.index):
+                if hasattr(self, 'vectors'):
+                    doc = self.vectors(docno, docno + 1)[0]
                 yield self[doc]
 
         # restore old normalization value
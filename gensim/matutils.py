@@ -11,8 +11,11 @@ This module contains math helper functions.
 from __future__ import with_statement
 
 
+import collections
+import itertools
 import logging
 import math
+import operator
 
 from gensim import utils
 
@@ -46,6 +49,18 @@ blas = lambda name, ndarray: scipy.linalg.get_blas_funcs((name,), (ndarray,))[0]
 
 logger = logging.getLogger(__name__)
 
+try:
+    from gensim.matutils_inner import parse_entries as parse_mm_entries
+except ImportError:
+    # failed... fall back to parsing Matrix Market files line by line in pure Python
+    parse_mm_entries = None
+
+# how many bytes of a Matrix Market file to parse at once with the compiled parser
+MM_CHUNKSIZE = 1024 * 1024
+
+# how many non-zeros of a streamed corpus to convert to arrays at once in `corpus2csc` & co.
+CORPUS_BLOCKSIZE = 64 * 1024
+
 
 def argsort(x, topn=None, reverse=False):
     """
@@ -76,11 +91,16 @@ def corpus2csc(corpus, num_terms=None, dtype=np.float64, num_docs=None, num_nnz=
     If the number of terms, documents and non-zero elements is known, you can pass
     them here as parameters and a more memory efficient code path will be taken.
 
-    The input corpus may be a non-repeatable stream (generator).
+    The input corpus may be a non-repeatable stream (generator). Its documents may
+    also be given as numpy arrays: 2d arrays of (feature id, weight) rows, or
+    (feature ids, weights) pairs of 1d arrays.
 
     This is the mirror function to `Sparse2Corpus`.
 
     """
+    if hasattr(corpus, 'to_csc') and num_docs in (None, len(corpus)):
+        # the corpus is stored as a sparse matrix already (`CsrCorpus`): use its arrays directly
+        return corpus.to_csc(num_terms=num_terms, dtype=dtype)
     try:
         # if the input corpus has the `num_nnz`, `num_docs` and `num_terms` attributes
         # (as is the case with MmCorpus for example), we can use a more efficient code path
@@ -94,39 +114,127 @@ def corpus2csc(corpus, num_terms=None, dtype=np.float64, num_docs=None, num_nnz=
         pass  # not a MmCorpus...
     if printprogress:
         logger.info("creating sparse matrix from corpus")
+    blocks = _corpus2arrays(corpus, dtype=dtype, printprogress=printprogress, num_docs=num_docs)
     if num_terms is not None and num_docs is not None and num_nnz is not None:
         # faster and much more memory-friendly version of creating the sparse csc
-        posnow, indptr = 0, [0]
+        posnow, docnow = 0, 0
+        indptr = np.zeros((num_docs + 1,), dtype=np.int64)
         indices = np.empty((num_nnz,), dtype=np.int32)  # HACK assume feature ids fit in 32bit integer
         data = np.empty((num_nnz,), dtype=dtype)
-        for docno, doc in enumerate(corpus):
-            if printprogress and docno % printprogress == 0:
-                logger.info("PROGRESS: at document #%i/%i" % (docno, num_docs))
-            posnext = posnow + len(doc)
-            indices[posnow: posnext] = [feature_id for feature_id, _ in doc]
-            data[posnow: posnext] = [feature_weight for _, feature_weight in doc]
-            indptr.append(posnext)
-            posnow = posnext
+        for lengths, feature_ids, feature_weights in blocks:
+            posnext, docnext = posnow + len(feature_ids), docnow + len(lengths)
+            assert posnext <= num_nnz, "mismatch between supplied and computed number of non-zeros"
+            assert docnext <= num_docs, "mismatch between supplied and computed number of documents"
+            indices[posnow: posnext] = feature_ids
+            data[posnow: posnext] = feature_weights
+            np.cumsum(lengths, out=indptr[docnow + 1: docnext + 1])
+            indptr[docnow + 1: docnext + 1] += posnow
+            posnow, docnow = posnext, docnext
         assert posnow == num_nnz, "mismatch between supplied and computed number of non-zeros"
-        result = scipy.sparse.csc_matrix((data, indices, indptr), shape=(num_terms, num_docs), dtype=dtype)
+        assert docnow == num_docs, "mismatch between supplied and computed number of documents"
     else:
         # slower version; determine the sparse matrix parameters during iteration
-        num_nnz, data, indices, indptr = 0, [], [], [0]
-        for docno, doc in enumerate(corpus):
-            if printprogress and docno % printprogress == 0:
-                logger.info("PROGRESS: at document #%i" % (docno))
-            indices.extend([feature_id for feature_id, _ in doc])
-            data.extend([feature_weight for _, feature_weight in doc])
-            num_nnz += len(doc)
-            indptr.append(num_nnz)
+        lengths, indices, data = _join_arrays(list(blocks), dtype)
+        indptr = np.zeros((len(lengths) + 1,), dtype=np.int64)
+        np.cumsum(lengths, out=indptr[1:])
         if num_terms is None:
-            num_terms = max(indices) + 1 if indices else 0
-        num_docs = len(indptr) - 1
+            num_terms = int(indices.max()) + 1 if len(indices) else 0
+        num_docs = len(lengths)
         # now num_docs, num_terms and num_nnz contain the correct values
-        data = np.asarray(data, dtype=dtype)
-        indices = np.asarray(indices)
-        result = scipy.sparse.csc_matrix((data, indices, indptr), shape=(num_terms, num_docs), dtype=dtype)
-    return result
+    return scipy.sparse.csc_matrix((data, indices, indptr), shape=(num_terms, num_docs), dtype=dtype)
+
+
+def _corpus2arrays(corpus, dtype=np.float64, printprogress=0, num_docs=None):
+    """
+    Iterate over `corpus` in blocks of documents with about `CORPUS_BLOCKSIZE` non-zeros
+    in total, yielding a (lengths, feature ids, weights) 3-tuple of arrays for each block:
+    the number of non-zeros of each document, and their feature ids (int64) and weights
+    (`dtype`) concatenated over all documents of the block.
+
+    Documents are sequences of (feature id, weight) 2-tuples, or numpy arrays: 2d arrays
+    with one (feature id, weight) row per non-zero, or (feature ids, weights) pairs of
+    1d arrays, as yielded by `MmReader.iter_arrays`.
+
+    """
+    docs, pieces, block_nnz = [], [], 0
+    for docno, doc in enumerate(corpus):
+        if printprogress and docno % printprogress == 0:
+            if num_docs is None:
+                logger.info("PROGRESS: at document #%i" % docno)
+            else:
+                logger.info("PROGRESS: at document #%i/%i" % (docno, num_docs))
+        if isinstance(doc, np.ndarray) or (isinstance(doc, tuple) and len(doc) == 2 and isinstance(doc[0], np.ndarray)):
+            if docs:
+                pieces.append(_documents2arrays(docs, dtype))
+                docs = []
+            feature_ids, feature_weights = _array2arrays(doc)
+            pieces.append((np.array([len(feature_ids)]), feature_ids, feature_weights.astype(dtype, copy=False)))
+            block_nnz += len(feature_ids) + 1
+        else:
+            docs.append(doc)
+            block_nnz += len(doc) + 1  # count empty documents too, to bound the block length
+        if block_nnz >= CORPUS_BLOCKSIZE:
+            if docs:
+                pieces.append(_documents2arrays(docs, dtype))
+                docs = []
+            yield _join_arrays(pieces, dtype)
+            pieces, block_nnz = [], 0
+    if docs:
+        pieces.append(_documents2arrays(docs, dtype))
+    if pieces:
+        yield _join_arrays(pieces, dtype)
+
+
+def _documents2arrays(docs, dtype=np.float64):
+    """
+    Return the (lengths, feature ids, weights) arrays of `docs`, a list of documents
+    in sparse document format (see `_corpus2arrays`).
+    """
+    lengths = np.fromiter(map(len, docs), dtype=np.int64, count=len(docs))
+    num_nnz = int(lengths.sum())
+    # flatten the documents into a single list of 2-tuples, then read the ids and weights out
+    # of it at C speed, without building intermediate lists
+    entries = list(itertools.chain.from_iterable(docs))
+    feature_ids = np.fromiter(map(operator.itemgetter(0), entries), dtype=np.int64, count=num_nnz)
+    feature_weights = np.fromiter(map(operator.itemgetter(1), entries), dtype=dtype, count=num_nnz)
+    return lengths, feature_ids, feature_weights
+
+
+def _array2arrays(doc):
+    """
+    Return the (feature ids, weights) arrays of `doc`, a 2d array of (feature id, weight)
+    rows or a (feature ids, weights) pair of arrays.
+    """
+    if isinstance(doc, np.ndarray):
+        doc = doc.reshape(-1, 2)
+        return doc[:, 0].astype(np.int64), doc[:, 1]
+    feature_ids, feature_weights = doc
+    return np.asarray(feature_ids).astype(np.int64, copy=False), np.asarray(feature_weights)
+
+
+def _join_arrays(pieces, dtype=np.float64):
+    """Concatenate a list of (lengths, feature ids, weights) arrays."""
+    if len(pieces) == 1:
+        return pieces[0]
+    if not pieces:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64), np.zeros(0, dtype=dtype)
+    return tuple(np.concatenate(arrays) for arrays in zip(*pieces))
+
+
+def corpus2csc_chunks(corpus, chunksize, num_terms=None, dtype=np.float64):
+    """
+    Iterate over `corpus` in chunks of `chunksize` documents, yielding each chunk as a
+    `scipy.sparse.csc_matrix` with documents as columns (see `corpus2csc`).
+
+    Corpora implementing `iter_chunks` (see `interfaces.CorpusABC.iter_chunks`) build the
+    matrices themselves; any other iterable of documents is converted chunk by chunk.
+
+    """
+    if hasattr(corpus, 'iter_chunks'):
+        return corpus.iter_chunks(chunksize, num_terms=num_terms, dtype=dtype)
+    return (
+        corpus2csc(chunk, num_terms=num_terms, num_docs=len(chunk), num_nnz=sum(len(doc) for doc in chunk), dtype=dtype)
+        for chunk in utils.grouper(corpus, chunksize))
 
 
 def pad(mat, padrow, padcol):
@@ -202,18 +310,22 @@ class Scipy2Corpus(object):
 def sparse2full(doc, length):
     """
     Convert a document in sparse document format (=sequence of 2-tuples) into a dense
-    np array (of size `length`).
+    np array (of size `length`). The document may also be given as numpy arrays, see
+    `corpus2csc`.
 
     This is the mirror function to `full2sparse`.
 
     """
     result = np.zeros(length, dtype=np.float32)  # fill with zeroes (default value)
-    # convert indices to int as numpy 1.12 no longer indexes by floats
-    doc = ((int(id_), float(val_)) for (id_, val_) in doc)
-
-    doc = dict(doc)
-    # overwrite some of the zeroes with explicit values
-    result[list(doc)] = list(itervalues(doc))
+    if isinstance(doc, np.ndarray) or (isinstance(doc, tuple) and len(doc) == 2 and isinstance(doc[0], np.ndarray)):
+        feature_ids, feature_weights = _array2arrays(doc)
+    else:
+        if not isinstance(doc, list):
+            doc = list(doc)
+        # feature ids are converted to ints, as numpy 1.12 no longer indexes by floats
+        _, feature_ids, feature_weights = _documents2arrays([doc])
+    # overwrite some of the zeroes with explicit values; for repeated ids, the last value wins
+    result[feature_ids] = feature_weights
     return result
 
 
@@ -228,7 +340,8 @@ def full2sparse(vec, eps=1e-9):
     """
     vec = np.asarray(vec, dtype=float)
     nnz = np.nonzero(abs(vec) > eps)[0]
-    return list(zip(nnz, vec.take(nnz)))
+    # tolist() creates the python numbers much faster than iterating over numpy arrays
+    return list(izip(nnz.tolist(), vec.take(nnz).tolist()))
 
 dense2vec = full2sparse
 
@@ -245,7 +358,7 @@ def full2sparse_clipped(vec, topn, eps=1e-9):
     vec = np.asarray(vec, dtype=float)
     nnz = np.nonzero(abs(vec) > eps)[0]
     biggest = nnz.take(argsort(abs(vec).take(nnz), topn, reverse=True))
-    return list(zip(biggest, vec.take(biggest)))
+    return list(izip(biggest.tolist(), vec.take(biggest).tolist()))
 
 
 def corpus2dense(corpus, num_terms, num_docs=None, dtype=np.float32):
@@ -260,15 +373,20 @@ def corpus2dense(corpus, num_terms, num_docs=None, dtype=np.float32):
     This is the mirror function to `Dense2Corpus`.
 
     """
-    if num_docs is not None:
-        # we know the number of documents => don't bother column_stacking
-        docno, result = -1, np.empty((num_terms, num_docs), dtype=dtype)
-        for docno, doc in enumerate(corpus):
-            result[:, docno] = sparse2full(doc, num_terms)
-        assert docno + 1 == num_docs
-    else:
-        result = np.column_stack(sparse2full(doc, num_terms) for doc in corpus)
-    return result.astype(dtype)
+    blocks = _corpus2arrays(corpus, dtype=dtype)
+    if num_docs is None:
+        # collect the whole corpus as arrays first, to find out the number of documents;
+        # otherwise, fill the result block by block
+        blocks = [_join_arrays(list(blocks), dtype)]
+        num_docs = len(blocks[0][0])
+    docno, result = 0, np.zeros((num_terms, num_docs), dtype=dtype)
+    for lengths, feature_ids, feature_weights in blocks:
+        assert docno + len(lengths) <= num_docs, "mismatch between supplied and computed number of documents"
+        # for repeated feature ids within a document, the last value wins, as in `sparse2full`
+        result[feature_ids, np.repeat(np.arange(docno, docno + len(lengths)), lengths)] = feature_weights
+        docno += len(lengths)
+    assert docno == num_docs
+    return result
 
 
 class Dense2Corpus(object):
@@ -632,6 +750,19 @@ class MmWriter(object):
         self.fout.seek(len(MmWriter.HEADER_LINE))
         self.fout.write(utils.to_utf8(stats))
 
+    @staticmethod
+    def format_vector(docno, vector):
+        """
+        Format a single sparse vector as Matrix Market lines.
+
+        Return a 3-tuple (utf8 bytes of the lines, largest field id, number of
+        non-zero fields), with the fields sorted by id and near-zero fields left out.
+        """
+        vector = sorted((i, w) for i, w in vector if abs(w) > 1e-12)  # ignore near-zero entries
+        # +1 because MM format starts counting from 1
+        lines = ''.join(["%i %i %s\n" % (docno + 1, termid + 1, weight) for termid, weight in vector])
+        return utils.to_utf8(lines), (vector[-1][0] if vector else -1), len(vector)
+
     def write_vector(self, docno, vector):
         """
         Write a single sparse vector to the file.
@@ -640,19 +771,24 @@ class MmWriter(object):
         """
         assert self.headers_written, "must write Matrix Market file headers before writing data!"
         assert self.last_docno < docno, "documents %i and %i not in sequential order!" % (self.last_docno, docno)
-        vector = sorted((i, w) for i, w in vector if abs(w) > 1e-12)  # ignore near-zero entries
-        for termid, weight in vector:  # write term ids in sorted order
-            self.fout.write(utils.to_utf8("%i %i %s\n" % (docno + 1, termid + 1, weight)))  # +1 because MM format starts counting from 1
+        lines, max_id, veclen = MmWriter.format_vector(docno, vector)
+        self.fout.write(lines)  # write term ids in sorted order
         self.last_docno = docno
-        return (vector[-1][0], len(vector)) if vector else (-1, 0)
+        return max_id, veclen
 
     @staticmethod
-    def write_corpus(fname, corpus, progress_cnt=1000, index=False, num_terms=None, metadata=False):
+    def write_corpus(fname, corpus, progress_cnt=1000, index=False, num_terms=None, metadata=False,
+                     workers=1, chunksize=1000):
         """
         Save the vector space representation of an entire corpus to disk.
 
         Note that the documents are processed one at a time, so the whole corpus
         is allowed to be larger than the available RAM.
+
+        With `workers` > 1, the documents are formatted in parallel by a pool of
+        `workers` processes, in chunks of `chunksize` documents, while this process
+        only iterates over `corpus` and writes the formatted chunks to `fname`, in
+        order. The output is identical to that of a single process.
         """
         mw = MmWriter(fname)
 
@@ -670,23 +806,40 @@ class MmWriter(object):
                 docno2metadata = {}
         else:
             metadata = False
-        for docno, doc in enumerate(corpus):
-            if metadata:
-                bow, data = doc
-                docno2metadata[docno] = data
-            else:
-                bow = doc
-            if docno % progress_cnt == 0:
-                logger.info("PROGRESS: saving document #%i" % docno)
-            if index:
+        if workers > 1:
+            documents = _strip_metadata(corpus, docno2metadata) if metadata else corpus
+            for chunk_lines, chunk_lengths, max_id, veclen in _format_mm_chunks(documents, workers, chunksize, progress_cnt):
                 posnow = mw.fout.tell()
-                if posnow == poslast:
-                    offsets[-1] = -1
-                offsets.append(posnow)
-                poslast = posnow
-            max_id, veclen = mw.write_vector(docno, bow)
-            _num_terms = max(_num_terms, 1 + max_id)
-            num_nnz += veclen
+                for length in chunk_lengths:
+                    if index:
+                        if posnow == poslast:
+                            offsets[-1] = -1
+                        offsets.append(posnow)
+                        poslast = posnow
+                    posnow += length
+                docno += len(chunk_lengths)
+                mw.fout.write(chunk_lines)
+                _num_terms = max(_num_terms, 1 + max_id)
+                num_nnz += veclen
+            mw.last_docno = docno
+        else:
+            for docno, doc in enumerate(corpus):
+                if metadata:
+                    bow, data = doc
+                    docno2metadata[docno] = data
+                else:
+                    bow = doc
+                if docno % progress_cnt == 0:
+                    logger.info("PROGRESS: saving document #%i" % docno)
+                if index:
+                    posnow = mw.fout.tell()
+                    if posnow == poslast:
+                        offsets[-1] = -1
+                    offsets.append(posnow)
+                    poslast = posnow
+                max_id, veclen = mw.write_vector(docno, bow)
+                _num_terms = max(_num_terms, 1 + max_id)
+                num_nnz += veclen
         if metadata:
             utils.pickle(docno2metadata, fname + '.metadata.cpickle')
             corpus.metadata = orig_metadata
@@ -725,6 +878,64 @@ class MmWriter(object):
 #endclass MmWriter
 
 
+def _strip_metadata(corpus, docno2metadata):
+    """
+    Yield the bag-of-words of each (bow, metadata) document of `corpus`, collecting
+    the metadata into the `docno2metadata` dict.
+    """
+    for docno, (bow, data) in enumerate(corpus):
+        docno2metadata[docno] = data
+        yield bow
+
+
+def _format_mm_chunk(docno, docs):
+    """
+    Format a chunk of documents, the first of which is document #`docno`, as
+    Matrix Market lines. Run in the worker processes of `MmWriter.write_corpus`.
+
+    Return a 4-tuple (utf8 bytes of the lines, list of byte lengths of each document,
+    largest field id, number of non-zero fields).
+    """
+    pieces, lengths, max_id, num_nnz = [], [], -1, 0
+    for docno, doc in enumerate(docs, start=docno):
+        lines, doc_max_id, veclen = MmWriter.format_vector(docno, doc)
+        pieces.append(lines)
+        lengths.append(len(lines))
+        max_id = max(max_id, doc_max_id)
+        num_nnz += veclen
+    return b''.join(pieces), lengths, max_id, num_nnz
+
+
+def _format_mm_chunks(corpus, workers, chunksize, progress_cnt=1000):
+    """
+    Split `corpus` into chunks of `chunksize` documents, format the chunks with
+    `_format_mm_chunk` in a pool of `workers` processes and yield the results in
+    corpus order.
+
+    At most 2 * `workers` chunks are in flight at any time, so that a corpus that
+    is faster to iterate over than to format doesn't pile up in memory.
+    """
+    import multiprocessing
+
+    pool = multiprocessing.Pool(workers)
+    try:
+        pending, docno, next_progress = collections.deque(), 0, 0
+        for chunk in utils.grouper(corpus, chunksize):
+            # documents coming out of transformations may be lazy iterables; send lists to the workers
+            chunk = [doc if isinstance(doc, (list, np.ndarray)) else list(doc) for doc in chunk]
+            if docno + len(chunk) > next_progress:
+                logger.info("PROGRESS: saving document #%i" % docno)
+                next_progress = docno + progress_cnt
+            pending.append(pool.apply_async(_format_mm_chunk, (docno, chunk)))
+            docno += len(chunk)
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().get()
+        while pending:
+            yield pending.popleft().get()
+    finally:
+        pool.terminate()
+
+
 class MmReader(object):
     """
     Wrap a term-document matrix on disk (in matrix-market format), and present it
@@ -795,6 +1006,11 @@ class MmReader(object):
         yielded where appropriate, even if they are not explicitly stored in the
         Matrix Market file.
         """
+        if parse_mm_entries is not None:
+            for docid, (termids, values) in self.iter_arrays():
+                yield docid, list(izip(termids.tolist(), values.tolist()))
+            return
+
         with utils.file_or_filename(self.input) as lines:
             self.skip_headers(lines)
 
@@ -830,6 +1046,115 @@ class MmReader(object):
         for previd in xrange(previd + 1, self.num_docs):
             yield previd, []
 
+    def iter_arrays(self):
+        """
+        Like `__iter__`, but yield each vector as a pair of numpy arrays (col_nos, values),
+        with int64 column numbers and float64 values, instead of a list of 2-tuples.
+
+        With the compiled parser from `gensim.matutils_inner`, the file is parsed in chunks
+        of `MM_CHUNKSIZE` bytes and no Python objects are created for the individual entries.
+        """
+        if parse_mm_entries is None:
+            for docid, document in MmReader.__iter__(self):
+                yield docid, (
+                    np.array([termid for termid, _ in document], dtype=np.int64),
+                    np.array([val for _, val in document], dtype=np.float64))
+            return
+
+        previd, pieces = -1, []  # pieces = (col_nos, values) of the document read so far, one per chunk
+        with utils.file_or_filename(self.input) as fin:
+            self.skip_headers(fin)
+            for docids, termids, values in self._parse_entries(fin):
+                if not len(docids):
+                    continue
+                assert previd <= docids[0] and not (docids[1:] < docids[:-1]).any(), \
+                    "matrix columns must come in ascending order"
+                bounds = np.concatenate([[0], np.flatnonzero(docids[1:] != docids[:-1]) + 1, [len(docids)]])
+                for start, end in izip(bounds[:-1], bounds[1:]):
+                    docid = int(docids[start])
+                    if docid != previd:
+                        # change of document: return the document read so far, and the implicit
+                        # (empty) documents between the previous id and the new id
+                        if previd >= 0:
+                            yield previd, _join_entries(pieces)
+                        for previd in xrange(previd + 1, docid):
+                            yield previd, _join_entries([])
+                        previd, pieces = docid, []
+                    pieces.append((termids[start: end], values[start: end]))
+
+        if previd >= 0:
+            yield previd, _join_entries(pieces)
+        for previd in xrange(previd + 1, self.num_docs):
+            yield previd, _join_entries([])
+
+    def iter_chunks(self, chunksize, num_terms=None, dtype=np.float64):
+        """
+        Iterate over the documents in chunks of `chunksize` documents, yielding each chunk as
+        a `scipy.sparse.csc_matrix` of `num_terms` (by default, the number of features of the
+        matrix) x #documents in the chunk, as in `interfaces.CorpusABC.iter_chunks`.
+
+        With the compiled parser from `gensim.matutils_inner`, the matrices are built directly
+        from the parsed arrays, without creating a 2-tuple for each entry.
+        """
+        num_terms = self.num_terms if num_terms is None else num_terms
+        if parse_mm_entries is None:
+            for chunk in utils.grouper((doc for _, doc in MmReader.__iter__(self)), chunksize):
+                yield corpus2csc(
+                    chunk, num_terms=num_terms, num_docs=len(chunk), num_nnz=sum(len(doc) for doc in chunk), dtype=dtype)
+            return
+
+        def csc_chunk(docids, termids, values, chunk_start, chunk_len):
+            # the entries are sorted by document: find where each document of the chunk starts
+            indptr = np.searchsorted(docids, np.arange(chunk_start, chunk_start + chunk_len + 1))
+            return scipy.sparse.csc_matrix(
+                (values.astype(dtype, copy=False), termids, indptr), shape=(num_terms, chunk_len))
+
+        def join(pieces):
+            if len(pieces) == 1:
+                return pieces[0]
+            return [np.concatenate(arrays) for arrays in izip(*pieces)]
+
+        # pieces = (docids, termids, values) of the entries parsed but not yielded yet, all of documents >= chunk_start
+        chunk_start, pieces, previd = 0, [], -1
+        with utils.file_or_filename(self.input) as fin:
+            self.skip_headers(fin)
+            for docids, termids, values in self._parse_entries(fin):
+                if not len(docids):
+                    continue
+                assert previd <= docids[0] and not (docids[1:] < docids[:-1]).any(), \
+                    "matrix columns must come in ascending order"
+                pieces.append((docids, termids, values))
+                previd = docids[-1]
+                # yield the chunks whose documents have all been read
+                while previd >= chunk_start + chunksize:
+                    docids, termids, values = join(pieces)
+                    end = np.searchsorted(docids, chunk_start + chunksize)
+                    yield csc_chunk(docids[:end], termids[:end], values[:end], chunk_start, chunksize)
+                    chunk_start, pieces = chunk_start + chunksize, [(docids[end:], termids[end:], values[end:])]
+
+        # the remaining documents, including empty documents at the end of the matrix
+        docids, termids, values = join(pieces) if pieces else (np.zeros(0, dtype=np.int64),) * 2 + (np.zeros(0),)
+        while chunk_start < max(self.num_docs, previd + 1):
+            chunk_len = min(chunksize, max(self.num_docs, previd + 1) - chunk_start)
+            end = np.searchsorted(docids, chunk_start + chunk_len)
+            yield csc_chunk(docids[:end], termids[:end], values[:end], chunk_start, chunk_len)
+            chunk_start, docids, termids, values = chunk_start + chunk_len, docids[end:], termids[end:], values[end:]
+
+    def _parse_entries(self, fin, chunksize=None):
+        """
+        Parse the file `fin` from its current position with the compiled parser, yielding
+        the (docids, termids, values) arrays of the entries in each `chunksize` bytes read
+        (`MM_CHUNKSIZE` by default).
+        """
+        buf, final = b'', False
+        while not final:
+            chunk = fin.read(chunksize or MM_CHUNKSIZE)
+            final = not chunk
+            buf += chunk if isinstance(chunk, bytes) else chunk.encode('utf8')  # file opened in text mode
+            docids, termids, values, consumed = parse_mm_entries(buf, self.transposed, final)
+            buf = buf[consumed:]
+            yield docids, termids, values
+
     def docbyoffset(self, offset):
         """Return document at file offset `offset` (in bytes)"""
         # empty documents are not stored explicitly in MM format, so the index marks
@@ -842,6 +1167,22 @@ class MmReader(object):
             fin = self.input
 
         fin.seek(offset)  # works for gzip/bz2 input, too
+        if parse_mm_entries is not None:
+            docid, pieces = None, []
+            for docids, termids, values in self._parse_entries(fin, chunksize=2048):
+                if not len(docids):
+                    continue
+                if docid is None:
+                    docid = docids[0]
+                others = np.flatnonzero(docids != docid)
+                end = others[0] if len(others) else len(docids)
+                assert end == len(docids) or docids[end] > docid, "matrix columns must come in ascending order"
+                pieces.append((termids[:end], values[:end]))
+                if end < len(docids):
+                    break
+            termids, values = _join_entries(pieces)
+            return list(izip(termids.tolist(), values.tolist()))
+
         previd, document = -1, []
         for line in fin:
             docid, termid, val = line.split()
@@ -857,3 +1198,12 @@ class MmReader(object):
             document.append((termid, val,))  # add another field to the current document
         return document
 #endclass MmReader
+
+
+def _join_entries(pieces):
+    """Concatenate (col_nos, values) array pairs into a single pair."""
+    if len(pieces) == 1:
+        return pieces[0]
+    if not pieces:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float64)
+    return np.concatenate([p[0] for p in pieces]), np.concatenate([p[1] for p in pieces])
@@ -0,0 +1,100 @@
+#!/usr/bin/env cython
+# cython: boundscheck=False
+# cython: wraparound=False
+# coding: utf-8
+#
+# Licensed under the GNU LGPL v2.1 - http://www.gnu.org/licenses/lgpl.html
+
+"""
+Optimized parsing of Matrix Market coordinate files, used by `gensim.matutils.MmReader`.
+"""
+
+import cython
+import numpy as np
+cimport numpy as np
+
+from libc.stdlib cimport strtod, strtoll
+from libc.string cimport memchr
+
+
+cdef inline bint is_space(char c) nogil:
+    return c == b' ' or c == b'\t' or c == b'\r' or c == b'\n' or c == b'\v' or c == b'\f'
+
+
+def parse_entries(bytes buf, bint transposed=True, bint final=False):
+    """
+    Parse the Matrix Market coordinate entries ("row column value" lines) in `buf`.
+
+    Return (docids, termids, values, consumed): 0-based document and term ids as int64
+    arrays, values as a float64 array and the number of bytes of `buf` parsed. Only
+    complete lines are parsed, unless `final` is set (`buf` is the end of the file):
+    the caller should prepend the remaining `buf[consumed:]` to the next chunk of the file.
+
+    Documents are rows of the matrix if `transposed`, otherwise columns. Blank lines are
+    skipped; a malformed line raises ValueError.
+
+    """
+    cdef const char *start = buf
+    cdef const char *end = start + len(buf)
+    cdef const char *pos = start
+    cdef const char *line_start
+    cdef const char *line_end
+    cdef char *parsed
+    cdef bint malformed = False
+    cdef long long row, column
+    cdef double value
+    cdef Py_ssize_t count = 0
+    # a line holds at least 6 bytes ("1 1 1\n"), except possibly the last one
+    cdef Py_ssize_t capacity = len(buf) // 6 + 1
+
+    docids = np.empty(capacity, dtype=np.int64)
+    termids = np.empty(capacity, dtype=np.int64)
+    values = np.empty(capacity, dtype=np.float64)
+    cdef np.int64_t[:] docids_view = docids
+    cdef np.int64_t[:] termids_view = termids
+    cdef np.float64_t[:] values_view = values
+
+    with nogil:
+        while pos < end:
+            line_end = <const char *>memchr(pos, b'\n', end - pos)
+            if line_end == NULL:
+                if not final:
+                    break
+                line_end = end
+            line_start = pos
+            while pos < line_end and is_space(pos[0]):
+                pos += 1
+            if pos == line_end:  # blank line
+                pos = line_end + 1
+                continue
+            # strtoll/strtod skip leading whitespace, newlines included: check that each
+            # number ends within the current line
+            row = strtoll(pos, &parsed, 10)
+            malformed = parsed == pos or parsed > line_end
+            if not malformed:
+                pos = parsed
+                column = strtoll(pos, &parsed, 10)
+                malformed = parsed == pos or parsed > line_end
+            if not malformed:
+                pos = parsed
+                value = strtod(pos, &parsed)
+                malformed = parsed == pos or parsed > line_end
+            if not malformed:
+                pos = parsed
+                while pos < line_end and is_space(pos[0]):
+                    pos += 1
+                malformed = pos != line_end
+            if malformed:
+                break
+            # -1 because matrix market indexes are 1-based => convert to 0-based
+            if transposed:
+                docids_view[count], termids_view[count] = row - 1, column - 1
+            else:
+                docids_view[count], termids_view[count] = column - 1, row - 1
+            values_view[count] = value
+            count += 1
+            pos = line_end + 1
+
+    if malformed:
+        raise ValueError("invalid Matrix Market entry: %r" % buf[line_start - start: line_end - start])
+    return docids[:count], termids[:count], values[:count], min(pos - start, len(buf))
@@ -55,7 +55,7 @@ from timeit import default_timer
 
 from numpy import zeros, sum as np_sum, add as np_add, concatenate, \
     repeat as np_repeat, array, float32 as REAL, empty, ones, memmap as np_memmap, \
-    sqrt, newaxis, ndarray, dot, vstack, dtype, divide as np_divide, integer
+    sqrt, newaxis, ndarray, dot, vstack, dtype, divide as np_divide, integer, einsum
 
 
 from gensim.utils import call_on_class_only
@@ -373,6 +373,7 @@ class DocvecsArray(utils.SaveLoad):
 
     def clear_sims(self):
         self.doctag_syn0norm = None
+        self.doctag_syn0_norms = None
 
     def estimated_lookup_memory(self):
         """Estimated memory for tag lookup; 0 if using pure int tags."""
@@ -395,7 +396,7 @@ class DocvecsArray(utils.SaveLoad):
             seed = "%d %s" % (model.seed, self.index_to_doctag(i))
             self.doctag_syn0[i] = model.seeded_vector(seed)
 
-    def init_sims(self, replace=False):
+    def init_sims(self, replace=False, norms_only=False):
         """
         Precompute L2-normalized vectors.
 
@@ -406,8 +407,17 @@ class DocvecsArray(utils.SaveLoad):
         The model becomes effectively read-only = you can call `most_similar`, `similarity`
         etc., but not `train` or `infer_vector`.
 
+        If `norms_only` is set, keep the original vectors and only precompute the L2 norm of each
+        vector (dropping `doctag_syn0norm`, if any); similarities are then normalized on the fly.
+
         """
-        if getattr(self, 'doctag_syn0norm', None) is None or replace:
+        if norms_only and not replace:
+            if getattr(self, 'doctag_syn0_norms', None) is None:
+                logger.info("precomputing L2-norms of doc weight vectors, without normalized vectors")
+                self.doctag_syn0_norms = sqrt(einsum('ij,ij->i', self.doctag_syn0, self.doctag_syn0)).astype(REAL)
+            self.doctag_syn0norm = None
+        elif (getattr(self, 'doctag_syn0norm', None) is None and
+                getattr(self, 'doctag_syn0_norms', None) is None) or replace:
             logger.info("precomputing L2-norms of doc weight vectors")
             if replace:
                 for i in xrange(self.doctag_syn0.shape[0]):
@@ -421,6 +431,13 @@ class DocvecsArray(utils.SaveLoad):
                 else:
                     self.doctag_syn0norm = empty(self.doctag_syn0.shape, dtype=REAL)
                 np_divide(self.doctag_syn0, sqrt((self.doctag_syn0 ** 2).sum(-1))[..., newaxis], self.doctag_syn0norm)
+            self.doctag_syn0_norms = None
+
+    def _norm_vectors(self, indexes):
+        """Return the normalized vectors of the docs at int `indexes` (int, int array or slice)."""
+        if self.doctag_syn0norm is None:
+            return self.doctag_syn0[indexes] / self.doctag_syn0_norms[indexes][..., newaxis]
+        return self.doctag_syn0norm[indexes]
 
     def most_similar(self, positive=[], negative=[], topn=10, clip_start=0, clip_end=None, indexer=None):
         """
@@ -437,7 +454,7 @@ class DocvecsArray(utils.SaveLoad):
         there was chosen to be significant, such as more popular tag IDs in lower indexes.)
         """
         self.init_sims()
-        clip_end = clip_end or len(self.doctag_syn0norm)
+        clip_end = clip_end or len(self.doctag_syn0)
 
         if isinstance(positive, string_types + integer_types + (integer,)) and not negative:
             # allow calls like most_similar('dog'), as a shorthand for most_similar(['dog'])
@@ -459,7 +476,7 @@ class DocvecsArray(utils.SaveLoad):
             if isinstance(doc, ndarray):
                 mean.append(weight * doc)
             elif doc in self.doctags or doc < self.count:
-                mean.append(weight * self.doctag_syn0norm[self._int_index(doc)])
+                mean.append(weight * self._norm_vectors(self._int_index(doc)))
                 all_docs.add(self._int_index(doc))
             else:
                 raise KeyError("doc '%s' not in trained set" % doc)
@@ -470,7 +487,10 @@ class DocvecsArray(utils.SaveLoad):
         if indexer is not None:
             return indexer.most_similar(mean, topn)
 
-        dists = dot(self.doctag_syn0norm[clip_start:clip_end], mean)
+        if self.doctag_syn0norm is None:
+            dists = dot(self.doctag_syn0[clip_start:clip_end], mean) / self.doctag_syn0_norms[clip_start:clip_end]
+        else:
+            dists = dot(self.doctag_syn0norm[clip_start:clip_end], mean)
         if not topn:
             return dists
         best = matutils.argsort(dists, topn=topn + len(all_docs), reverse=True)
@@ -491,7 +511,7 @@ class DocvecsArray(utils.SaveLoad):
         logger.debug("using docs %s" % docs)
         if not docs:
             raise ValueError("cannot select a doc from an empty list")
-        vectors = vstack(self.doctag_syn0norm[self._int_index(doc)] for doc in docs).astype(REAL)
+        vectors = vstack([self._norm_vectors(self._int_index(doc)) for doc in docs]).astype(REAL)
         mean = matutils.unitvec(vectors.mean(axis=0)).astype(REAL)
         dists = dot(vectors, mean)
         return sorted(zip(dists, docs))[0][1]
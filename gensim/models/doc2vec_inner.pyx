@@ -23,6 +23,7 @@ except ImportError:
      import scipy.linalg.blas as fblas
 
 from word2vec_inner cimport bisect_left, random_int32, \
+     VocabArrays, init_vocab_arrays, lookup_word, \
      scopy, saxpy, sdot, dsdot, snrm2, sscal, \
      REAL_t, EXP_TABLE, \
      our_dot, our_saxpy, \
@@ -295,19 +296,13 @@ def train_document_dbow(model, doc_words, doctag_indexes, alpha, work=None,
        work = zeros(model.layer1_size, dtype=REAL)
     _work = <REAL_t *>np.PyArray_DATA(work)
 
-    vlookup = model.wv.vocab
+    cdef VocabArrays vocab_arrays
+    vlookup = init_vocab_arrays(model.wv.vocab, &vocab_arrays)
     i = 0
     for token in doc_words:
-        predict_word = vlookup[token] if token in vlookup else None
-        if predict_word is None:  # shrink document to leave out word
-            continue  # leaving i unchanged
-        if sample and predict_word.sample_int < random_int32(&next_random):
-            continue
-        indexes[i] = predict_word.index
-        if hs:
-            codelens[i] = <int>len(predict_word.code)
-            codes[i] = <np.uint8_t *>np.PyArray_DATA(predict_word.code)
-            points[i] = <np.uint32_t *>np.PyArray_DATA(predict_word.point)
+        if not lookup_word(vlookup, &vocab_arrays, token, sample, hs, &next_random,
+                           &indexes[i], &codelens[i], &codes[i], &points[i]):
+            continue  # shrink document to leave out word, leaving i unchanged
         result += 1
         i += 1
         if i == MAX_DOCUMENT_LEN:
@@ -435,19 +430,13 @@ def train_document_dm(model, doc_words, doctag_indexes, alpha, work=None, neu1=N
        neu1 = zeros(model.layer1_size, dtype=REAL)
     _neu1 = <REAL_t *>np.PyArray_DATA(neu1)
 
-    vlookup = model.wv.vocab
+    cdef VocabArrays vocab_arrays
+    vlookup = init_vocab_arrays(model.wv.vocab, &vocab_arrays)
     i = 0
     for token in doc_words:
-        predict_word = vlookup[token] if token in vlookup else None
-        if predict_word is None:  # shrink document to leave out word
-            continue  # leaving i unchanged
-        if sample and predict_word.sample_int < random_int32(&next_random):
-            continue
-        indexes[i] = predict_word.index
-        if hs:
-            codelens[i] = <int>len(predict_word.code)
-            codes[i] = <np.uint8_t *>np.PyArray_DATA(predict_word.code)
-            points[i] = <np.uint32_t *>np.PyArray_DATA(predict_word.point)
+        if not lookup_word(vlookup, &vocab_arrays, token, sample, hs, &next_random,
+                           &indexes[i], &codelens[i], &codes[i], &points[i]):
+            continue  # shrink document to leave out word, leaving i unchanged
         result += 1
         i += 1
         if i == MAX_DOCUMENT_LEN:
@@ -597,19 +586,13 @@ def train_document_dm_concat(model, doc_words, doctag_indexes, alpha, work=None,
        neu1 = zeros(model.layer1_size, dtype=REAL)
     _neu1 = <REAL_t *>np.PyArray_DATA(neu1)
 
-    vlookup = model.wv.vocab
+    cdef VocabArrays vocab_arrays
+    vlookup = init_vocab_arrays(model.wv.vocab, &vocab_arrays)
     i = 0
     for token in doc_words:
-        predict_word = vlookup[token] if token in vlookup else None
-        if predict_word is None:  # shrink document to leave out word
-            continue  # leaving i unchanged
-        if sample and predict_word.sample_int < random_int32(&next_random):
-            continue
-        indexes[i] = predict_word.index
-        if hs:
-            codelens[i] = <int>len(predict_word.code)
-            codes[i] = <np.uint8_t *>np.PyArray_DATA(predict_word.code)
-            points[i] = <np.uint32_t *>np.PyArray_DATA(predict_word.point)
+        if not lookup_word(vlookup, &vocab_arrays, token, sample, hs, &next_random,
+                           &indexes[i], &codelens[i], &codes[i], &points[i]):
+            continue  # shrink document to leave out word, leaving i unchanged
         result += 1
         i += 1
         if i == MAX_DOCUMENT_LEN:
@@ -19,6 +19,12 @@ Persist the word vectors to disk with::
 >>> word_vectors.save(fname)
 >>> word_vectors = KeyedVectors.load(fname)
 
+For serving many processes from one large set of vectors, store them as flat arrays that are
+memory-mapped on load, with no per-word objects unpickled::
+
+>>> word_vectors.save_mmappable(fname)
+>>> word_vectors = KeyedVectors.load_mmappable(fname)  # mmap='r' by default
+
 The vectors can also be instantiated from an existing file on disk in the original Google's word2vec C format as a KeyedVectors instance::
 
   >>> from gensim.models.keyedvectors import KeyedVectors
@@ -34,6 +40,9 @@ are already built-in::
   >>> word_vectors.most_similar_cosmul(positive=['woman', 'king'], negative=['man'])
   [('queen', 0.71382287), ...]
 
+  >>> word_vectors.most_similar_batch([['woman', 'king'], ['paris', 'germany']], [['man'], ['france']])
+  [[('queen', 0.50882536), ...], [('berlin', 0.61563426), ...]]
+
   >>> word_vectors.doesnt_match("breakfast cereal dinner lunch".split())
   'cereal'
 
@@ -55,6 +64,8 @@ and so on.
 from __future__ import division  # py3 "true division"
 
 import logging
+import zlib
+from collections import Mapping, MutableMapping, Sequence
 
 try:
     from queue import Queue, Empty
@@ -71,13 +82,15 @@ except ImportError:
 
 from numpy import exp, log, dot, zeros, outer, random, dtype, float32 as REAL,\
     double, uint32, seterr, array, uint8, vstack, fromstring, sqrt, newaxis,\
-    ndarray, empty, sum as np_sum, prod, ones, ascontiguousarray
+    ndarray, empty, sum as np_sum, prod, ones, ascontiguousarray, int32, int64, cumsum,\
+    arange, repeat, where, save as np_save, load as np_load, argpartition, argsort, inf, einsum, asarray,\
+    unique, concatenate, minimum, flatnonzero
 
 from gensim import utils, matutils  # utility fnc for pickling, common scipy operations etc
-from gensim.corpora.dictionary import Dictionary
 from six import string_types, iteritems
-from six.moves import xrange
+from six.moves import xrange, zip as izip
 from scipy import stats
+from scipy.spatial.distance import cdist
 try:
     from keras.layers import Embedding
     KERAS_INSTALLED = True
@@ -87,6 +100,104 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+LOAD_CHUNK_SIZE = 4 * 1024 * 1024  # approx. number of bytes parsed at once by `load_word2vec_format`
+
+# `sample_int` of words that are never downsampled is 2**32 (probability 1.0); in a uint32
+# array, 2**32 - 1 has the same effect, because the random draws compared against it are < 2**32
+MAX_SAMPLE_INT = 2**32 - 1
+
+SIMILARITY_BLOCK_SIZE = 16 * 1024 * 1024  # max. number of similarities computed at once by batched look-ups
+
+
+def wmd_from_distances(ids1, weights1, ids2, weights2, distances):
+    """
+    Return the Word Mover's Distance between two documents, given the sorted ids `ids1`, `ids2` of
+    their (unique) words -- the same word has the same id in both --, their normalized word frequencies
+    `weights1`, `weights2` and the `len(ids1) x len(ids2)` euclidean `distances` between their word vectors.
+
+    This is the part of `KeyedVectors.wmdistance` shared with `gensim.similarities.WmdSimilarity`;
+    it requires `pyemd`.
+    """
+    if len(ids1) == 1 and len(ids2) == 1 and ids1[0] == ids2[0]:
+        # Both documents are composed by a single unique token
+        return 0.0
+    if not distances.any():
+        # `emd` gets stuck if the distance matrix contains only zeros.
+        logger.debug('The distance matrix is all zeros. Aborting (returning inf).')
+        return float('inf')
+    if len(ids1) == 1 or len(ids2) == 1:
+        # all the mass moves from (or to) the single word, there's nothing to optimize
+        return float(dot(weights1, distances.dot(weights2)))
+    # histograms over the union of both documents' words; only the mass of document 1 words
+    # moving to document 2 words has a cost
+    union = unique(concatenate([ids1, ids2]))
+    positions1, positions2 = union.searchsorted(ids1), union.searchsorted(ids2)
+    distance_matrix = zeros((len(union), len(union)), dtype=double)
+    distance_matrix[positions1[:, newaxis], positions2] = distances
+    d1, d2 = zeros(len(union), dtype=double), zeros(len(union), dtype=double)
+    d1[positions1] = weights1
+    d2[positions2] = weights2
+    return emd(d1, d2, distance_matrix)
+
+
+def _iter_binary_blocks(fin, vocab_size, vector_size, chunk_size=LOAD_CHUNK_SIZE):
+    """
+    Parse `vocab_size` records of the binary C word2vec format from `fin`, reading it in
+    buffers of roughly `chunk_size` bytes.
+
+    Yield 2-tuples `(list of raw word bytestrings, 2D float32 array of their vectors)`, one
+    per buffer.
+
+    """
+    binary_len = dtype(REAL).itemsize * vector_size
+    buf, pos, remaining = b'', 0, vocab_size
+    while remaining:
+        chunk = fin.read(chunk_size)
+        buf, pos = buf[pos:] + chunk, 0
+        words, vectors = [], []
+        while remaining:
+            space = buf.find(b' ', pos)
+            if space == -1 or space + 1 + binary_len > len(buf):
+                break  # incomplete record at the end of the buffer => read more
+            # ignore newlines in front of words (some binary files have)
+            words.append(buf[pos: space].replace(b'\n', b''))
+            vectors.append(buf[space + 1: space + 1 + binary_len])
+            pos = space + 1 + binary_len
+            remaining -= 1
+        if words:
+            yield words, fromstring(b''.join(vectors), dtype=REAL).reshape(len(words), vector_size)
+        elif not chunk:
+            raise EOFError("unexpected end of input; is count incorrect or file otherwise damaged?")
+
+
+def _iter_text_blocks(fin, vocab_size, vector_size, chunk_size=LOAD_CHUNK_SIZE):
+    """
+    Parse `vocab_size` lines of the text C word2vec format from `fin`, converting the vector
+    values of roughly `chunk_size` bytes of lines at once.
+
+    Yield 2-tuples `(list of raw word bytestrings, 2D float32 array of their vectors)`.
+
+    """
+    line_no = 0
+    while line_no < vocab_size:
+        words, vectors, nbytes, first_line = [], [], 0, line_no
+        while line_no < vocab_size and nbytes < chunk_size:
+            line = fin.readline()
+            if line == b'':
+                raise EOFError("unexpected end of input; is count incorrect or file otherwise damaged?")
+            parts = line.rstrip().split(b' ', 1)
+            if len(parts) != 2 or parts[1].count(b' ') + 1 != vector_size:
+                raise ValueError("invalid vector on line %s (is this really the text format?)" % (line_no))
+            words.append(parts[0])
+            vectors.append(parts[1])
+            nbytes += len(line)
+            line_no += 1
+        weights = fromstring(b' '.join(vectors), dtype=REAL, sep=' ')
+        if weights.size != len(words) * vector_size:
+            raise ValueError(
+                "invalid vector on lines %s-%s (is this really the text format?)" % (first_line, line_no - 1))
+        yield words, weights.reshape(len(words), vector_size)
+
 
 class Vocab(object):
     """
@@ -106,6 +217,314 @@ class Vocab(object):
         return "%s(%s)" % (self.__class__.__name__, ', '.join(vals))
 
 
+class VocabView(object):
+    """
+    A single item of `CompactVocab`: exposes the same attributes as `Vocab` (`index`, `count`,
+    `sample_int`, `code`, `point`), reading and writing them directly in the vocabulary arrays.
+
+    """
+    __slots__ = ('vocab', 'row')
+
+    def __init__(self, vocab, row):
+        self.vocab = vocab
+        self.row = row
+
+    @property
+    def index(self):
+        return self.vocab.indexes.item(self.row)
+
+    @index.setter
+    def index(self, value):
+        self.vocab.indexes[self.row] = value
+
+    @property
+    def count(self):
+        count = self.vocab.counts.item(self.row)
+        return None if count < 0 else count
+
+    @count.setter
+    def count(self, value):
+        self.vocab.counts[self.row] = -1 if value is None else value
+
+    @property
+    def sample_int(self):
+        return self.vocab.sample_ints.item(self.row)
+
+    @sample_int.setter
+    def sample_int(self, value):
+        self.vocab.sample_ints[self.row] = min(value, MAX_SAMPLE_INT)
+
+    @property
+    def code(self):
+        return self.vocab.get_code(self.row, self.vocab.codes)
+
+    @code.setter
+    def code(self, value):
+        self.vocab.set_code(self.row, self.vocab.codes, value)
+
+    @property
+    def point(self):
+        return self.vocab.get_code(self.row, self.vocab.points)
+
+    @point.setter
+    def point(self, value):
+        self.vocab.set_code(self.row, self.vocab.points, value)
+
+    def __lt__(self, other):  # used for sorting in a priority queue
+        return self.count < other.count
+
+    def __eq__(self, other):
+        return isinstance(other, VocabView) and self.vocab is other.vocab and self.row == other.row
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def __str__(self):
+        keys = ['count', 'index', 'sample_int']
+        if self.vocab.has_code(self.row):
+            keys += ['code', 'point']
+        vals = ['%s:%r' % (key, getattr(self, key)) for key in sorted(keys)]
+        return "%s(%s)" % (self.__class__.__name__, ', '.join(vals))
+
+
+class CompactVocab(utils.SaveLoad, MutableMapping):
+    """
+    Memory-efficient `word => Vocab`-like mapping, storing the per-word attributes in parallel
+    NumPy arrays instead of one Python `Vocab` object per word.
+
+    Indexing returns a `VocabView`, so existing code like `vocab[word].index` or
+    `vocab[word].count += 1` keeps working. The Huffman `code` and `point` arrays of all words
+    are packed into two flat arrays. Each word costs one dict entry (word => row) plus a few
+    dozen bytes of array storage, and pickles/loads as a handful of arrays.
+
+    Rows are never reused: deleting a word only forgets its row.
+
+    """
+    ARRAYS = ('indexes', 'counts', 'sample_ints', 'code_offsets', 'code_lens', 'codes', 'points')
+
+    def __init__(self):
+        self.slots = {}  # word => row in the arrays below
+        self.num_rows = 0
+        self.indexes = empty(0, dtype=uint32)
+        self.counts = empty(0, dtype=int64)  # -1 stands for `count=None`
+        self.sample_ints = empty(0, dtype=uint32)
+        # offset into `codes` and `points`; -1 = not assigned. Left empty until the first code is assigned
+        self.code_offsets = empty(0, dtype=int64)
+        self.code_lens = empty(0, dtype=int32)
+        self.codes = empty(0, dtype=uint8)
+        self.points = empty(0, dtype=uint32)
+        self.codes_used = 0
+
+    @staticmethod
+    def _grow(arr, size, fill=0):
+        """Return a copy of `arr` extended to `size` elements, with the new elements set to `fill`."""
+        grown = empty(size, dtype=arr.dtype)
+        grown[:len(arr)] = arr
+        grown[len(arr):] = fill
+        return grown
+
+    def add(self, word, index=0, count=0, sample_int=0):
+        """Add a new `word` (or overwrite an existing one) without creating any intermediate `Vocab` object."""
+        row = self.slots.get(word)
+        if row is None:
+            row = self.num_rows
+            if row == len(self.indexes):
+                capacity = max(16, 2 * row)
+                self.indexes = self._grow(self.indexes, capacity)
+                self.counts = self._grow(self.counts, capacity)
+                self.sample_ints = self._grow(self.sample_ints, capacity)
+                if len(self.code_offsets):
+                    self.code_offsets = self._grow(self.code_offsets, capacity, -1)
+                    self.code_lens = self._grow(self.code_lens, capacity)
+            self.num_rows += 1
+            self.slots[word] = row
+        self.indexes[row] = index
+        self.counts[row] = -1 if count is None else count
+        self.sample_ints[row] = min(sample_int, MAX_SAMPLE_INT)
+        if self.has_code(row):
+            self.code_offsets[row] = -1
+        return row
+
+    def has_code(self, row):
+        return row < len(self.code_offsets) and self.code_offsets[row] >= 0
+
+    def get_code(self, row, packed):
+        if not self.has_code(row):
+            raise AttributeError("no Huffman code assigned to row %i" % row)
+        offset = self.code_offsets[row]
+        return packed[offset: offset + self.code_lens[row]]
+
+    def set_code(self, row, packed, value):
+        """Store `value` as the `code` (`packed=self.codes`) or `point` (`packed=self.points`) of `row`."""
+        value = array(value)
+        if len(self.code_offsets) < len(self.indexes):
+            # first code ever assigned => start tracking code offsets for all rows
+            self.code_offsets = self._grow(self.code_offsets, len(self.indexes), -1)
+            self.code_lens = self._grow(self.code_lens, len(self.indexes))
+        if self.code_offsets[row] < 0 or self.code_lens[row] != len(value):
+            # allocate a new region, shared by the code and point of this word
+            if self.codes_used + len(value) > len(self.codes):
+                capacity = max(64, 2 * len(self.codes), self.codes_used + len(value))
+                self.codes = self._grow(self.codes, capacity)
+                self.points = self._grow(self.points, capacity)
+                packed = self.codes if packed.dtype == uint8 else self.points
+            self.code_offsets[row] = self.codes_used
+            self.code_lens[row] = len(value)
+            self.codes_used += len(value)
+        offset = self.code_offsets[row]
+        packed[offset: offset + len(value)] = value
+
+    def words_by_row(self):
+        """Return a list of all words, ordered by their row (`None` for rows of deleted words)."""
+        words = [None] * self.num_rows
+        for word, row in iteritems(self.slots):
+            words[row] = word
+        return words
+
+    def trim(self):
+        """
+        Release unused array capacity, rows of deleted words and code storage left behind by
+        reassigned Huffman codes. Rows are renumbered only if some words were deleted.
+
+        """
+        words = self.words_by_row()
+        rows = array([row for row, word in enumerate(words) if word is not None], dtype=int64)
+        if len(self.code_offsets):
+            offsets, lens = self.code_offsets[rows], self.code_lens[rows]
+            lens[offsets < 0] = 0
+            starts = cumsum(lens) - lens
+            # source position of each element of the repacked codes/points
+            source = arange(lens.sum(), dtype=int64) + repeat(offsets - starts, lens)
+            self.codes, self.points = self.codes[source], self.points[source]
+            self.code_offsets = where(offsets < 0, -1, starts)
+            self.code_lens = lens
+            self.codes_used = len(source)
+        self.indexes = self.indexes[rows]
+        self.counts = self.counts[rows]
+        self.sample_ints = self.sample_ints[rows]
+        if len(rows) != self.num_rows:
+            self.slots = dict((words[row], new_row) for new_row, row in enumerate(rows))
+        self.num_rows = len(rows)
+
+    def _save_specials(self, *args, **kwargs):
+        self.trim()
+        return super(CompactVocab, self)._save_specials(*args, **kwargs)
+
+    def __getstate__(self):
+        if all(attr in self.__dict__ for attr in self.ARRAYS):
+            self.trim()  # otherwise some arrays were set aside (and trimmed already) by `_save_specials`
+        state = self.__dict__.copy()
+        state['slots'] = self.words_by_row()  # the rows are implied by the order, no need to store them
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if isinstance(self.slots, list):
+            self.slots = dict(izip(self.slots, xrange(len(self.slots))))
+
+    def __getitem__(self, word):
+        return VocabView(self, self.slots[word])
+
+    def __setitem__(self, word, vocab):
+        row = self.add(
+            word, index=getattr(vocab, 'index', 0), count=getattr(vocab, 'count', 0),
+            sample_int=getattr(vocab, 'sample_int', 0))
+        for attr in ('code', 'point'):
+            if hasattr(vocab, attr):
+                self.set_code(row, self.codes if attr == 'code' else self.points, getattr(vocab, attr))
+
+    def __delitem__(self, word):
+        del self.slots[word]
+
+    def __contains__(self, word):
+        return word in self.slots
+
+    def __iter__(self):
+        return iter(self.slots)
+
+    def __len__(self):
+        return len(self.slots)
+
+
+def _word_hash(word_bytes):
+    """Process-independent hash of a utf8 bytestring, used for the on-disk word lookup table."""
+    return zlib.crc32(word_bytes) & 0xffffffff
+
+
+class MmapVocab(Mapping):
+    """
+    Read-only `word => Vocab` mapping backed by flat arrays, as stored by
+    `KeyedVectors.save_mmappable()`.
+
+    The words live in one utf8 byte array (`strings`) delimited by `offsets`; lookups go
+    through an open-addressing hash table (`table`, -1 = empty slot). All arrays can be
+    mmap'ed, so no per-word Python objects are created until a word is actually queried.
+
+    """
+    def __init__(self, strings, offsets, table, counts):
+        self.strings = strings
+        self.offsets = offsets
+        self.table = table
+        self.counts = counts
+
+    def word_bytes(self, index):
+        return self.strings[self.offsets[index]: self.offsets[index + 1]].tostring()
+
+    def word(self, index):
+        return self.word_bytes(index).decode('utf8')
+
+    def lookup(self, word):
+        """Return the index of `word`, or -1 if `word` is not in the vocabulary."""
+        if not isinstance(word, string_types):
+            return -1
+        word = utils.to_utf8(word)
+        mask = len(self.table) - 1
+        slot = _word_hash(word) & mask
+        while True:
+            index = self.table[slot]
+            if index < 0:
+                return -1
+            if self.word_bytes(index) == word:
+                return int(index)
+            slot = (slot + 1) & mask
+
+    def __getitem__(self, word):
+        index = self.lookup(word)
+        if index < 0:
+            raise KeyError(word)
+        return Vocab(index=index, count=int(self.counts[index]))
+
+    def __contains__(self, word):
+        return self.lookup(word) >= 0
+
+    def __iter__(self):
+        for index in xrange(len(self)):
+            yield self.word(index)
+
+    def __len__(self):
+        return len(self.counts)
+
+
+class MmapIndex2Word(Sequence):
+    """Read-only `index => word` sequence over the string table of a `MmapVocab`."""
+    def __init__(self, vocab):
+        self.vocab = vocab
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.vocab.word(i) for i in xrange(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("word index %s out of range" % index)
+        return self.vocab.word(index)
+
+    def __len__(self):
+        return len(self.vocab)
+
+
 class KeyedVectors(utils.SaveLoad):
     """
     Class to contain vectors and vocab for the Word2Vec training class and other w2v methods not directly
@@ -114,7 +533,8 @@ class KeyedVectors(utils.SaveLoad):
     def __init__(self):
         self.syn0 = []
         self.syn0norm = None
-        self.vocab = {}
+        self.syn0_norms = None  # L2 norm of each row of syn0, when normalizing on the fly instead of syn0norm
+        self.vocab = CompactVocab()
         self.index2word = []
         self.vector_size = None
 
@@ -123,6 +543,76 @@ class KeyedVectors(utils.SaveLoad):
         kwargs['ignore'] = kwargs.get('ignore', ['syn0norm'])
         super(KeyedVectors, self).save(*args, **kwargs)
 
+    def save_mmappable(self, fname, norms_only=False):
+        """
+        Store the vectors, their L2-normalized version and the vocabulary as flat `.npy` arrays
+        in `fname.*.npy`, plus a short text header in `fname`.
+
+        Unlike `save()`, nothing is pickled: `load_mmappable()` memory-maps all arrays, so loading
+        takes milliseconds regardless of vocabulary size and processes that load the same file
+        share one copy of it in the OS page cache.
+
+        If `norms_only` is set, only the L2 norm of each vector is stored instead of the normalized
+        vectors, and the loaded instance normalizes on the fly (see `init_sims`).
+
+        """
+        self.init_sims(norms_only=norms_only)
+        words = [utils.to_utf8(word) for word in self.index2word]
+        offsets = zeros(len(words) + 1, dtype=int64)
+        offsets[1:] = cumsum([len(word) for word in words])
+        strings = fromstring(b''.join(words), dtype=uint8)
+
+        # open-addressing hash table with load factor <= 0.5, linear probing
+        table_size = 1
+        while table_size < 2 * len(words):
+            table_size *= 2
+        table = -ones(table_size, dtype=int64)
+        mask = table_size - 1
+        for index, word in enumerate(words):
+            slot = _word_hash(word) & mask
+            while table[slot] >= 0:
+                slot = (slot + 1) & mask
+            table[slot] = index
+        counts = array([self.vocab[word].count or 0 for word in self.index2word], dtype=int64)
+
+        if norms_only:
+            normalized = ('norms', self.syn0_norms)
+        else:
+            normalized = ('vectors_norm', self._norm_vectors(slice(None)))
+        logger.info("storing %s vectors and vocabulary into %s.*.npy", self.syn0.shape, fname)
+        for suffix, arr in [
+                ('vectors', self.syn0), normalized, ('strings', strings),
+                ('offsets', offsets), ('table', table), ('counts', counts)]:
+            np_save('%s.%s.npy' % (fname, suffix), ascontiguousarray(arr))
+        with utils.smart_open(fname, 'wb') as fout:
+            fout.write(utils.to_utf8("%s %s%s\n" % (self.syn0.shape + (' norms' if norms_only else '',))))
+
+    @classmethod
+    def load_mmappable(cls, fname, mmap='r'):
+        """
+        Load vectors stored by `save_mmappable()`. With the default `mmap='r'`, the vectors and
+        the vocabulary are memory-mapped read-only; `vocab` and `index2word` are lazy views that
+        look up words directly in the mapped arrays. Use `mmap=None` to read everything into RAM.
+
+        """
+        with utils.smart_open(fname) as fin:
+            header = fin.readline().split()
+        num_words, vector_size = map(int, header[:2])
+        logger.info("loading %sx%s vectors from %s.*.npy with mmap=%s", num_words, vector_size, fname, mmap)
+        normalized = 'norms' if header[2:] == [b'norms'] else 'vectors_norm'
+        arrays = dict(
+            (suffix, np_load('%s.%s.npy' % (fname, suffix), mmap_mode=mmap))
+            for suffix in ['vectors', normalized, 'strings', 'offsets', 'table', 'counts'])
+        result = cls()
+        result.vector_size = vector_size
+        result.syn0 = arrays['vectors']
+        result.syn0norm = arrays.get('vectors_norm')
+        result.syn0_norms = arrays.get('norms')
+        result.vocab = MmapVocab(arrays['strings'], arrays['offsets'], arrays['table'], arrays['counts'])
+        result.index2word = MmapIndex2Word(result.vocab)
+        assert (len(result.vocab), vector_size) == result.syn0.shape
+        return result
+
     def save_word2vec_format(self, fname, fvocab=None, binary=False, total_vec=None):
         """
         Store the input-hidden weight matrix in the same format used by the original
@@ -159,7 +649,7 @@ class KeyedVectors(utils.SaveLoad):
 
     @classmethod
     def load_word2vec_format(cls, fname, fvocab=None, binary=False, encoding='utf8', unicode_errors='strict',
-                             limit=None, datatype=REAL):
+                             limit=None, datatype=REAL, chunk_size=LOAD_CHUNK_SIZE):
         """
         Load the input-hidden weight matrix from the original C word2vec-tool format.
 
@@ -187,6 +677,9 @@ class KeyedVectors(utils.SaveLoad):
         as np.float16) to save memory. (Such types may result in much slower bulk operations
         or incompatibility with optimized routines.)
 
+        `chunk_size` is the approximate number of bytes read and converted at once. Larger
+        chunks mean fewer Python-level operations per word, at the cost of more temporary memory.
+
         """
         counts = None
         if fvocab is not None:
@@ -207,50 +700,39 @@ class KeyedVectors(utils.SaveLoad):
             result.vector_size = vector_size
             result.syn0 = zeros((vocab_size, vector_size), dtype=datatype)
 
-            def add_word(word, weights):
-                word_id = len(result.vocab)
-                if word in result.vocab:
-                    logger.warning("duplicate word '%s' in %s, ignoring all but first", word, fname)
-                    return
-                if counts is None:
-                    # most common scenario: no vocab file given. just make up some bogus counts, in descending order
-                    result.vocab[word] = Vocab(index=word_id, count=vocab_size - word_id)
-                elif word in counts:
-                    # use count from the vocab file
-                    result.vocab[word] = Vocab(index=word_id, count=counts[word])
-                else:
-                    # vocab file given, but word is missing -- set count to None (TODO: or raise?)
-                    logger.warning("vocabulary file is incomplete: '%s' is missing", word)
-                    result.vocab[word] = Vocab(index=word_id, count=None)
-                result.syn0[word_id] = weights
-                result.index2word.append(word)
-
+            def add_words(words, weights):
+                """Add a block of (word, weights row) pairs, skipping duplicates; fill syn0 in one slice."""
+                keep = []
+                for pos, word in enumerate(words):
+                    word_id = len(result.vocab)
+                    if word in result.vocab:
+                        logger.warning("duplicate word '%s' in %s, ignoring all but first", word, fname)
+                        continue
+                    if counts is None:
+                        # most common scenario: no vocab file given. just make up some bogus counts, in descending order
+                        result.vocab.add(word, index=word_id, count=vocab_size - word_id)
+                    elif word in counts:
+                        # use count from the vocab file
+                        result.vocab.add(word, index=word_id, count=counts[word])
+                    else:
+                        # vocab file given, but word is missing -- set count to None (TODO: or raise?)
+                        logger.warning("vocabulary file is incomplete: '%s' is missing", word)
+                        result.vocab.add(word, index=word_id, count=None)
+                    result.index2word.append(word)
+                    keep.append(pos)
+                start = len(result.vocab) - len(keep)
+                if len(keep) != len(words):
+                    weights = weights[keep]
+                result.syn0[start: start + len(keep)] = weights
+
+            # parse whole buffers at once, instead of byte-by-byte / value-by-value
             if binary:
-                binary_len = dtype(REAL).itemsize * vector_size
-                for line_no in xrange(vocab_size):
-                    # mixed text and binary: read text first, then binary
-                    word = []
-                    while True:
-                        ch = fin.read(1)
-                        if ch == b' ':
-                            break
-                        if ch == b'':
-                            raise EOFError("unexpected end of input; is count incorrect or file otherwise damaged?")
-                        if ch != b'\n':  # ignore newlines in front of words (some binary files have)
-                            word.append(ch)
-                    word = utils.to_unicode(b''.join(word), encoding=encoding, errors=unicode_errors)
-                    weights = fromstring(fin.read(binary_len), dtype=REAL)
-                    add_word(word, weights)
+                blocks = _iter_binary_blocks(fin, vocab_size, vector_size, chunk_size)
             else:
-                for line_no in xrange(vocab_size):
-                    line = fin.readline()
-                    if line == b'':
-                        raise EOFError("unexpected end of input; is count incorrect or file otherwise damaged?")
-                    parts = utils.to_unicode(line.rstrip(), encoding=encoding, errors=unicode_errors).split(" ")
-                    if len(parts) != vector_size + 1:
-                        raise ValueError("invalid vector on line %s (is this really the text format?)" % (line_no))
-                    word, weights = parts[0], list(map(REAL, parts[1:]))
-                    add_word(word, weights)
+                blocks = _iter_text_blocks(fin, vocab_size, vector_size, chunk_size)
+            for raw_words, weights in blocks:
+                words = [word.decode(encoding, unicode_errors) for word in raw_words]
+                add_words(words, weights)
         if result.syn0.shape[0] != len(result.vocab):
             logger.info(
                 "duplicate words detected, shrinking matrix size from %i to %i",
@@ -277,7 +759,7 @@ class KeyedVectors(utils.SaveLoad):
         """
         if word in self.vocab:
             if use_norm:
-                return self.syn0norm[self.vocab[word].index]
+                return self._norm_vectors(self.vocab[word].index)
             else:
                 return self.syn0[self.vocab[word].index]
         else:
@@ -307,7 +789,48 @@ class KeyedVectors(utils.SaveLoad):
 
         """
         self.init_sims()
+        mean, all_words = self._weighted_mean(positive, negative)
+
+        if indexer is not None:
+            return indexer.most_similar(mean, topn)
+
+        dists = self._norm_dot(mean, restrict_vocab)
+        if not topn:
+            return dists
+        best = matutils.argsort(dists, topn=topn + len(all_words), reverse=True)
+        # ignore (don't return) words from the input
+        result = [(self.index2word[sim], float(dists[sim])) for sim in best if sim not in all_words]
+        return result[:topn]
+
+    def _norm_vectors(self, indexes):
+        """Return the normalized vectors of the words at vocabulary `indexes` (int, int array or slice)."""
+        if self.syn0norm is None:
+            return self.syn0[indexes] / self.syn0_norms[indexes][..., newaxis]
+        return self.syn0norm[indexes]
 
+    def _norm_dot(self, vectors, restrict_vocab=None):
+        """
+        Return the dot products of `vectors` with the normalized vectors of all words (or of the first
+        `restrict_vocab` words only). For a 2D array of vectors, returns one row of dot products per vector.
+        Without `syn0norm`, the dot products with the raw vectors are divided by the vector norms instead.
+        """
+        vectors = asarray(vectors)
+        if self.syn0norm is None:
+            limited = self.syn0[:restrict_vocab]
+            norms = self.syn0_norms[:restrict_vocab]
+            if vectors.ndim == 1:
+                return dot(limited, vectors) / norms
+            return dot(vectors, limited.T) / norms
+        limited = self.syn0norm if restrict_vocab is None else self.syn0norm[:restrict_vocab]
+        if vectors.ndim == 1:
+            return dot(limited, vectors)
+        return dot(vectors, limited.T)
+
+    def _weighted_mean(self, positive, negative):
+        """
+        Return the unit-length weighted mean of the `positive` and `negative` words or vectors
+        (in the format accepted by `most_similar`), plus the set of vocabulary indexes of the input words.
+        """
         if isinstance(positive, string_types) and not negative:
             # allow calls like most_similar('dog'), as a shorthand for most_similar(['dog'])
             positive = [positive]
@@ -333,19 +856,71 @@ class KeyedVectors(utils.SaveLoad):
                     all_words.add(self.vocab[word].index)
         if not mean:
             raise ValueError("cannot compute similarity with no input")
-        mean = matutils.unitvec(array(mean).mean(axis=0)).astype(REAL)
+        return matutils.unitvec(array(mean).mean(axis=0)).astype(REAL), all_words
 
-        if indexer is not None:
-            return indexer.most_similar(mean, topn)
+    def _most_similar_rows(self, means, topn, restrict_vocab=None, exclude=None):
+        """
+        Return the indexes (2D int array, one row per row of `means`) of the `topn` vectors most similar to
+        each of the unit-length query `means`, plus their cosine similarities, in descending order.
 
-        limited = self.syn0norm if restrict_vocab is None else self.syn0norm[:restrict_vocab]
-        dists = dot(limited, mean)
-        if not topn:
-            return dists
-        best = matutils.argsort(dists, topn=topn + len(all_words), reverse=True)
-        # ignore (don't return) words from the input
-        result = [(self.index2word[sim], float(dists[sim])) for sim in best if sim not in all_words]
-        return result[:topn]
+        `exclude` is an optional sequence of vocabulary indexes to ignore, one for each query. The similarities
+        are computed in blocks of queries, so that at most `SIMILARITY_BLOCK_SIZE` of them are held in memory.
+        Excluded (or missing, if `topn` exceeds the number of candidates) results have similarity `-inf`.
+        """
+        num_vectors = len(self.index2word) if restrict_vocab is None else min(restrict_vocab, len(self.index2word))
+        topn = min(topn, num_vectors)
+        indexes = empty((len(means), topn), dtype=int64)
+        sims = empty((len(means), topn), dtype=REAL)
+        block_size = max(1, SIMILARITY_BLOCK_SIZE // max(1, num_vectors))
+        for start in xrange(0, len(means), block_size):
+            dists = self._norm_dot(means[start: start + block_size], restrict_vocab)
+            if exclude is not None:
+                for row, excluded in enumerate(exclude[start: start + block_size]):
+                    excluded = array(list(excluded), dtype=int64)
+                    dists[row, excluded[excluded < num_vectors]] = -inf
+            if topn < num_vectors:
+                best = argpartition(-dists, topn - 1, axis=1)[:, :topn]
+            else:
+                best = repeat(arange(num_vectors)[newaxis, :], len(dists), axis=0)
+            best_dists = dists[arange(len(dists))[:, newaxis], best]
+            order = argsort(-best_dists, axis=1, kind='mergesort')
+            rows = arange(len(dists))[:, newaxis]
+            indexes[start: start + len(dists)] = best[rows, order]
+            sims[start: start + len(dists)] = best_dists[rows, order]
+        return indexes, sims
+
+    def most_similar_batch(self, positive, negative=None, topn=10, restrict_vocab=None):
+        """
+        Find the top-N most similar words for many queries at once. Equivalent to (but much faster than)
+        `[most_similar(p, n, topn, restrict_vocab) for p, n in zip(positive, negative)]`.
+
+        `positive` is a sequence of queries, each in the format accepted by the `positive` argument of
+        `most_similar`: a word, or a list of words, vectors or (word, weight) tuples. `negative` is an
+        optional sequence of the same length, with the negative words for each query.
+
+        All queries are scored against the normalized vectors with one matrix-matrix product per block
+        of queries, instead of one matrix-vector product per query. As in `most_similar`, the input words
+        of each query are never returned.
+
+        Example::
+
+          >>> trained_model.most_similar_batch([['woman', 'king'], ['paris', 'germany']], [['man'], ['france']])
+          [[('queen', 0.50882536), ...], [('berlin', 0.61563426), ...]]
+
+        """
+        self.init_sims()
+        if negative is None:
+            negative = [[]] * len(positive)
+        if len(positive) != len(negative):
+            raise ValueError("got %i positive but %i negative queries" % (len(positive), len(negative)))
+        if not len(positive):
+            return []
+        means, exclude = zip(*[self._weighted_mean(pos, neg) for pos, neg in izip(positive, negative)])
+        indexes, sims = self._most_similar_rows(array(means), topn, restrict_vocab, exclude)
+        return [
+            [(self.index2word[index], float(sim)) for index, sim in izip(row_indexes, row_sims) if sim > -inf]
+            for row_indexes, row_sims in izip(indexes, sims)
+        ]
 
     def wmdistance(self, document1, document2):
         """
@@ -398,45 +973,44 @@ class KeyedVectors(utils.SaveLoad):
                         'in the vocabulary. Aborting (returning inf).')
             return float('inf')
 
-        dictionary = Dictionary(documents=[document1, document2])
-        vocab_len = len(dictionary)
-
-        if vocab_len == 1:
-            # Both documents are composed by a single unique token
-            return 0.0
-
-        # Sets for faster look-up.
-        docset1 = set(document1)
-        docset2 = set(document2)
-
-        # Compute distance matrix.
-        distance_matrix = zeros((vocab_len, vocab_len), dtype=double)
-        for i, t1 in dictionary.items():
-            for j, t2 in dictionary.items():
-                if not t1 in docset1 or not t2 in docset2:
-                    continue
-                # Compute Euclidean distance between word vectors.
-                distance_matrix[i, j] = sqrt(np_sum((self[t1] - self[t2])**2))
-
-        if np_sum(distance_matrix) == 0.0:
-            # `emd` gets stuck if the distance matrix contains only zeros.
-            logger.info('The distance matrix is all zeros. Aborting (returning inf).')
-            return float('inf')
-
-        def nbow(document):
-            d = zeros(vocab_len, dtype=double)
-            nbow = dictionary.doc2bow(document)  # Word frequencies.
-            doc_len = len(document)
-            for idx, freq in nbow:
-                d[idx] = freq / float(doc_len)  # Normalized word frequencies.
-            return d
+        # Compute nBOW representation of documents, and all Euclidean distances between their words at once.
+        oov = {}
+        ids1, weights1 = self._nbow(document1, oov)
+        ids2, weights2 = self._nbow(document2, oov)
+        distances = cdist(self._nbow_vectors(ids1, oov), self._nbow_vectors(ids2, oov))
+        return wmd_from_distances(ids1, weights1, ids2, weights2, distances)
 
-        # Compute nBOW representation of documents.
-        d1 = nbow(document1)
-        d2 = nbow(document2)
+    def _nbow(self, document, oov=None):
+        """
+        Return the nBOW representation of `document` (a list of words): the sorted ids of its unique words,
+        and their frequencies normalized to sum up to 1 (empty arrays if there are none).
 
-        # Compute WMD.
-        return emd(d1, d2, distance_matrix)
+        Words in the vocabulary are identified by their vocabulary index. Words that have a vector without
+        being in the vocabulary (such as fastText's out-of-vocabulary words) are numbered from `len(self.syn0)`
+        on, in the dict `oov` (word -> id), which is updated in place; without `oov`, they are skipped.
+        """
+        indexes = []
+        for token in document:
+            if token in self.vocab:
+                indexes.append(self.vocab[token].index)
+            elif oov is not None and token in self:
+                if token not in oov:
+                    oov[token] = len(self.syn0) + len(oov)
+                indexes.append(oov[token])
+        if not indexes:
+            return zeros(0, dtype=int64), zeros(0, dtype=double)
+        ids, counts = unique(array(indexes, dtype=int64), return_counts=True)
+        return ids, counts / float(len(indexes))
+
+    def _nbow_vectors(self, ids, oov):
+        """Return the vectors of the words `ids`, numbered by `_nbow` with the out-of-vocabulary words `oov`."""
+        ids = asarray(ids, dtype=int64)
+        vectors = self.syn0[minimum(ids, len(self.syn0) - 1)]
+        if oov:
+            id2word = dict((wordid, word) for word, wordid in iteritems(oov))
+            for position in flatnonzero(ids >= len(self.syn0)):
+                vectors[position] = self[id2word[ids[position]]]
+        return vectors
 
     def most_similar_cosmul(self, positive=[], negative=[], topn=10):
         """
@@ -483,8 +1057,8 @@ class KeyedVectors(utils.SaveLoad):
 
         # equation (4) of Levy & Goldberg "Linguistic Regularities...",
         # with distances shifted to [0,1] per footnote (7)
-        pos_dists = [((1 + dot(self.syn0norm, term)) / 2) for term in positive]
-        neg_dists = [((1 + dot(self.syn0norm, term)) / 2) for term in negative]
+        pos_dists = [((1 + self._norm_dot(term)) / 2) for term in positive]
+        neg_dists = [((1 + self._norm_dot(term)) / 2) for term in negative]
         dists = prod(pos_dists, axis=0) / (prod(neg_dists, axis=0) + 0.000001)
 
         if not topn:
@@ -552,7 +1126,7 @@ class KeyedVectors(utils.SaveLoad):
             logger.warning("vectors for words %s are not present in the model, ignoring these words", ignored_words)
         if not used_words:
             raise ValueError("cannot select a word from an empty list")
-        vectors = vstack(self.word_vec(word, use_norm=True) for word in used_words).astype(REAL)
+        vectors = vstack([self.word_vec(word, use_norm=True) for word in used_words]).astype(REAL)
         mean = matutils.unitvec(vectors.mean(axis=0)).astype(REAL)
         dists = dot(vectors, mean)
         return sorted(zip(dists, used_words))[0][1]
@@ -635,7 +1209,7 @@ class KeyedVectors(utils.SaveLoad):
                         (section['section'], 100.0 * correct / (correct + incorrect),
                          correct, correct + incorrect))
 
-    def accuracy(self, questions, restrict_vocab=30000, most_similar=most_similar, case_insensitive=True):
+    def accuracy(self, questions, restrict_vocab=30000, most_similar=None, case_insensitive=True):
         """
         Compute accuracy of the model. `questions` is a filename where lines are
         4-tuples of words, split into sections by ": SECTION NAME" lines.
@@ -654,22 +1228,23 @@ class KeyedVectors(utils.SaveLoad):
         and question words. In case of multiple case variants of a single word, the vector for the first
         occurrence (also the most frequent if vocabulary is sorted) is taken.
 
+        By default, all questions are answered at once with batched cosine similarity look-ups
+        (see `most_similar_batch`). Pass a function like `KeyedVectors.most_similar_cosmul` as `most_similar`
+        to answer the questions one by one with that function instead.
+
         This method corresponds to the `compute-accuracy` script of the original C word2vec.
 
         """
         ok_vocab = [(w, self.vocab[w]) for w in self.index2word[:restrict_vocab]]
         ok_vocab = dict((w.upper(), v) for w, v in reversed(ok_vocab)) if case_insensitive else dict(ok_vocab)
 
-        sections, section = [], None
+        sections, section, questions_ok = [], None, []
         for line_no, line in enumerate(utils.smart_open(questions)):
-            # TODO: use level3 BLAS (=evaluate multiple questions at once), for speed
             line = utils.to_unicode(line)
             if line.startswith(': '):
-                # a new section starts => store the old section
-                if section:
-                    sections.append(section)
-                    self.log_accuracy(section)
+                # a new section starts
                 section = {'section': line.lstrip(': ').strip(), 'correct': [], 'incorrect': []}
+                sections.append(section)
             else:
                 if not section:
                     raise ValueError("missing section header before line #%i in %s" % (line_no, questions))
@@ -684,27 +1259,23 @@ class KeyedVectors(utils.SaveLoad):
                 if a not in ok_vocab or b not in ok_vocab or c not in ok_vocab or expected not in ok_vocab:
                     logger.debug("skipping line #%i with OOV words: %s" % (line_no, line.strip()))
                     continue
+                questions_ok.append((section, line.strip(), (a, b, c, expected)))
 
-                original_vocab = self.vocab
-                self.vocab = ok_vocab
-                ignore = set([a, b, c])  # input words to be ignored
-                predicted = None
-                # find the most likely prediction, ignoring OOV words and input words
-                sims = most_similar(self, positive=[b, c], negative=[a], topn=False, restrict_vocab=restrict_vocab)
-                self.vocab = original_vocab
-                for index in matutils.argsort(sims, reverse=True):
-                    predicted = self.index2word[index].upper() if case_insensitive else self.index2word[index]
-                    if predicted in ok_vocab and predicted not in ignore:
-                        if predicted != expected:
-                            logger.debug("%s: expected %s, predicted %s", line.strip(), expected, predicted)
-                        break
-                if predicted == expected:
-                    section['correct'].append((a, b, c, expected))
-                else:
-                    section['incorrect'].append((a, b, c, expected))
-        if section:
-            # store the last section, too
-            sections.append(section)
+        if most_similar is None:
+            predictions = self._predict_analogies(
+                [question for _, _, question in questions_ok], ok_vocab, restrict_vocab, case_insensitive)
+        else:
+            predictions = [
+                self._predict_analogy(question, ok_vocab, restrict_vocab, case_insensitive, most_similar)
+                for _, _, question in questions_ok]
+
+        for (section, line, question), predicted in izip(questions_ok, predictions):
+            if predicted == question[3]:
+                section['correct'].append(question)
+            else:
+                logger.debug("%s: expected %s, predicted %s", line, question[3], predicted)
+                section['incorrect'].append(question)
+        for section in sections:
             self.log_accuracy(section)
 
         total = {
@@ -716,6 +1287,47 @@ class KeyedVectors(utils.SaveLoad):
         sections.append(total)
         return sections
 
+    def _predict_analogy(self, question, ok_vocab, restrict_vocab, case_insensitive, most_similar):
+        """Answer a single `accuracy` question (a, b, c, expected) with the `most_similar` function."""
+        a, b, c, _ = question
+        original_vocab = self.vocab
+        self.vocab = ok_vocab
+        ignore = set([a, b, c])  # input words to be ignored
+        predicted = None
+        # find the most likely prediction, ignoring OOV words and input words
+        sims = most_similar(self, positive=[b, c], negative=[a], topn=False, restrict_vocab=restrict_vocab)
+        self.vocab = original_vocab
+        for index in matutils.argsort(sims, reverse=True):
+            predicted = self.index2word[index].upper() if case_insensitive else self.index2word[index]
+            if predicted in ok_vocab and predicted not in ignore:
+                break
+        return predicted
+
+    def _predict_analogies(self, questions, ok_vocab, restrict_vocab, case_insensitive):
+        """
+        Answer all `accuracy` questions (a, b, c, expected) at once with batched cosine similarity,
+        ignoring all (case) variants of the input words. The results are the same as with `most_similar`.
+        """
+        if not questions:
+            return []
+        self.init_sims()
+        # all vocabulary indexes of each (normalized) word, to be excluded from the answers
+        variants = {}
+        for index, word in enumerate(self.index2word[:restrict_vocab]):
+            variants.setdefault(word.upper() if case_insensitive else word, []).append(index)
+        means, exclude = [], []
+        for a, b, c, _ in questions:
+            vec_a, vec_b, vec_c = self._norm_vectors([ok_vocab[a].index, ok_vocab[b].index, ok_vocab[c].index])
+            mean = vec_b + vec_c - vec_a
+            means.append(matutils.unitvec(mean / 3.0))
+            exclude.append(variants[a] + variants[b] + variants[c])
+        indexes, sims = self._most_similar_rows(array(means, dtype=REAL), 1, restrict_vocab, exclude)
+        predictions = []
+        for index in indexes[:, 0]:
+            predicted = self.index2word[index]
+            predictions.append(predicted.upper() if case_insensitive else predicted)
+        return predictions
+
     @staticmethod
     def log_evaluate_word_pairs(pearson, spearman, oov, pairs):
         logger.info('Pearson correlation coefficient against %s: %.4f', pairs, pearson[0])
@@ -751,12 +1363,9 @@ class KeyedVectors(utils.SaveLoad):
         ok_vocab = dict((w.upper(), v) for w, v in reversed(ok_vocab)) if case_insensitive else dict(ok_vocab)
 
         similarity_gold = []
-        similarity_model = []
+        pairs_model = []  # vocabulary indexes of each word pair; None for pairs with unknown words
         oov = 0
 
-        original_vocab = self.vocab
-        self.vocab = ok_vocab
-
         for line_no, line in enumerate(utils.smart_open(pairs)):
             line = utils.to_unicode(line)
             if line.startswith('#'):
@@ -775,15 +1384,23 @@ class KeyedVectors(utils.SaveLoad):
                 if a not in ok_vocab or b not in ok_vocab:
                     oov += 1
                     if dummy4unknown:
-                        similarity_model.append(0.0)
+                        pairs_model.append(None)
                         similarity_gold.append(sim)
                         continue
                     else:
                         logger.debug('skipping line #%d with OOV words: %s', line_no, line.strip())
                         continue
                 similarity_gold.append(sim)  # Similarity from the dataset
-                similarity_model.append(self.similarity(a, b))  # Similarity from the model
-        self.vocab = original_vocab
+                pairs_model.append((ok_vocab[a].index, ok_vocab[b].index))
+
+        # Similarity from the model, computed for all known pairs at once (zero for pairs with unknown words)
+        similarity_model = zeros(len(pairs_model), dtype=REAL)
+        known = array([pair is not None for pair in pairs_model], dtype=bool)
+        if known.any():
+            self.init_sims()
+            rows_a, rows_b = zip(*[pair for pair in pairs_model if pair is not None])
+            similarity_model[known] = einsum(
+                'ij,ij->i', self._norm_vectors(array(rows_a, dtype=int64)), self._norm_vectors(array(rows_b, dtype=int64)))
         spearman = stats.spearmanr(similarity_gold, similarity_model)
         pearson = stats.pearsonr(similarity_gold, similarity_model)
         oov_ratio = float(oov) / (len(similarity_gold) + oov) * 100
@@ -800,8 +1417,7 @@ class KeyedVectors(utils.SaveLoad):
         self.log_evaluate_word_pairs(pearson, spearman, oov_ratio, pairs)
         return pearson, spearman, oov_ratio
 
-
-    def init_sims(self, replace=False):
+    def init_sims(self, replace=False, norms_only=False):
         """
         Precompute L2-normalized vectors.
 
@@ -811,8 +1427,18 @@ class KeyedVectors(utils.SaveLoad):
         Note that you **cannot continue training** after doing a replace. The model becomes
         effectively read-only = you can call `most_similar`, `similarity` etc., but not `train`.
 
+        If `norms_only` is set, keep the original vectors and only precompute the L2 norm of each
+        vector (dropping `syn0norm`, if any). Similarities are then computed by dividing the dot products
+        with the original vectors by these norms, so memory is not doubled and training can continue.
+        Call `clear_sims()` on the model after further training, as for `syn0norm`.
+
         """
-        if getattr(self, 'syn0norm', None) is None or replace:
+        if norms_only and not replace:
+            if getattr(self, 'syn0_norms', None) is None:
+                logger.info("precomputing L2-norms of word weight vectors, without normalized vectors")
+                self.syn0_norms = sqrt(einsum('ij,ij->i', self.syn0, self.syn0)).astype(REAL)
+            self.syn0norm = None
+        elif (getattr(self, 'syn0norm', None) is None and getattr(self, 'syn0_norms', None) is None) or replace:
             logger.info("precomputing L2-norms of word weight vectors")
             if replace:
                 for i in xrange(self.syn0.shape[0]):
@@ -820,6 +1446,7 @@ class KeyedVectors(utils.SaveLoad):
                 self.syn0norm = self.syn0
             else:
                 self.syn0norm = (self.syn0 / sqrt((self.syn0 ** 2).sum(-1))[..., newaxis]).astype(REAL)
+            self.syn0_norms = None
 
     def get_embedding_layer(self, train_embeddings=False):
         """
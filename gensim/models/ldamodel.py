@@ -44,7 +44,8 @@ from gensim.matutils import kullback_leibler, hellinger, jaccard_distance
 from itertools import chain
 from scipy.special import gammaln, psi  # gamma function utils
 from scipy.special import polygamma
-from six.moves import xrange
+import scipy.sparse
+from six.moves import xrange, zip as izip
 import six
 
 # log(sum(exp(x))) that tries to avoid overflow
@@ -59,6 +60,19 @@ except ImportError:
 logger = logging.getLogger('gensim.models.ldamodel')
 
 
+def _ids_counts(doc):
+    """
+    Return the term ids (as a list of ints) and the counts (as a numpy array)
+    of the bag-of-words document `doc`.
+    """
+    if len(doc) > 0 and not isinstance(doc[0][0], six.integer_types + (np.integer,)):
+        # make sure the term IDs are ints, otherwise np will get upset
+        ids = [int(id) for id, _ in doc]
+    else:
+        ids = [id for id, _ in doc]
+    return ids, np.array([cnt for _, cnt in doc])
+
+
 def update_dir_prior(prior, N, logphat, rho):
     """
     Updates a given prior using Newton's method, described in
@@ -403,16 +417,26 @@ class LdaModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
         optimization presented in **Lee, Seung: Algorithms for non-negative matrix factorization, NIPS 2001**.
 
         """
-        try:
-            _ = len(chunk)
-        except:
-            # convert iterators/generators to plain list, so we have len() etc.
-            chunk = list(chunk)
-        if len(chunk) > 1:
-            logger.debug("performing inference on a chunk of %i documents", len(chunk))
+        if scipy.sparse.issparse(chunk):
+            # documents are the columns of a sparse matrix (see `interfaces.CorpusABC.iter_chunks`)
+            chunk = chunk.tocsc()
+            num_docs = chunk.shape[1]
+            docs = (
+                (chunk.indices[start:end], chunk.data[start:end])
+                for start, end in izip(chunk.indptr[:-1], chunk.indptr[1:]))
+        else:
+            try:
+                _ = len(chunk)
+            except:
+                # convert iterators/generators to plain list, so we have len() etc.
+                chunk = list(chunk)
+            num_docs = len(chunk)
+            docs = (_ids_counts(doc) for doc in chunk)
+        if num_docs > 1:
+            logger.debug("performing inference on a chunk of %i documents", num_docs)
 
         # Initialize the variational distribution q(theta|gamma) for the chunk
-        gamma = self.random_state.gamma(100., 1. / 100., (len(chunk), self.num_topics))
+        gamma = self.random_state.gamma(100., 1. / 100., (num_docs, self.num_topics))
         Elogtheta = dirichlet_expectation(gamma)
         expElogtheta = np.exp(Elogtheta)
         if collect_sstats:
@@ -425,13 +449,7 @@ class LdaModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
         # Inference code copied from Hoffman's `onlineldavb.py` (esp. the
         # Lee&Seung trick which speeds things up by an order of magnitude, compared
         # to Blei's original LDA-C code, cool!).
-        for d, doc in enumerate(chunk):
-            if len(doc) > 0 and not isinstance(doc[0][0], six.integer_types + (np.integer,)):
-                # make sure the term IDs are ints, otherwise np will get upset
-                ids = [int(id) for id, _ in doc]
-            else:
-                ids = [id for id, _ in doc]
-            cts = np.array([cnt for _, cnt in doc])
+        for d, (ids, cts) in enumerate(docs):
             gammad = gamma[d, :]
             Elogthetad = Elogtheta[d, :]
             expElogthetad = expElogtheta[d, :]
@@ -463,9 +481,9 @@ class LdaModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
                 # statistics for the M step.
                 sstats[:, ids] += np.outer(expElogthetad.T, cts / phinorm)
 
-        if len(chunk) > 1:
+        if num_docs > 1:
             logger.debug("%i/%i documents converged within %i iterations",
-                         converged, len(chunk), self.iterations)
+                         converged, num_docs, self.iterations)
 
         if collect_sstats:
             # This step finishes computing the sufficient statistics for the
@@ -634,22 +652,31 @@ class LdaModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
                 other = LdaState(self.eta, self.state.sstats.shape)
             dirty = False
 
+            if not self.dispatcher and hasattr(corpus, 'iter_chunks'):
+                # the corpus can produce its chunks as sparse matrices, skip the (id, count) tuples
+                chunks = corpus.iter_chunks(chunksize, num_terms=self.num_terms)
+            else:
+                chunks = utils.grouper(corpus, chunksize, as_numpy=chunks_as_numpy)
             reallen = 0
-            for chunk_no, chunk in enumerate(utils.grouper(corpus, chunksize, as_numpy=chunks_as_numpy)):
-                reallen += len(chunk)  # keep track of how many documents we've processed so far
+            for chunk_no, chunk in enumerate(chunks):
+                chunk_len = chunk.shape[1] if scipy.sparse.issparse(chunk) else len(chunk)
+                reallen += chunk_len  # keep track of how many documents we've processed so far
 
                 if eval_every and ((reallen == lencorpus) or ((chunk_no + 1) % (eval_every * self.numworkers) == 0)):
-                    self.log_perplexity(chunk, total_docs=lencorpus)
+                    if scipy.sparse.issparse(chunk):
+                        self.log_perplexity(matutils.Sparse2Corpus(chunk), total_docs=lencorpus)
+                    else:
+                        self.log_perplexity(chunk, total_docs=lencorpus)
 
                 if self.dispatcher:
                     # add the chunk to dispatcher's job queue, so workers can munch on it
                     logger.info('PROGRESS: pass %i, dispatching documents up to #%i/%i',
-                                pass_, chunk_no * chunksize + len(chunk), lencorpus)
+                                pass_, chunk_no * chunksize + chunk_len, lencorpus)
                     # this will eventually block until some jobs finish, because the queue has a small finite length
                     self.dispatcher.putjob(chunk)
                 else:
                     logger.info('PROGRESS: pass %i, at document #%i/%i',
-                                pass_, chunk_no * chunksize + len(chunk), lencorpus)
+                                pass_, chunk_no * chunksize + chunk_len, lencorpus)
                     gammat = self.do_estep(chunk, other)
 
                     if self.optimize_alpha:
@@ -0,0 +1,232 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Licensed under the GNU LGPL v2.1 - http://www.gnu.org/licenses/lgpl.html
+
+"""
+Compressed word vectors, for serving large vector sets from a fraction of the memory.
+
+`QuantizedKeyedVectors` stores the normalized word vectors of a `KeyedVectors` instance
+as small integer codes, plus the length of each original vector. Two methods are supported:
+
+* 'pq' (product quantization): each vector is split into `num_subvectors` parts and every part
+  is replaced by the (one byte) id of its nearest centroid, out of 256 learned by k-means
+  for that part. 300-dimensional vectors take 75 bytes instead of 2 * 1200 bytes (`syn0` + `syn0norm`).
+* 'int8' (scalar quantization): each value is rounded to an int8, with one float scale per vector.
+
+Similarity queries (`most_similar`, `most_similar_batch`, `accuracy` etc.) are answered
+directly from the codes -- with asymmetric distance tables for 'pq' -- and never materialize
+a float matrix of all vectors. `word_vec` reconstructs (approximately) a single vector::
+
+>>> qv = QuantizedKeyedVectors.quantize(model.wv, method='pq')
+>>> qv.most_similar('queen')
+>>> qv.save(fname)
+>>> qv = QuantizedKeyedVectors.load(fname, mmap='r')
+
+To see the memory saved vs. the loss of analogy accuracy, run ``python -m gensim.test.quantizespeed``.
+
+"""
+
+from __future__ import division
+
+import logging
+
+import numpy as np
+from six.moves import xrange
+
+from gensim import utils
+from gensim.models.keyedvectors import KeyedVectors, REAL
+
+
+logger = logging.getLogger(__name__)
+
+BLOCK_SIZE = 4 * 1024 * 1024  # max. number of values decoded or compared at once
+
+
+def _nearest_centroids(data, centroids):
+    """Return the index of the closest (euclidean) centroid, for each row of `data`."""
+    nearest = np.empty(len(data), dtype=np.int32)
+    centroid_norms = (centroids ** 2).sum(axis=1)
+    block_size = max(1, BLOCK_SIZE // len(centroids))
+    for start in xrange(0, len(data), block_size):
+        block = data[start: start + block_size]
+        distances = centroid_norms - 2 * np.dot(block, centroids.T)  # + |block|^2, which doesn't change the argmin
+        nearest[start: start + len(block)] = distances.argmin(axis=1)
+    return nearest
+
+
+def _kmeans(data, num_clusters, iterations, random_state):
+    """Return `num_clusters` centroids of the rows of `data`, found by `iterations` of Lloyd's k-means."""
+    centroids = data[random_state.choice(len(data), num_clusters, replace=False)].copy()
+    for _ in xrange(iterations):
+        assignments = _nearest_centroids(data, centroids)
+        counts = np.bincount(assignments, minlength=num_clusters)
+        for dim in xrange(data.shape[1]):
+            centroids[:, dim] = np.bincount(assignments, weights=data[:, dim], minlength=num_clusters)
+        nonempty = counts > 0
+        centroids[nonempty] /= counts[nonempty, np.newaxis]
+        if not nonempty.all():
+            # restart clusters that lost all their points from random points
+            empty = np.flatnonzero(~nonempty)
+            centroids[empty] = data[random_state.choice(len(data), len(empty), replace=False)]
+    return centroids
+
+
+class QuantizedKeyedVectors(KeyedVectors):
+    """
+    Read-only `KeyedVectors` that keep only quantized codes of the normalized vectors
+    (plus the original vector lengths), instead of the float `syn0` and `syn0norm` matrices.
+
+    Create instances with `QuantizedKeyedVectors.quantize(wv)`.
+
+    """
+    def __init__(self):
+        super(QuantizedKeyedVectors, self).__init__()
+        self.method = None
+        self.vector_size = None
+        self.norms = None  # length of each original vector
+        self.codes = None  # (num_words, num_subvectors) uint8 for 'pq', (num_words, vector_size) int8 for 'int8'
+        self.codebooks = None  # 'pq': (num_subvectors, num_centroids, subvector_size) centroids
+        self.scales = None  # 'int8': scale of each vector's codes
+
+    @classmethod
+    def quantize(cls, wv, method='pq', num_subvectors=None, num_centroids=256, iterations=10, sample_size=None,
+                 seed=1):
+        """
+        Return a new `QuantizedKeyedVectors` with the vocabulary of `wv` (shared, not copied) and its
+        vectors quantized by `method` ('pq' or 'int8').
+
+        For 'pq', `num_subvectors` must divide the vector dimensionality; by default, the vectors are split
+        into parts of about 4 dimensions. The `num_centroids` (at most 256) centroids of each part are learned
+        by `iterations` of k-means over a random sample of `sample_size` vectors (default `256 * num_centroids`).
+
+        """
+        if method not in ('pq', 'int8'):
+            raise ValueError("unknown quantization method %r, expected 'pq' or 'int8'" % method)
+        result = cls()
+        result.method = method
+        result.vocab = wv.vocab
+        result.index2word = wv.index2word
+        num_words, result.vector_size = wv.syn0.shape
+
+        # normalize in blocks, so that no float copy of all vectors is ever created
+        block_size = max(1, BLOCK_SIZE // result.vector_size)
+        blocks = [(start, min(start + block_size, num_words)) for start in xrange(0, num_words, block_size)]
+        result.norms = np.empty(num_words, dtype=REAL)
+        for start, end in blocks:
+            result.norms[start:end] = np.sqrt((wv.syn0[start:end] ** 2).sum(axis=1))
+
+        def normalized(start, end):
+            norms = result.norms[start:end].copy()
+            norms[norms == 0.0] = 1.0
+            return (wv.syn0[start:end] / norms[:, np.newaxis]).astype(REAL)
+
+        if method == 'int8':
+            result.codes = np.empty((num_words, result.vector_size), dtype=np.int8)
+            result.scales = np.empty(num_words, dtype=REAL)
+            for start, end in blocks:
+                block = normalized(start, end)
+                scales = np.abs(block).max(axis=1) / 127
+                scales[scales == 0.0] = 1.0
+                result.codes[start:end] = np.rint(block / scales[:, np.newaxis])
+                result.scales[start:end] = scales
+        else:
+            if num_subvectors is None:
+                num_subvectors = max(
+                    d for d in xrange(1, max(1, result.vector_size // 4) + 1) if result.vector_size % d == 0)
+            if result.vector_size % num_subvectors:
+                raise ValueError(
+                    "num_subvectors=%i doesn't divide vector size %i" % (num_subvectors, result.vector_size))
+            if not 0 < num_centroids <= 256:
+                raise ValueError("num_centroids must be between 1 and 256, got %i" % num_centroids)
+            num_centroids = min(num_centroids, num_words)
+            subvector_size = result.vector_size // num_subvectors
+            random_state = utils.get_random_state(seed)
+            sample_size = min(num_words, sample_size or 256 * num_centroids)
+            sample_ids = np.sort(random_state.choice(num_words, sample_size, replace=False))
+            sample_norms = result.norms[sample_ids]
+            sample_norms[sample_norms == 0.0] = 1.0
+            sample = (wv.syn0[sample_ids] / sample_norms[:, np.newaxis]).astype(REAL)
+            logger.info(
+                "training %i x %i centroids of %i-dimensional subvectors on %i vectors",
+                num_subvectors, num_centroids, subvector_size, sample_size)
+            result.codebooks = np.empty((num_subvectors, num_centroids, subvector_size), dtype=REAL)
+            for part in xrange(num_subvectors):
+                part_slice = slice(part * subvector_size, (part + 1) * subvector_size)
+                result.codebooks[part] = _kmeans(
+                    np.ascontiguousarray(sample[:, part_slice]), num_centroids, iterations, random_state)
+
+            result.codes = np.empty((num_words, num_subvectors), dtype=np.uint8)
+            for start, end in blocks:
+                block = normalized(start, end)
+                for part in xrange(num_subvectors):
+                    part_slice = slice(part * subvector_size, (part + 1) * subvector_size)
+                    result.codes[start:end, part] = _nearest_centroids(block[:, part_slice], result.codebooks[part])
+        logger.info(
+            "quantized %i vectors with %r into %i bytes (%.1fx smaller than float32 vectors)",
+            num_words, method, result.nbytes(), wv.syn0.nbytes / result.nbytes())
+        return result
+
+    def nbytes(self):
+        """Return the number of bytes taken by the quantized vectors (not counting the vocabulary)."""
+        arrays = (self.norms, self.codes, self.codebooks, self.scales)
+        return sum(arr.nbytes for arr in arrays if arr is not None)
+
+    def init_sims(self, replace=False, norms_only=False):
+        """No-op: only the (quantized) normalized vectors are stored, there's nothing to precompute."""
+        pass
+
+    def _norm_vectors(self, indexes):
+        """Reconstruct the (approximate) normalized vectors of the words at vocabulary `indexes`."""
+        codes = self.codes[indexes]
+        if self.method == 'int8':
+            return codes.astype(REAL) * np.asarray(self.scales[indexes])[..., np.newaxis]
+        num_subvectors = self.codebooks.shape[0]
+        parts = self.codebooks[np.arange(num_subvectors), codes]  # (..., num_subvectors, subvector_size)
+        return parts.reshape(codes.shape[:-1] + (self.vector_size,))
+
+    def _norm_dot(self, vectors, restrict_vocab=None):
+        """
+        Return the dot products of `vectors` with the (approximate) normalized vectors of all words,
+        or of the first `restrict_vocab` words only, computed directly from the codes.
+        """
+        vectors = np.asarray(vectors, dtype=REAL)
+        if vectors.ndim == 2:
+            return np.vstack([self._norm_dot(vector, restrict_vocab) for vector in vectors])
+        codes = self.codes if restrict_vocab is None else self.codes[:restrict_vocab]
+        if self.method == 'int8':
+            dists = np.empty(len(codes), dtype=REAL)
+            block_size = max(1, BLOCK_SIZE // self.vector_size)
+            for start in xrange(0, len(codes), block_size):
+                end = min(start + block_size, len(codes))
+                dists[start:end] = np.dot(codes[start:end].astype(REAL), vectors) * self.scales[start:end]
+            return dists
+        # asymmetric distance computation: look up the dot products of each query subvector with all centroids
+        num_subvectors, num_centroids, subvector_size = self.codebooks.shape
+        table = np.einsum('pcd,pd->pc', self.codebooks, vectors.reshape(num_subvectors, subvector_size))
+        dists = np.zeros(len(codes), dtype=REAL)
+        for part in xrange(num_subvectors):
+            dists += table[part][codes[:, part]]
+        return dists
+
+    def word_vec(self, word, use_norm=False):
+        """
+        Accept a single word as input.
+        Returns the word's reconstructed (approximate) vector, as a 1D numpy array.
+
+        If `use_norm` is True, returns the normalized word vector.
+        """
+        if word in self.vocab:
+            index = self.vocab[word].index
+            vector = self._norm_vectors(index)
+            return vector if use_norm else vector * self.norms[index]
+        else:
+            raise KeyError("word '%s' not in vocabulary" % word)
+
+    def dequantize(self):
+        """Return a plain `KeyedVectors` with the reconstructed vectors (e.g. for `save_word2vec_format`)."""
+        result = KeyedVectors()
+        result.vocab = self.vocab
+        result.index2word = self.index2word
+        result.syn0 = self._norm_vectors(slice(None)) * self.norms[:, np.newaxis]
+        return result
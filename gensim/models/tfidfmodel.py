@@ -8,6 +8,8 @@
 import logging
 import math
 
+import numpy as np
+
 from gensim import interfaces, matutils, utils
 from six import iteritems
 
@@ -114,12 +116,25 @@ class TfidfModel(interfaces.TransformationABC):
         logger.info("collecting document frequencies")
         dfs = {}
         numnnz, docno = 0, -1
-        for docno, bow in enumerate(corpus):
-            if docno % 10000 == 0:
-                logger.info("PROGRESS: processing document #%i", docno)
-            numnnz += len(bow)
-            for termid, _ in bow:
-                dfs[termid] = dfs.get(termid, 0) + 1
+        if hasattr(corpus, 'iter_chunks'):
+            # count the documents of each term in sparse matrix chunks, without going through (id, weight) tuples
+            counts = np.zeros(0, dtype=np.int64)
+            for chunk in corpus.iter_chunks(10000):
+                logger.info("PROGRESS: processing document #%i", docno + 1)
+                chunk_counts = np.bincount(chunk.indices, minlength=len(counts))
+                chunk_counts[:len(counts)] += counts
+                counts = chunk_counts
+                numnnz += chunk.nnz
+                docno += chunk.shape[1]
+            termids = np.flatnonzero(counts)
+            dfs = dict(zip(termids.tolist(), counts[termids].tolist()))
+        else:
+            for docno, bow in enumerate(corpus):
+                if docno % 10000 == 0:
+                    logger.info("PROGRESS: processing document #%i", docno)
+                numnnz += len(bow)
+                for termid, _ in bow:
+                    dfs[termid] = dfs.get(termid, 0) + 1
 
         # keep some stats about the training corpus
         self.num_docs = docno + 1
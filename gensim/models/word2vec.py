@@ -109,7 +109,7 @@ import itertools
 import warnings
 
 from gensim.utils import keep_vocab_item, call_on_class_only
-from gensim.models.keyedvectors import KeyedVectors, Vocab
+from gensim.models.keyedvectors import KeyedVectors, Vocab, CompactVocab
 
 try:
     from queue import Queue, Empty
@@ -611,14 +611,14 @@ class Word2Vec(utils.SaveLoad):
                 # make stored settings match these applied settings
                 self.min_count = min_count
                 self.sample = sample
-                self.wv.vocab = {}
+                self.wv.vocab = CompactVocab()
 
             for word, v in iteritems(self.raw_vocab):
                 if keep_vocab_item(word, v, min_count, trim_rule=trim_rule):
                     retain_words.append(word)
                     retain_total += v
                     if not dry_run:
-                        self.wv.vocab[word] = Vocab(count=v, index=len(self.wv.index2word))
+                        self.wv.vocab.add(word, count=v, index=len(self.wv.index2word))
                         self.wv.index2word.append(word)
                 else:
                     drop_unique += 1
@@ -1097,6 +1097,7 @@ class Word2Vec(utils.SaveLoad):
         """
 
         self.wv.syn0norm = None
+        self.wv.syn0_norms = None
 
     def update_weights(self):
         """
@@ -1125,6 +1126,7 @@ class Word2Vec(utils.SaveLoad):
         if self.negative:
             self.syn1neg = vstack([self.syn1neg, zeros((gained_vocab, self.layer1_size), dtype=REAL)])
         self.wv.syn0norm = None
+        self.wv.syn0_norms = None
 
         # do not suppress learning for already learned words
         self.syn0_lockf = ones(len(self.wv.vocab), dtype=REAL)  # zeros suppress learning
@@ -1142,6 +1144,7 @@ class Word2Vec(utils.SaveLoad):
         if self.negative:
             self.syn1neg = zeros((len(self.wv.vocab), self.layer1_size), dtype=REAL)
         self.wv.syn0norm = None
+        self.wv.syn0_norms = None
 
         self.syn0_lockf = ones(len(self.wv.vocab), dtype=REAL)  # zeros suppress learning
 
@@ -1297,14 +1300,14 @@ class Word2Vec(utils.SaveLoad):
         top_indices = matutils.argsort(prob_values, topn=topn, reverse=True)
         return [(self.wv.index2word[index1], prob_values[index1]) for index1 in top_indices]   #returning the most probable output words with their probabilities
 
-    def init_sims(self, replace=False):
+    def init_sims(self, replace=False, norms_only=False):
         """
         init_sims() resides in KeyedVectors because it deals with syn0 mainly, but because syn1 is not an attribute
         of KeyedVectors, it has to be deleted in this class, and the normalizing of syn0 happens inside of KeyedVectors
         """
         if replace and hasattr(self, 'syn1'):
             del self.syn1
-        return self.wv.init_sims(replace)
+        return self.wv.init_sims(replace, norms_only)
 
     def estimate_memory(self, vocab_size=None, report=None):
         """Estimate required memory for a model using current settings and provided vocabulary size."""
@@ -1326,7 +1329,6 @@ class Word2Vec(utils.SaveLoad):
         return KeyedVectors.log_accuracy(section)
 
     def accuracy(self, questions, restrict_vocab=30000, most_similar=None, case_insensitive=True):
-        most_similar = most_similar or KeyedVectors.most_similar
         return self.wv.accuracy(questions, restrict_vocab, most_similar, case_insensitive)
 
     @staticmethod
@@ -52,3 +52,18 @@ cdef void our_saxpy_noblas(const int *N, const float *alpha, const float *X, con
 cdef unsigned long long bisect_left(np.uint32_t *a, unsigned long long x, unsigned long long lo, unsigned long long hi) nogil
 
 cdef unsigned long long random_int32(unsigned long long *next_random) nogil
+
+# flat arrays of a `CompactVocab`, so that training can look up words without any per-word Python objects
+cdef struct VocabArrays:
+    int compact
+    np.uint32_t *indexes
+    np.uint32_t *sample_ints
+    np.int64_t *code_offsets
+    np.int32_t *code_lens
+    np.uint8_t *codes
+    np.uint32_t *points
+
+cdef object init_vocab_arrays(vocab, VocabArrays *arrays)
+
+cdef int lookup_word(vlookup, VocabArrays *arrays, token, int sample, int hs, unsigned long long *next_random,
+                     np.uint32_t *index, int *codelen, np.uint8_t **code, np.uint32_t **point) except -1
@@ -22,6 +22,8 @@ except ImportError:
     # in scipy > 0.15, fblas function has been removed
     import scipy.linalg.blas as fblas
 
+from gensim.models.keyedvectors import CompactVocab
+
 REAL = np.float32
 
 DEF MAX_SENTENCE_LEN = 10000
@@ -254,6 +256,61 @@ cdef unsigned long long fast_sentence_cbow_neg(
     return next_random
 
 
+cdef object init_vocab_arrays(vocab, VocabArrays *arrays):
+    """
+    Fill `arrays` with pointers into `vocab`, if it is a `CompactVocab`.
+
+    Return the object to pass as `vlookup` to `lookup_word()`: the word => row dict
+    of a `CompactVocab`, or `vocab` itself for a plain dict of `Vocab` objects.
+
+    """
+    arrays.compact = isinstance(vocab, CompactVocab)
+    if not arrays.compact:
+        return vocab
+    arrays.indexes = <np.uint32_t *>np.PyArray_DATA(vocab.indexes)
+    arrays.sample_ints = <np.uint32_t *>np.PyArray_DATA(vocab.sample_ints)
+    arrays.code_offsets = <np.int64_t *>np.PyArray_DATA(vocab.code_offsets)
+    arrays.code_lens = <np.int32_t *>np.PyArray_DATA(vocab.code_lens)
+    arrays.codes = <np.uint8_t *>np.PyArray_DATA(vocab.codes)
+    arrays.points = <np.uint32_t *>np.PyArray_DATA(vocab.points)
+    return vocab.slots
+
+
+cdef int lookup_word(vlookup, VocabArrays *arrays, token, int sample, int hs, unsigned long long *next_random,
+                     np.uint32_t *index, int *codelen, np.uint8_t **code, np.uint32_t **point) except -1:
+    """
+    Look up `token`, filling its vocabulary index (and Huffman code, if `hs`).
+
+    Return 0 if the token is out of vocabulary or was dropped by downsampling, 1 otherwise.
+
+    """
+    cdef long long row
+    if arrays.compact:
+        row = vlookup.get(token, -1)
+        if row < 0:
+            return 0
+        if sample and arrays.sample_ints[row] < random_int32(next_random):
+            return 0
+        index[0] = arrays.indexes[row]
+        if hs:
+            codelen[0] = arrays.code_lens[row]
+            code[0] = arrays.codes + arrays.code_offsets[row]
+            point[0] = arrays.points + arrays.code_offsets[row]
+        return 1
+
+    word = vlookup[token] if token in vlookup else None
+    if word is None:
+        return 0
+    if sample and word.sample_int < random_int32(next_random):
+        return 0
+    index[0] = word.index
+    if hs:
+        codelen[0] = <int>len(word.code)
+        code[0] = <np.uint8_t *>np.PyArray_DATA(word.code)
+        point[0] = <np.uint32_t *>np.PyArray_DATA(word.point)
+    return 1
+
+
 def train_batch_sg(model, sentences, alpha, _work):
     cdef int hs = model.hs
     cdef int negative = model.negative
@@ -301,22 +358,16 @@ def train_batch_sg(model, sentences, alpha, _work):
     work = <REAL_t *>np.PyArray_DATA(_work)
 
     # prepare C structures so we can go "full C" and release the Python GIL
-    vlookup = model.wv.vocab
+    cdef VocabArrays vocab_arrays
+    vlookup = init_vocab_arrays(model.wv.vocab, &vocab_arrays)
     sentence_idx[0] = 0  # indices of the first sentence always start at 0
     for sent in sentences:
         if not sent:
             continue  # ignore empty sentences; leave effective_sentences unchanged
         for token in sent:
-            word = vlookup[token] if token in vlookup else None
-            if word is None:
+            if not lookup_word(vlookup, &vocab_arrays, token, sample, hs, &next_random, &indexes[effective_words],
+                               &codelens[effective_words], &codes[effective_words], &points[effective_words]):
                 continue  # leaving `effective_words` unchanged = shortening the sentence = expanding the window
-            if sample and word.sample_int < random_int32(&next_random):
-                continue
-            indexes[effective_words] = word.index
-            if hs:
-                codelens[effective_words] = <int>len(word.code)
-                codes[effective_words] = <np.uint8_t *>np.PyArray_DATA(word.code)
-                points[effective_words] = <np.uint32_t *>np.PyArray_DATA(word.point)
             effective_words += 1
             if effective_words == MAX_SENTENCE_LEN:
                 break  # TODO: log warning, tally overflow?
@@ -406,22 +457,16 @@ def train_batch_cbow(model, sentences, alpha, _work, _neu1):
     neu1 = <REAL_t *>np.PyArray_DATA(_neu1)
 
     # prepare C structures so we can go "full C" and release the Python GIL
-    vlookup = model.wv.vocab
+    cdef VocabArrays vocab_arrays
+    vlookup = init_vocab_arrays(model.wv.vocab, &vocab_arrays)
     sentence_idx[0] = 0  # indices of the first sentence always start at 0
     for sent in sentences:
         if not sent:
             continue  # ignore empty sentences; leave effective_sentences unchanged
         for token in sent:
-            word = vlookup[token] if token in vlookup else None
-            if word is None:
+            if not lookup_word(vlookup, &vocab_arrays, token, sample, hs, &next_random, &indexes[effective_words],
+                               &codelens[effective_words], &codes[effective_words], &points[effective_words]):
                 continue  # leaving `effective_words` unchanged = shortening the sentence = expanding the window
-            if sample and word.sample_int < random_int32(&next_random):
-                continue
-            indexes[effective_words] = word.index
-            if hs:
-                codelens[effective_words] = <int>len(word.code)
-                codes[effective_words] = <np.uint8_t *>np.PyArray_DATA(word.code)
-                points[effective_words] = <np.uint32_t *>np.PyArray_DATA(word.point)
             effective_words += 1
             if effective_words == MAX_SENTENCE_LEN:
                 break  # TODO: log warning, tally overflow?
@@ -483,16 +528,12 @@ def score_sentence_sg(model, sentence, _work):
     # convert Python structures to primitive types, so we can release the GIL
     work = <REAL_t *>np.PyArray_DATA(_work)
 
-    vlookup = model.wv.vocab
+    cdef VocabArrays vocab_arrays
+    vlookup = init_vocab_arrays(model.wv.vocab, &vocab_arrays)
     i = 0
     for token in sentence:
-        word = vlookup[token] if token in vlookup else None
-        if word is None:
+        if not lookup_word(vlookup, &vocab_arrays, token, 0, 1, NULL, &indexes[i], &codelens[i], &codes[i], &points[i]):
             continue  # should drop the
-        indexes[i] = word.index
-        codelens[i] = <int>len(word.code)
-        codes[i] = <np.uint8_t *>np.PyArray_DATA(word.code)
-        points[i] = <np.uint32_t *>np.PyArray_DATA(word.point)
         result += 1
         i += 1
         if i == MAX_SENTENCE_LEN:
@@ -566,16 +607,12 @@ def score_sentence_cbow(model, sentence, _work, _neu1):
     work = <REAL_t *>np.PyArray_DATA(_work)
     neu1 = <REAL_t *>np.PyArray_DATA(_neu1)
 
-    vlookup = model.wv.vocab
+    cdef VocabArrays vocab_arrays
+    vlookup = init_vocab_arrays(model.wv.vocab, &vocab_arrays)
     i = 0
     for token in sentence:
-        word = vlookup[token] if token in vlookup else None
-        if word is None:
+        if not lookup_word(vlookup, &vocab_arrays, token, 0, 1, NULL, &indexes[i], &codelens[i], &codes[i], &points[i]):
             continue  # for score, should this be a default negative value?
-        indexes[i] = word.index
-        codelens[i] = <int>len(word.code)
-        codes[i] = <np.uint8_t *>np.PyArray_DATA(word.code)
-        points[i] = <np.uint32_t *>np.PyArray_DATA(word.point)
         result += 1
         i += 1
         if i == MAX_SENTENCE_LEN:
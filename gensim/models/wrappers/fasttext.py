@@ -55,6 +55,7 @@ class FastTextKeyedVectors(KeyedVectors):
     def __init__(self):
         super(FastTextKeyedVectors, self).__init__()
         self.syn0_all_norm = None
+        self.syn0_all_norms = None  # L2 norm of each ngram vector, when normalizing on the fly
         self.ngrams = {}
 
     def save(self, *args, **kwargs):
@@ -82,18 +83,19 @@ class FastTextKeyedVectors(KeyedVectors):
             word_vec = np.zeros(self.syn0_all.shape[1])
             ngrams = FastText.compute_ngrams(word, self.min_n, self.max_n)
             ngrams = [ng for ng in ngrams if ng in self.ngrams]
-            if use_norm:
-                ngram_weights = self.syn0_all_norm
+            if use_norm and self.syn0_all_norm is None:
+                for ngram in ngrams:
+                    word_vec += self.syn0_all[self.ngrams[ngram]] / self.syn0_all_norms[self.ngrams[ngram]]
             else:
-                ngram_weights = self.syn0_all
-            for ngram in ngrams:
-                word_vec += ngram_weights[self.ngrams[ngram]]
+                ngram_weights = self.syn0_all_norm if use_norm else self.syn0_all
+                for ngram in ngrams:
+                    word_vec += ngram_weights[self.ngrams[ngram]]
             if word_vec.any():
                 return word_vec / len(ngrams)
             else: # No ngrams of the word are present in self.ngrams
                 raise KeyError('all ngrams for word %s absent from model' % word)
 
-    def init_sims(self, replace=False):
+    def init_sims(self, replace=False, norms_only=False):
         """
         Precompute L2-normalized vectors.
 
@@ -103,9 +105,18 @@ class FastTextKeyedVectors(KeyedVectors):
         Note that you **cannot continue training** after doing a replace. The model becomes
         effectively read-only = you can only call `most_similar`, `similarity` etc.
 
+        If `norms_only` is set, only precompute the L2 norms of the word and ngram vectors,
+        and normalize on the fly (see `KeyedVectors.init_sims`).
+
         """
-        super(FastTextKeyedVectors, self).init_sims(replace)
-        if getattr(self, 'syn0_all_norm', None) is None or replace:
+        super(FastTextKeyedVectors, self).init_sims(replace, norms_only)
+        if norms_only and not replace:
+            if getattr(self, 'syn0_all_norms', None) is None:
+                logger.info("precomputing L2-norms of ngram weight vectors, without normalized vectors")
+                self.syn0_all_norms = sqrt(np.einsum('ij,ij->i', self.syn0_all, self.syn0_all)).astype(REAL)
+            self.syn0_all_norm = None
+        elif (getattr(self, 'syn0_all_norm', None) is None and getattr(self, 'syn0_all_norms', None) is None) \
+                or replace:
             logger.info("precomputing L2-norms of ngram weight vectors")
             if replace:
                 for i in xrange(self.syn0_all.shape[0]):
@@ -113,6 +124,7 @@ class FastTextKeyedVectors(KeyedVectors):
                 self.syn0_all_norm = self.syn0_all
             else:
                 self.syn0_all_norm = (self.syn0_all / sqrt((self.syn0_all ** 2).sum(-1))[..., newaxis]).astype(REAL)
+            self.syn0_all_norms = None
 
     def __contains__(self, word):
         """
@@ -7,7 +7,7 @@
 
 
 """
-USAGE: %(program)s WIKI_XML_DUMP OUTPUT_PREFIX [VOCABULARY_SIZE]
+USAGE: %(program)s WIKI_XML_DUMP OUTPUT_PREFIX [VOCABULARY_SIZE [CHECKPOINT_EVERY]]
 
 Convert articles from a Wikipedia dump to (sparse) vectors. The input is a
 bz2-compressed dump of Wikipedia articles, in XML format.
@@ -27,6 +27,13 @@ disk space; gensim's corpus iterators can work with compressed input, too.
 removing tokens that appear in more than 10%% of all documents). Defaults to
 100,000.
 
+The progress is saved to `OUTPUT_PREFIX.checkpoint` every `CHECKPOINT_EVERY`
+documents (default 100,000): the dictionary so far, the position in the dump,
+and the Matrix Market files written so far, as separate shards of
+`CHECKPOINT_EVERY` documents. If the script is interrupted, run it again with
+the same arguments to resume from the last checkpoint. The checkpoint is
+removed once the script finishes.
+
 If you have the `pattern` package installed, this script will use a fancy
 lemmatization to get a lemma of each token (instead of plain alphabetic
 tokenizer). The package is available at https://github.com/clips/pattern .
@@ -35,10 +42,12 @@ Example: python -m gensim.scripts.make_wikicorpus ~/gensim/results/enwiki-latest
 """
 
 
+import itertools
 import logging
 import os.path
 import sys
 
+from gensim import utils
 from gensim.corpora import Dictionary, HashDictionary, MmCorpus, WikiCorpus
 from gensim.models import TfidfModel
 
@@ -48,6 +57,67 @@ from gensim.models import TfidfModel
 # DEFAULT_DICT_SIZE most frequent types are kept.
 DEFAULT_DICT_SIZE = 100000
 
+# save a checkpoint after this many documents
+DEFAULT_CHECKPOINT_EVERY = 100000
+
+logger = logging.getLogger(__name__)
+
+
+def load_checkpoint(fname):
+    """Return the progress saved in checkpoint `fname`, or the initial state if there is none."""
+    if not os.path.exists(fname):
+        return {'phase': 'dictionary', 'dictionary': None, 'position': None, 'shards': [], 'num_docs': 0}
+    state = utils.unpickle(fname)
+    logger.info(
+        "resuming from checkpoint %s: phase %s, %i documents done",
+        fname, state['phase'], state['num_docs'])
+    return state
+
+
+def save_checkpoint(state, fname):
+    """Save `state` to checkpoint `fname`; the old checkpoint is only replaced once the new one is complete."""
+    utils.pickle(state, fname + '.tmp')
+    getattr(os, 'replace', os.rename)(fname + '.tmp', fname)
+    logger.info("saved checkpoint %s: phase %s, %i documents done", fname, state['phase'], state['num_docs'])
+
+
+def serialize_shards(fname, documents, id2word, state, checkpoint, every, get_position=lambda: None):
+    """
+    Save `documents` in Matrix Market format to shards `fname.0`, `fname.1` ... of
+    `every` documents each, and save `state` to `checkpoint` after each shard. Then
+    merge the shards into `fname`.
+
+    The shards already finished are listed in `state['shards']`; `documents` must
+    continue right after them. `state['position']` is set to `get_position()` after
+    each shard.
+
+    Return the file names of all shards, for `remove_shards`.
+    """
+    while True:
+        shard = '%s.%i' % (fname, len(state['shards']))
+        MmCorpus.serialize(shard, itertools.islice(documents, every), id2word=id2word, progress_cnt=10000)
+        num_docs = MmCorpus(shard).num_docs
+        if num_docs:
+            state['shards'].append(shard)
+            state['position'] = get_position()
+            state['num_docs'] += num_docs
+            save_checkpoint(state, checkpoint)
+        if num_docs < every:
+            break
+
+    logger.info("merging %i shards into %s", len(state['shards']), fname)
+    shards = [MmCorpus(shard) for shard in state['shards']]
+    MmCorpus.serialize(fname, itertools.chain.from_iterable(shards), id2word=id2word, progress_cnt=10000)
+    return state['shards'] + [shard]
+
+
+def remove_shards(shards):
+    """Remove the shard files (and their indexes) left by `serialize_shards`."""
+    for shard in shards:
+        for fname in [shard, shard + '.index']:
+            if os.path.exists(fname):
+                os.remove(fname)
+
 
 if __name__ == '__main__':
     program = os.path.basename(sys.argv[0])
@@ -70,27 +140,64 @@ if __name__ == '__main__':
         keep_words = int(sys.argv[3])
     else:
         keep_words = DEFAULT_DICT_SIZE
+    if len(sys.argv) > 4:
+        checkpoint_every = int(sys.argv[4])
+    else:
+        checkpoint_every = DEFAULT_CHECKPOINT_EVERY
     online = 'online' in program
     lemmatize = 'lemma' in program
     debug = 'nodebug' not in program
 
+    checkpoint = outp + '.checkpoint'
+    state = load_checkpoint(checkpoint)
+    wiki = WikiCorpus(inp, lemmatize=lemmatize, dictionary={})  # don't scan the dump yet
+
     if online:
-        dictionary = HashDictionary(id_range=keep_words, debug=debug)
-        dictionary.allow_update = True # start collecting document frequencies
-        wiki = WikiCorpus(inp, lemmatize=lemmatize, dictionary=dictionary)
-        MmCorpus.serialize(outp + '_bow.mm', wiki, progress_cnt=10000) # ~4h on my macbook pro without lemmatization, 3.1m articles (august 2012)
-        # with HashDictionary, the token->id mapping is only fully instantiated now, after `serialize`
-        dictionary.filter_extremes(no_below=20, no_above=0.1, keep_n=DEFAULT_DICT_SIZE)
-        dictionary.save_as_text(outp + '_wordids.txt.bz2')
-        wiki.save(outp + '_corpus.pkl.bz2')
-        dictionary.allow_update = False
+        if state['phase'] == 'dictionary':
+            dictionary = HashDictionary(id_range=keep_words, debug=debug)
+            dictionary.allow_update = True # start collecting document frequencies
+            state.update(phase='bow', dictionary=dictionary)
+        dictionary = wiki.dictionary = state['dictionary']
+        if state['phase'] == 'bow':
+            # the dictionary is saved with each shard, so its statistics match the shards done so far
+            bows = (dictionary.doc2bow(tokens) for tokens in wiki.get_texts(state['position']))
+            shards = serialize_shards(outp + '_bow.mm', bows, dictionary, state, checkpoint, checkpoint_every,
+                                      lambda: wiki.position) # ~4h on my macbook pro without lemmatization, 3.1m articles (august 2012)
+            # with HashDictionary, the token->id mapping is only fully instantiated now, after `serialize`
+            dictionary.filter_extremes(no_below=20, no_above=0.1, keep_n=DEFAULT_DICT_SIZE)
+            dictionary.save_as_text(outp + '_wordids.txt.bz2')
+            wiki.save(outp + '_corpus.pkl.bz2')
+            dictionary.allow_update = False
+            # keep the dictionary in the checkpoint, it's needed for tfidf
+            state.update(phase='tfidf', position=None, shards=[], num_docs=0)
+            save_checkpoint(state, checkpoint)
+            remove_shards(shards)
     else:
-        wiki = WikiCorpus(inp, lemmatize=lemmatize) # takes about 9h on a macbook pro, for 3.5m articles (june 2011)
-        # only keep the most frequent words (out of total ~8.2m unique tokens)
-        wiki.dictionary.filter_extremes(no_below=20, no_above=0.1, keep_n=DEFAULT_DICT_SIZE)
-        # save dictionary and bag-of-words (term-document frequency matrix)
-        MmCorpus.serialize(outp + '_bow.mm', wiki, progress_cnt=10000) # another ~9h
-        wiki.dictionary.save_as_text(outp + '_wordids.txt.bz2')
+        if state['phase'] == 'dictionary':
+            # takes about 9h on a macbook pro, for 3.5m articles (june 2011)
+            dictionary = state['dictionary'] or Dictionary()
+            texts = wiki.get_texts(state['position'])
+            while True:
+                num_docs = dictionary.num_docs
+                dictionary.add_documents(itertools.islice(texts, checkpoint_every), workers=wiki.processes)
+                if dictionary.num_docs - num_docs < checkpoint_every:
+                    break
+                state.update(dictionary=dictionary, position=wiki.position, num_docs=dictionary.num_docs)
+                save_checkpoint(state, checkpoint)
+            # only keep the most frequent words (out of total ~8.2m unique tokens)
+            dictionary.filter_extremes(no_below=20, no_above=0.1, keep_n=DEFAULT_DICT_SIZE)
+            state.update(phase='bow', dictionary=dictionary, position=None, num_docs=0)
+            save_checkpoint(state, checkpoint)
+        if state['phase'] == 'bow':
+            # save dictionary and bag-of-words (term-document frequency matrix)
+            dictionary = wiki.dictionary = state['dictionary']
+            bows = (dictionary.doc2bow(tokens) for tokens in wiki.get_texts(state['position']))
+            shards = serialize_shards(outp + '_bow.mm', bows, dictionary, state, checkpoint, checkpoint_every,
+                                      lambda: wiki.position) # another ~9h
+            dictionary.save_as_text(outp + '_wordids.txt.bz2')
+            state.update(phase='tfidf', dictionary=None, position=None, shards=[], num_docs=0)
+            save_checkpoint(state, checkpoint)
+            remove_shards(shards)
         # load back the id->word mapping directly from file
         # this seems to save more memory, compared to keeping the wiki.dictionary object from above
         dictionary = Dictionary.load_from_text(outp + '_wordids.txt.bz2')
@@ -99,12 +206,19 @@ if __name__ == '__main__':
     # initialize corpus reader and word->id mapping
     mm = MmCorpus(outp + '_bow.mm')
 
-    # build tfidf, ~50min
-    tfidf = TfidfModel(mm, id2word=dictionary, normalize=True)
-    tfidf.save(outp + '.tfidf_model')
+    if state['phase'] == 'tfidf':
+        # build tfidf, ~50min
+        tfidf = TfidfModel(mm, id2word=dictionary, normalize=True)
+        tfidf.save(outp + '.tfidf_model')
+        state.update(phase='tfidf_mm')
+        save_checkpoint(state, checkpoint)
+    tfidf = TfidfModel.load(outp + '.tfidf_model')
 
     # save tfidf vectors in matrix market format
     # ~4h; result file is 15GB! bzip2'ed down to 4.5GB
-    MmCorpus.serialize(outp + '_tfidf.mm', tfidf[mm], progress_cnt=10000)
+    vectors = (tfidf[bow] for bow in itertools.islice(mm, state['num_docs'], None))
+    shards = serialize_shards(outp + '_tfidf.mm', vectors, dictionary, state, checkpoint, checkpoint_every)
+    os.remove(checkpoint)
+    remove_shards(shards)
 
     logger.info("finished running %s" % program)
@@ -4,3 +4,5 @@ This package contains implementations of pairwise similarity queries.
 
 # bring classes directly into package namespace, to save some typing
 from .docsim import Similarity, MatrixSimilarity, SparseMatrixSimilarity, WmdSimilarity
+from .ivf import IvfIndexer
+from .inverted import InvertedIndexSimilarity
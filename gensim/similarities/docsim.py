@@ -15,7 +15,10 @@ of numbers as large as the size of the initial set of documents, that is, one fl
 for each index document. Alternatively, you can also request only the top-N most
 similar index documents to the query.
 
-You can later add new documents to the index via `Similarity.add_documents()`.
+You can later add new documents to the index via `Similarity.add_documents()`, replace
+indexed documents via `update_documents()` and remove them via `delete_documents()`.
+Document positions never change: deleted documents keep their position and are never
+returned by queries. `Similarity.compact()` rewrites the affected shards, optionally in a background thread.
 
 How It Works
 ------------
@@ -52,27 +55,176 @@ uses the faster, batch queries internally and **is ideal for all-vs-all pairwise
 
 import logging
 import itertools
+import mmap
 import os
 import heapq
+import threading
 
 import numpy
 import scipy.sparse
+from scipy.spatial.distance import cdist
 
 from gensim import interfaces, utils, matutils
+from gensim.models.keyedvectors import PYEMD_EXT, wmd_from_distances
+from six import iteritems, itervalues, string_types
 from six.moves import map as imap, xrange, zip as izip
 
 
 logger = logging.getLogger(__name__)
 
+# max. number of reduced-precision (float16, int8) index values upcast to float32 at once during a query
+BLOCK_SIZE = 4 * 1024 * 1024
+
+# default number of threads querying the shards of a `Similarity` index in parallel (see its `workers` parameter)
 PARALLEL_SHARDS = False
 try:
     import multiprocessing
+    from multiprocessing.pool import ThreadPool
     # by default, don't parallelize queries. uncomment the following line if you want that.
-#    PARALLEL_SHARDS = multiprocessing.cpu_count() # use #parallel processes = #CPus
+#    PARALLEL_SHARDS = multiprocessing.cpu_count() # use #parallel threads = #CPus
 except ImportError:
     pass
 
 
+def _topn(sims, num_best, eps=1e-9):
+    """
+    Return the `num_best` entries of each row of the 2D array `sims` with the greatest magnitude,
+    as two 2D arrays of (positions, similarities). Rows with fewer than `num_best` non-zero
+    similarities are padded with position -1 and similarity 0.
+    """
+    num_best = min(num_best, sims.shape[1])
+    if not num_best:
+        return numpy.zeros((len(sims), 0), dtype=numpy.int64), numpy.zeros((len(sims), 0))
+    magnitudes = numpy.abs(sims)
+    positions = numpy.argpartition(-magnitudes, num_best - 1, axis=1)[:, :num_best]
+    rows = numpy.arange(len(sims))[:, numpy.newaxis]
+    positions = positions[rows, numpy.argsort(-magnitudes[rows, positions], axis=1, kind='mergesort')]
+    sims = sims[rows, positions]
+    missing = numpy.abs(sims) <= eps
+    positions[missing], sims[missing] = -1, 0.0
+    return positions, sims
+
+
+def _drop_deleted(result, deleted):
+    """Set the similarities of the deleted (tombstoned) index documents in `result` to zero."""
+    if deleted is None or not len(deleted):
+        return result
+    if scipy.sparse.issparse(result):
+        keep = numpy.ones(result.shape[1], dtype=result.dtype)
+        keep[deleted] = 0
+        return (result * scipy.sparse.diags(keep)).tocsr()
+    result[..., deleted] = 0
+    return result
+
+
+def _document_positions(docnos, length):
+    """Return `docnos` as an array of positions in an index of `length` documents, checking their range."""
+    docnos = numpy.asarray(docnos, dtype=numpy.int64).reshape(-1)
+    if len(docnos) and (docnos.min() < 0 or docnos.max() >= length):
+        raise ValueError("invalid document positions: %s (must be 0 <= x < %s)" % (docnos, length))
+    return docnos
+
+
+def _sparse_documents(corpus, norm='l2'):
+    """
+    Yield the documents of `corpus` in sparse gensim format; gensim vectors are normalized
+    to unit length by `norm` ('l1', 'l2', or None to keep them as they are).
+    """
+    for vector in corpus:
+        if scipy.sparse.issparse(vector):
+            yield matutils.scipy2sparse(vector)
+        elif isinstance(vector, numpy.ndarray):
+            yield matutils.full2sparse(vector)
+        elif norm:
+            yield matutils.unitvec(vector, norm)
+        else:
+            yield vector
+
+
+def _extend_ignore(ignore, attributes):
+    """Return the attribute names `ignore` (as passed to `SaveLoad.save`) together with `attributes`."""
+    if isinstance(ignore, string_types):
+        ignore = [ignore]
+    return list(set(attributes) | set(ignore or []))
+
+
+def _wmd_chunk(arrays, query_ids, query_weights, query_vectors, start, end, num_best=None, best=None):
+    """
+    Compute the WMD between a query (nBOW `query_ids`, `query_weights`, and the vectors of its words
+    `query_vectors`) and the corpus documents
+    `start`..`end` of a `WmdSimilarity` index, given as the `arrays` (vectors, doc_offsets, doc_words,
+    doc_weights, centroids). Return a list of (document number, distance) 2-tuples.
+
+    With `num_best`, documents are visited in order of their lower bound -- the larger of the Word
+    Centroid Distance and the Relaxed WMD of Kusner et al. -- and the exact WMD is only computed until
+    no remaining document can get into the `num_best` closest. `best` is the heap of (negated distance,
+    document number) of the closest documents found so far; it is updated in place, so that it can be
+    shared by successive chunks.
+    """
+    vectors, doc_offsets, doc_words, doc_weights, centroids = arrays
+    first, last = doc_offsets[start], doc_offsets[end]
+    starts = doc_offsets[start:end]
+    nonempty = numpy.flatnonzero(starts != doc_offsets[start + 1:end + 1])
+    if not len(nonempty) or not len(query_ids):
+        return []  # at infinite distance
+    # distances of the query words to all words of the chunk's documents, in one go
+    chunk_vocab, positions = numpy.unique(doc_words[first:last], return_inverse=True)
+    distances = cdist(query_vectors, vectors[chunk_vocab])[:, positions]
+    starts = starts[nonempty] - first
+    ends = doc_offsets[start + 1:end + 1][nonempty] - first
+    docnos = start + nonempty
+
+    if num_best is None:
+        order, bounds = xrange(len(docnos)), None
+    else:
+        query_centroid = numpy.dot(query_weights, query_vectors)
+        bounds = numpy.sqrt(((centroids[docnos] - query_centroid) ** 2).sum(axis=1))
+        # each query word moves all its mass to the closest word of the document...
+        to_doc = numpy.dot(query_weights, numpy.minimum.reduceat(distances, starts, axis=1))
+        # ...or each document word moves all its mass to the closest query word
+        from_doc = numpy.add.reduceat(doc_weights[first:last] * distances.min(axis=0), starts)
+        bounds = numpy.maximum(bounds, numpy.maximum(to_doc, from_doc))
+        order = numpy.argsort(bounds, kind='mergesort')
+
+    result = []
+    for position in order:
+        if bounds is not None and len(best) >= num_best and (not best or bounds[position] >= -best[0][0]):
+            break  # no remaining document can get into the top `num_best`
+        doc_start, doc_end = starts[position], ends[position]
+        distance = wmd_from_distances(
+            doc_words[first + doc_start:first + doc_end], doc_weights[first + doc_start:first + doc_end],
+            query_ids, query_weights, distances[:, doc_start:doc_end].T)
+        result.append((docnos[position], distance))
+        if bounds is not None:
+            if len(best) < num_best:
+                heapq.heappush(best, (-distance, docnos[position]))
+            elif distance < -best[0][0]:
+                heapq.heapreplace(best, (-distance, docnos[position]))
+    return result
+
+
+_worker_arrays = None  # the index arrays of a WmdSimilarity, memory-mapped in each worker process
+
+
+def _init_wmd_worker(specs):
+    """Memory-map the arrays described by `specs` (filename, dtype, shape, offset) in a worker process."""
+    global _worker_arrays
+    _worker_arrays = tuple(
+        numpy.zeros(shape, dtype=dtype) if fname is None
+        else numpy.memmap(fname, dtype=dtype, mode='r', shape=shape, offset=offset)
+        for fname, dtype, shape, offset in specs)
+
+
+def _wmd_worker(args):
+    """Compute a chunk of WMD queries in a worker process; see `_wmd_chunk`."""
+    query_ids, query_weights, query_vectors, start, end, num_best = args
+    if num_best is None:
+        return _wmd_chunk(_worker_arrays, query_ids, query_weights, query_vectors, start, end)
+    best = []
+    _wmd_chunk(_worker_arrays, query_ids, query_weights, query_vectors, start, end, num_best, best)
+    return [(docno, -negdistance) for negdistance, docno in best]
+
+
 class Shard(utils.SaveLoad):
     """
     A proxy class that represents a single shard instance within a Similarity
@@ -86,6 +238,7 @@ class Shard(utils.SaveLoad):
         self.dirname, self.fname = os.path.split(fname)
         self.length = len(index)
         self.cls = index.__class__
+        self.deleted = numpy.array([], dtype=numpy.int64)  # positions of deleted documents within the shard
         logger.info("saving index shard to %s", self.fullname())
         index.save(self.fullname())
         self.index = self.get_index()
@@ -119,7 +272,7 @@ class Shard(utils.SaveLoad):
         MatrixSimilarity and scipy.sparse for SparseMatrixSimilarity.
         """
         assert 0 <= pos < len(self), "requested position out of range"
-        return self.get_index().index[pos]
+        return self.get_index().vectors(pos, pos + 1)[0]
 
     def __getitem__(self, query):
         index = self.get_index()
@@ -128,13 +281,33 @@ class Shard(utils.SaveLoad):
             index.normalize = self.normalize
         except:
             raise ValueError("num_best and normalize have to be set before querying a proxy Shard object")
+        index.deleted = self.deleted
         return index[query]
 
+    def topn(self, query, num_best, eps=1e-9):
+        """
+        Return the `num_best` results of `query` (a document or a corpus) with the greatest magnitude,
+        as two 2D arrays of (positions in the shard, similarities), one row per query document. Rows
+        with fewer than `num_best` non-zero similarities are padded with position -1 and similarity 0.
+        """
+        index = self.get_index()
+        try:
+            index.num_best = None
+            index.normalize = self.normalize
+        except:
+            raise ValueError("normalize has to be set before querying a proxy Shard object")
+        index.deleted = self.deleted
+        sims = numpy.asarray(index[query], dtype=float)
+        return _topn(sims.reshape(-1, sims.shape[-1]), num_best, eps)
+
 
 def query_shard(args):
     query, shard = args  # simulate starmap (not part of multiprocessing in older Pythons)
     logger.debug("querying shard %s num_best=%s in process %s", shard, shard.num_best, os.getpid())
-    result = shard[query]
+    if shard.num_best is None:
+        result = shard[query]
+    else:
+        result = shard.topn(query, shard.num_best)
     logger.debug("finished querying shard %s in process %s", shard, os.getpid())
     return result
 
@@ -149,7 +322,8 @@ class Similarity(interfaces.SimilarityABC):
     The shards themselves are simply stored as files to disk and mmap'ed back as needed.
 
     """
-    def __init__(self, output_prefix, corpus, num_features, num_best=None, chunksize=256, shardsize=32768, norm='l2'):
+    def __init__(self, output_prefix, corpus, num_features, num_best=None, chunksize=256, shardsize=32768, norm='l2',
+                 workers=None, dtype=numpy.float32):
         """
         Construct the index from `corpus`. The index can be later extended by calling
         the `add_documents` method. **Note**: documents are split (internally, transparently)
@@ -185,6 +359,18 @@ class Similarity(interfaces.SimilarityABC):
         You can also override `num_best` dynamically, simply by setting e.g.
         `self.num_best = 10` before doing a query.
 
+        With `workers` > 1 (default: `PARALLEL_SHARDS`), the shards are queried in parallel by a pool
+        of `workers` threads, which is started on the first query and kept until `close()`. The threads
+        share the mmap'ed shard matrices, and the matrix products release the GIL.
+
+        `dtype` is the type of the matrices of dense shards: numpy.float32 (default), or numpy.float16
+        and numpy.int8 to store them with reduced precision (see `MatrixSimilarity`). Sparse shards
+        always use numpy.float32.
+
+        Indexed documents can be replaced with `update_documents` and removed with `delete_documents`,
+        without changing the positions of any other documents. Both are cheap: the shards are
+        left untouched until `compact()`, which can also run in a background thread.
+
         """
         if output_prefix is None:
             # undocumented feature: set output_prefix=None to create the server in temp
@@ -199,10 +385,35 @@ class Similarity(interfaces.SimilarityABC):
         self.shardsize = shardsize
         self.shards = []
         self.fresh_docs, self.fresh_nnz = [], 0
+        self.workers = (PARALLEL_SHARDS or 1) if workers is None else workers
+        self.executor = None
+        self.dtype = dtype
+        self.updated = {}  # document position => (normalized vector, length) of documents updated since compaction
+        self.overlay = None
+        self.compactor = None
+        self.compactions = 0
+        self.lock = threading.RLock()
 
         if corpus is not None:
             self.add_documents(corpus)
 
+    def __getstate__(self):
+        result = self.__dict__.copy()
+        # locks can't be pickled, a new one is created on load
+        result.pop('lock', None)
+        return result
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.lock = threading.RLock()
+        if not hasattr(self, 'updated'):
+            # index stored before documents could be updated or deleted
+            self.updated, self.overlay, self.compactor, self.compactions = {}, None, None, 0
+            for shard in self.shards:
+                shard.deleted = numpy.array([], dtype=numpy.int64)
+        if not hasattr(self, 'dtype'):
+            self.dtype = numpy.float32
+
     def __len__(self):
         return len(self.fresh_docs) + sum([len(shard) for shard in self.shards])
 
@@ -222,16 +433,7 @@ class Similarity(interfaces.SimilarityABC):
             # The last shard was incomplete (<; load it back and add the documents there, don't start a new shard
             self.reopen_shard()
         for doc in corpus:
-            if isinstance(doc, numpy.ndarray):
-                doclen = len(doc)
-            elif scipy.sparse.issparse(doc):
-                doclen = doc.nnz
-            else:
-                doclen = len(doc)
-                if doclen < 0.3 * self.num_features:
-                    doc = matutils.unitvec(matutils.corpus2csc([doc], self.num_features).T, self.norm)
-                else:
-                    doc = matutils.unitvec(matutils.sparse2full(doc, self.num_features), self.norm)
+            doc, doclen = self.prepare_document(doc)
             self.fresh_docs.append(doc)
             self.fresh_nnz += doclen
             if len(self.fresh_docs) >= self.shardsize:
@@ -239,6 +441,30 @@ class Similarity(interfaces.SimilarityABC):
             if len(self.fresh_docs) % 10000 == 0:
                 logger.info("PROGRESS: fresh_shard size=%i", len(self.fresh_docs))
 
+    def prepare_document(self, doc):
+        """
+        Return the vector of `doc` as stored in the shards (normalized, in scipy.sparse
+        format for sparse documents), and its length.
+        """
+        if isinstance(doc, numpy.ndarray):
+            doclen = len(doc)
+        elif scipy.sparse.issparse(doc):
+            doclen = doc.nnz
+        else:
+            doclen = len(doc)
+            if doclen < 0.3 * self.num_features:
+                doc = matutils.unitvec(matutils.corpus2csc([doc], self.num_features).T, self.norm)
+            else:
+                doc = matutils.unitvec(matutils.sparse2full(doc, self.num_features), self.norm)
+        return doc, doclen
+
+    def index_documents(self, docs, num_nnz):
+        """Return a `SparseMatrixSimilarity` or `MatrixSimilarity` of `docs`, depending on their density."""
+        # consider the documents sparse if their density is < 30%
+        if 0.3 > 1.0 * num_nnz / (len(docs) * self.num_features):
+            return SparseMatrixSimilarity(docs, num_terms=self.num_features, num_docs=len(docs), num_nnz=num_nnz)
+        return MatrixSimilarity(docs, num_features=self.num_features, dtype=self.dtype)
+
     def shardid2filename(self, shardid):
         if self.output_prefix.endswith('.'):
             return "%s%s" % (self.output_prefix, shardid)
@@ -257,51 +483,194 @@ class Similarity(interfaces.SimilarityABC):
         if not self.fresh_docs:
             return
         shardid = len(self.shards)
-        # consider the shard sparse if its density is < 30%
-        issparse = 0.3 > 1.0 * self.fresh_nnz / (len(self.fresh_docs) * self.num_features)
-        if issparse:
-            index = SparseMatrixSimilarity(self.fresh_docs, num_terms=self.num_features,
-                                           num_docs=len(self.fresh_docs), num_nnz=self.fresh_nnz)
-        else:
-            index = MatrixSimilarity(self.fresh_docs, num_features=self.num_features)
-        logger.info("creating %s shard #%s", 'sparse' if issparse else 'dense', shardid)
+        index = self.index_documents(self.fresh_docs, self.fresh_nnz)
+        logger.info("creating %s shard #%s", 'sparse' if isinstance(index, SparseMatrixSimilarity) else 'dense', shardid)
         shard = Shard(self.shardid2filename(shardid), index)
         shard.num_best = self.num_best
         shard.num_nnz = self.fresh_nnz
-        self.shards.append(shard)
+        with self.lock:
+            self.shards.append(shard)
         self.fresh_docs, self.fresh_nnz = [], 0
 
     def reopen_shard(self):
         assert self.shards
         if self.fresh_docs:
             raise ValueError("cannot reopen a shard with fresh documents in index")
+        self.join_compaction()
+        if len(self.shards[-1].deleted):
+            # fold the updated and deleted documents into the shard first
+            self.compactions += 1
+            self.compact_shards([len(self.shards) - 1], self.compactions)
         last_shard = self.shards[-1]
         last_index = last_shard.get_index()
         logger.info("reopening an incomplete shard of %i documents", len(last_shard))
 
-        self.fresh_docs = list(last_index.index)
+        self.fresh_docs = list(last_index.vectors())
         self.fresh_nnz = last_shard.num_nnz
         del self.shards[-1]  # remove the shard from index, *but its file on disk is not deleted*
         logger.debug("reopen complete")
 
-    def query_shards(self, query):
+    def get_executor(self):
+        """Return the pool of threads querying the shards, starting it if needed."""
+        if getattr(self, 'executor', None) is None:
+            logger.info("starting %i shard query threads", self.workers)
+            self.executor = ThreadPool(self.workers)
+        return self.executor
+
+    def close(self):
+        """Stop the shard query threads, if any. They are started again by the next query."""
+        if getattr(self, 'executor', None) is not None:
+            self.executor.terminate()
+            self.executor = None
+
+    def update_documents(self, docnos, corpus):
+        """
+        Replace the index documents at positions `docnos` with the documents of `corpus`
+        (in the same order). Replacing a deleted document undeletes it.
+
+        The new vectors are kept in memory and queried besides the shards, whose old
+        vectors are ignored, until `compact()` writes them into the shards.
+        """
+        self.close_shard()
+        docs = [self.prepare_document(doc) for doc in corpus]
+        with self.lock:
+            docnos = _document_positions(docnos, len(self))
+            for docno, doc in izip(docnos, docs):
+                self.updated[int(docno)] = doc
+            self.overlay = None
+            self.mark_deleted(docnos)
+
+    def delete_documents(self, docnos):
+        """
+        Delete the index documents at positions `docnos`. The positions of the other documents
+        don't change: deleted documents only get zero similarity to all queries (and so are
+        never returned with `num_best`), until `update_documents` replaces them.
+
+        Deleted documents are only marked in their shards ("tombstones"); `compact()` then
+        removes their vectors from the shards.
+        """
+        self.close_shard()
+        with self.lock:
+            docnos = _document_positions(docnos, len(self))
+            for docno in docnos:
+                if self.updated.pop(int(docno), None) is not None:
+                    self.overlay = None
+            self.mark_deleted(docnos)
+
+    def mark_deleted(self, docnos):
+        """Add the document positions `docnos` to the tombstones of their shards."""
+        offsets = numpy.cumsum([0] + [len(shard) for shard in self.shards])
+        shardids = numpy.searchsorted(offsets, docnos, side='right') - 1
+        for shardid in numpy.unique(shardids):
+            shard = self.shards[shardid]
+            # replace, don't modify, the array: queries in progress may be using it
+            shard.deleted = numpy.union1d(shard.deleted, docnos[shardids == shardid] - offsets[shardid])
+
+    def get_overlay(self):
         """
-        Return the result of applying shard[query] for each shard in self.shards,
-        as a sequence.
+        Return (document positions, index) of the documents updated since the last compaction,
+        or None if there are none.
+        """
+        if not self.updated:
+            return None
+        if self.overlay is None:
+            docnos = numpy.array(sorted(self.updated), dtype=numpy.int64)
+            docs = [self.updated[docno] for docno in docnos]
+            index = self.index_documents([doc for doc, _ in docs], sum(doclen for _, doclen in docs))
+            self.overlay = docnos, index
+        return self.overlay
+
+    def compact(self, background=False):
+        """
+        Rewrite the shards that contain updated or deleted documents, so that updated documents are
+        queried from their shards again and deleted documents don't need tombstones anymore. Sparse
+        shards drop the vectors of deleted documents; dense shards zero their rows, and keep their size.
 
-        If PARALLEL_SHARDS is set, the shards are queried in parallel, using
-        the multiprocessing module.
+        With `background=True`, the shards are rewritten in a separate thread, which is returned.
+        Queries, updates and deletions can go on in the meantime; each rewritten shard replaces its
+        old version atomically (use `join_compaction()` to wait for the compaction to finish).
+        """
+        self.close_shard()
+        self.join_compaction()
+        with self.lock:
+            shardids = [shardid for shardid, shard in enumerate(self.shards) if len(shard.deleted)]
+            self.compactions += 1
+        if not background:
+            self.compact_shards(shardids, self.compactions)
+            return None
+        self.compactor = threading.Thread(target=self.compact_shards, args=(shardids, self.compactions))
+        self.compactor.daemon = True
+        self.compactor.start()
+        return self.compactor
+
+    def join_compaction(self):
+        """Wait for the background compaction started by `compact()` to finish, if any."""
+        if getattr(self, 'compactor', None) is not None:
+            self.compactor.join()
+            self.compactor = None
+
+    def compact_shards(self, shardids, generation):
+        """
+        Rewrite the shards `shardids` with their updated documents and without their deleted documents,
+        under new file names (tagged with `generation`), and delete their old files.
+        """
+        import glob
+        for shardid in shardids:
+            with self.lock:
+                shard = self.shards[shardid]
+                start = sum(len(previous) for previous in self.shards[:shardid])
+                deleted = shard.deleted
+                updated = dict((docno, doc) for docno, doc in iteritems(self.updated)
+                               if start <= docno < start + len(shard))
+            shard.get_index()  # queries still using the old shard must not need its files anymore
+            logger.info("compacting shard #%i: %i updated, %i deleted documents",
+                        shardid, len(updated), len(deleted) - len(updated))
+            index = shard.cls.load(shard.fullname())
+            index.delete_documents(deleted)
+            if updated:
+                docnos = sorted(updated)
+                index.update_documents(
+                    numpy.array(docnos, dtype=numpy.int64) - start, [updated[docno][0] for docno in docnos])
+            index.compact()
+            compacted = Shard("%s.%i" % (self.shardid2filename(shardid), generation), index)
+            compacted.num_best, compacted.num_nnz = shard.num_best, shard.num_nnz
+
+            with self.lock:
+                # documents updated or deleted during the compaction keep being tracked; updated documents
+                # that were deleted since are in the new shard, so they need their tombstones back
+                removed = [docno - start for docno in updated if docno not in self.updated]
+                for docno, doc in iteritems(updated):
+                    if self.updated.get(docno) is doc:
+                        del self.updated[docno]
+                        self.overlay = None
+                pending = [docno - start for docno in self.updated if start <= docno < start + len(shard)]
+                compacted.deleted = numpy.union1d(
+                    numpy.setdiff1d(self.shards[shardid].deleted, deleted),
+                    numpy.array(pending + removed, dtype=numpy.int64))
+                self.shards[shardid] = compacted
+
+            for fname in [shard.fullname()] + glob.glob(shard.fullname() + '.index*.npy'):
+                try:
+                    os.remove(fname)
+                except OSError as err:
+                    logger.warning("failed to delete old shard file %s: %s", fname, err)
+
+    def query_shards(self, query, shards=None):
         """
-        args = zip([query] * len(self.shards), self.shards)
-        if PARALLEL_SHARDS and PARALLEL_SHARDS > 1:
-            logger.debug("spawning %i query processes", PARALLEL_SHARDS)
-            pool = multiprocessing.Pool(PARALLEL_SHARDS)
-            result = pool.imap(query_shard, args, chunksize=1 + len(args) / PARALLEL_SHARDS)
+        Return the result of applying shard[query] for each shard in `shards`
+        (default: self.shards), as a sequence.
+
+        If `self.workers` > 1, the shards are queried in parallel, by a persistent
+        pool of threads.
+        """
+        if shards is None:
+            shards = self.shards
+        args = zip([query] * len(shards), shards)
+        if getattr(self, 'workers', PARALLEL_SHARDS) > 1 and len(shards) > 1:
+            return self.get_executor().imap(query_shard, args)
         else:
             # serial processing, one shard after another
-            pool = None
-            result = imap(query_shard, args)
-        return pool, result
+            return imap(query_shard, args)
 
     def __getitem__(self, query):
         """Get similarities of document `query` to all documents in the corpus.
@@ -314,46 +683,60 @@ class Similarity(interfaces.SimilarityABC):
         """
         self.close_shard()  # no-op if no documents added to index since last query
 
+        # query a consistent state, even if a background compaction replaces shards meanwhile
+        with self.lock:
+            shards = list(self.shards)
+            overlay = self.get_overlay()
+
         # reset num_best and normalize parameters, in case they were changed dynamically
-        for shard in self.shards:
+        for shard in shards:
             shard.num_best = self.num_best
             shard.normalize = self.norm
+        if overlay is not None:
+            # the documents updated since the last compaction; their old vectors are deleted in the shards
+            overlay_docnos, overlay_index = overlay
+            overlay_index.num_best = None
+            overlay_index.normalize = self.norm
 
         # there are 4 distinct code paths, depending on whether input `query` is
         # a corpus (or numpy/scipy matrix) or a single document, and whether the
         # similarity result should be a full array or only num_best most similar
         # documents.
-        pool, shard_results = self.query_shards(query)
+        shard_results = self.query_shards(query, shards)
         if self.num_best is None:
             # user asked for all documents => just stack the sub-results into a single matrix
             # (works for both corpus / single doc query)
-            result = numpy.hstack(shard_results)
+            result = numpy.hstack(list(shard_results))
+            if overlay is not None:
+                result[..., overlay_docnos] = overlay_index[query]
         else:
-            # the following uses a lot of lazy evaluation and (optionally) parallel
-            # processing, to improve query latency and minimize memory footprint.
-            offsets = numpy.cumsum([0] + [len(shard) for shard in self.shards])
-            convert = lambda doc, shard_no: [(doc_index + offsets[shard_no], sim)
-                                             for doc_index, sim in doc]
+            # each shard returns arrays of its top `num_best` (positions, similarities) for every query
+            # document; shift the positions by the shard offsets and merge the arrays of all shards,
+            # only creating the (document, similarity) 2-tuples that are actually returned.
+            offsets = numpy.cumsum([0] + [len(shard) for shard in shards])
+            parts = [(numpy.where(shard_positions >= 0, shard_positions + offset, -1), shard_sims)
+                     for (shard_positions, shard_sims), offset in izip(shard_results, offsets)]
+            if overlay is not None:
+                overlay_sims = numpy.asarray(overlay_index[query], dtype=float)
+                overlay_positions, overlay_sims = _topn(overlay_sims.reshape(-1, overlay_sims.shape[-1]), self.num_best)
+                parts.append((numpy.where(overlay_positions >= 0, overlay_docnos[overlay_positions], -1), overlay_sims))
             is_corpus, query = utils.is_corpus(query)
             is_corpus = is_corpus or hasattr(query, 'ndim') and query.ndim > 1 and query.shape[0] > 1
-            if not is_corpus:
-                # user asked for num_best most similar and query is a single doc
-                results = (convert(result, shard_no) for shard_no, result in enumerate(shard_results))
-                result = heapq.nlargest(self.num_best, itertools.chain(*results), key=lambda item: item[1])
-            else:
-                # the trickiest combination: returning num_best results when query was a corpus
-                results = []
-                for shard_no, result in enumerate(shard_results):
-                    shard_result = [convert(doc, shard_no) for doc in result]
-                    results.append(shard_result)
+            if not parts:
                 result = []
-                for parts in izip(*results):
-                    merged = heapq.nlargest(self.num_best, itertools.chain(*parts), key=lambda item: item[1])
-                    result.append(merged)
-        if pool:
-            # gc doesn't seem to collect the Pools, eventually leading to
-            # "IOError 24: too many open files". so let's terminate it manually.
-            pool.terminate()
+            else:
+                positions = numpy.hstack([shard_positions for shard_positions, _ in parts])
+                sims = numpy.hstack([shard_sims for _, shard_sims in parts])
+                order = numpy.argsort(
+                    numpy.where(positions >= 0, -sims, numpy.inf), axis=1, kind='mergesort')[:, :self.num_best]
+                rows = numpy.arange(len(positions))[:, numpy.newaxis]
+                positions, sims = positions[rows, order], sims[rows, order]
+                result = [
+                    [(int(docno), float(sim)) for docno, sim in izip(row_positions, row_sims) if docno >= 0]
+                    for row_positions, row_sims in izip(positions, sims)]
+                if not is_corpus:
+                    # user asked for num_best most similar and query is a single doc
+                    result = result[0]
 
         return result
 
@@ -370,6 +753,11 @@ class Similarity(interfaces.SimilarityABC):
         if not self.shards or docpos < 0 or docpos >= pos:
             raise ValueError("invalid document position: %s (must be 0 <= x < %s)" %
                              (docpos, len(self)))
+        with self.lock:
+            if docpos in self.updated:
+                return self.updated[docpos][0]
+            if docpos - pos + len(shard) in shard.deleted:
+                raise ValueError("document at position %s was deleted" % docpos)
         result = shard.get_document_id(docpos - pos + len(shard))
         return result
 
@@ -408,6 +796,9 @@ class Similarity(interfaces.SimilarityABC):
         The chunk is returned in its raw form (matrix or sparse matrix slice).
         The size of the chunk may be smaller than requested; it is up to the caller
         to check the result for real length, using `chunk.shape[0]`.
+
+        Documents updated or deleted since the last `compact()` are yielded as they
+        were before.
         """
         self.close_shard()
 
@@ -416,13 +807,13 @@ class Similarity(interfaces.SimilarityABC):
             chunksize = self.chunksize
 
         for shard in self.shards:
-            query = shard.get_index().index
-            for chunk_start in xrange(0, query.shape[0], chunksize):
+            index = shard.get_index()
+            for chunk_start in xrange(0, len(index), chunksize):
                 # scipy.sparse doesn't allow slicing beyond real size of the matrix
                 # (unlike numpy). so, clip the end of the chunk explicitly to make
                 # scipy.sparse happy
-                chunk_end = min(query.shape[0], chunk_start + chunksize)
-                chunk = query[chunk_start: chunk_end]  # create a view
+                chunk_end = min(len(index), chunk_start + chunksize)
+                chunk = index.vectors(chunk_start, chunk_end)  # a view, unless upcast from reduced precision
                 yield chunk
 
     def check_moved(self):
@@ -442,8 +833,11 @@ class Similarity(interfaces.SimilarityABC):
 
         """
         self.close_shard()
+        self.join_compaction()
         if fname is None:
             fname = self.output_prefix
+        # the query and compaction threads can't be stored; the index of updated documents is rebuilt on demand
+        kwargs['ignore'] = _extend_ignore(kwargs.get('ignore'), ['executor', 'compactor', 'overlay'])
         super(Similarity, self).save(fname, *args, **kwargs)
 
     def destroy(self):
@@ -453,6 +847,8 @@ class Similarity(interfaces.SimilarityABC):
 
         """
         import glob
+        self.close()
+        self.join_compaction()
         for fname in glob.glob(self.output_prefix + '*'):
             logger.info("deleting %s", fname)
             os.remove(fname)
@@ -470,6 +866,10 @@ class MatrixSimilarity(interfaces.SimilarityABC):
     The matrix is internally stored as a *dense* numpy array. Unless the entire matrix
     fits into main memory, use `Similarity` instead.
 
+    To halve or quarter the memory footprint, the matrix can also be stored with reduced
+    precision, as float16 or int8 numbers (see `dtype` in the constructor). Such a matrix
+    is upcast to float32, one block at a time, when queried.
+
     See also `Similarity` and `SparseMatrixSimilarity` in this module.
 
     """
@@ -479,6 +879,10 @@ class MatrixSimilarity(interfaces.SimilarityABC):
         automatically by scanning the corpus if not specified). See `Similarity`
         class for description of the other parameters.
 
+        `dtype` is the type of the stored matrix: numpy.float32 (default), numpy.float64,
+        numpy.float16, or numpy.int8. With numpy.int8, each document vector is scaled to
+        the range [-127, 127] by its own factor, stored in `self.scales`.
+
         """
         if num_features is None:
             logger.warning("scanning corpus to determine the number of features (consider setting `num_features` explicitly)")
@@ -488,6 +892,7 @@ class MatrixSimilarity(interfaces.SimilarityABC):
         self.num_best = num_best
         self.normalize = True
         self.chunksize = chunksize
+        self.deleted = numpy.array([], dtype=numpy.int64)
         if corpus_len is None:
             corpus_len = len(corpus)
 
@@ -496,6 +901,7 @@ class MatrixSimilarity(interfaces.SimilarityABC):
                 raise ValueError("cannot index a corpus with zero features (you must specify either `num_features` or a non-empty corpus in the constructor)")
             logger.info("creating matrix with %i documents and %i features", corpus_len, num_features)
             self.index = numpy.empty(shape=(corpus_len, num_features), dtype=dtype)
+            self.scales = numpy.ones(corpus_len, dtype=numpy.float32) if self.index.dtype == numpy.int8 else None
             # iterate over corpus, populating the numpy index matrix with (normalized)
             # document vectors
             for docno, vector in enumerate(corpus):
@@ -511,11 +917,51 @@ class MatrixSimilarity(interfaces.SimilarityABC):
                     vector = vector.toarray().flatten()
                 else:
                     vector = matutils.unitvec(matutils.sparse2full(vector, num_features))
-                self.index[docno] = vector
+                self.store_vector(docno, vector)
 
     def __len__(self):
         return self.index.shape[0]
 
+    def store_vector(self, docno, vector):
+        """Store the dense `vector` of the document at position `docno` in the index matrix."""
+        if self.index.dtype == numpy.int8:
+            scale = numpy.abs(vector).max() / 127.0 if len(vector) else 0.0
+            self.scales[docno] = scale or 1.0
+            vector = numpy.rint(vector / self.scales[docno])
+        self.index[docno] = vector
+
+    def vectors(self, start=0, end=None):
+        """
+        Return the vectors of the documents at positions `start` to `end` (default: all of them),
+        upcast to float32 if the index matrix is stored with reduced precision.
+        """
+        vectors = self.index[start: end]
+        if self.index.dtype == numpy.int8:
+            return vectors.astype(numpy.float32) * self.scales[start: end, numpy.newaxis]
+        if self.index.dtype == numpy.float16:
+            return vectors.astype(numpy.float32)
+        return vectors
+
+    def dot(self, query):
+        """
+        Return the dot products of the rows of `query` with all index documents, as a
+        #queries x #index array (or a 1D array for a 1D `query`).
+        """
+        if self.index.dtype not in (numpy.float16, numpy.int8):
+            # do a little transposition dance to stop numpy from making a copy of
+            # self.index internally in numpy.dot (very slow).
+            return numpy.dot(self.index, query.T).T
+        # numpy has no fast float16 or int8 matrix products: upcast the matrix block by block
+        result = numpy.empty(query.shape[:-1] + (len(self),), dtype=numpy.float32)
+        block_size = max(1, BLOCK_SIZE // max(1, self.index.shape[1]))
+        for start in xrange(0, len(self), block_size):
+            end = min(len(self), start + block_size)
+            block = numpy.dot(self.index[start: end].astype(numpy.float32), query.T).T
+            if self.index.dtype == numpy.int8:
+                block *= self.scales[start: end]
+            result[..., start: end] = block
+        return result
+
     def get_similarities(self, query):
         """
         Return similarity of sparse vector `query` to all documents in the corpus,
@@ -529,10 +975,12 @@ class MatrixSimilarity(interfaces.SimilarityABC):
 
         """
         is_corpus, query = utils.is_corpus(query)
+        # queries of reduced-precision indexes are computed in float32
+        dtype = numpy.result_type(self.index.dtype, numpy.float32)
         if is_corpus:
             query = numpy.asarray(
                 [matutils.sparse2full(vec, self.num_features) for vec in query],
-                dtype=self.index.dtype)
+                dtype=dtype)
         else:
             if scipy.sparse.issparse(query):
                 query = query.toarray()  # convert sparse to dense
@@ -541,17 +989,44 @@ class MatrixSimilarity(interfaces.SimilarityABC):
             else:
                 # default case: query is a single vector in sparse gensim format
                 query = matutils.sparse2full(query, self.num_features)
-            query = numpy.asarray(query, dtype=self.index.dtype)
+            query = numpy.asarray(query, dtype=dtype)
 
-        # do a little transposition dance to stop numpy from making a copy of
-        # self.index internally in numpy.dot (very slow).
-        result = numpy.dot(self.index, query.T).T  # return #queries x #index
+        result = self.dot(query)  # return #queries x #index
+        result = _drop_deleted(result, getattr(self, 'deleted', None))
         return result  # XXX: removed casting the result from array to list; does anyone care?
 
+    def update_documents(self, docnos, corpus):
+        """
+        Replace the index documents at positions `docnos` with the documents of `corpus`
+        (in the same order). Replacing a deleted document undeletes it.
+        """
+        docnos = _document_positions(docnos, len(self))
+        for docno, vector in izip(docnos, corpus):
+            if scipy.sparse.issparse(vector):
+                vector = vector.toarray().flatten()
+            elif not isinstance(vector, numpy.ndarray):
+                vector = matutils.unitvec(matutils.sparse2full(vector, self.num_features))
+            self.store_vector(docno, vector)
+        self.deleted = numpy.setdiff1d(self.deleted, docnos)
+
+    def delete_documents(self, docnos):
+        """
+        Delete the index documents at positions `docnos`. The positions of the other documents
+        don't change: deleted documents only get zero similarity to all queries (and so are
+        never returned with `num_best`), until `update_documents` replaces them.
+        """
+        self.deleted = numpy.union1d(self.deleted, _document_positions(docnos, len(self)))
+
+    def compact(self):
+        """Zero the vectors of deleted documents, so that they don't have to be tracked anymore."""
+        self.index[self.deleted] = 0
+        self.deleted = numpy.array([], dtype=numpy.int64)
+
     def __str__(self):
         return "%s<%i docs, %i features>" % (self.__class__.__name__, len(self), self.index.shape[1])
 #endclass MatrixSimilarity
 
+
 class WmdSimilarity(interfaces.SimilarityABC):
     """
     Document similarity (like MatrixSimilarity) that uses the negative of WMD
@@ -559,7 +1034,18 @@ class WmdSimilarity(interfaces.SimilarityABC):
     information.
 
     When a `num_best` value is provided, only the most similar documents are
-    retrieved.
+    retrieved. The exact WMD is then only computed for documents whose cheap lower
+    bounds -- the Word Centroid Distance and the Relaxed WMD of Kusner et al. -- are
+    below the `num_best`-th best WMD found so far, which prunes most of the corpus.
+
+    The nBOW representation and word centroid of each corpus document are precomputed.
+    Documents are processed in chunks of `chunksize`; the Euclidean distances between
+    the query words and all words of a chunk are computed at once.
+
+    With `workers` > 1, the chunks are processed in parallel by a pool of worker processes,
+    created on the first query and kept until `close()`. The workers memory-map the word vectors
+    and the index arrays (written to a temporary directory, unless the vectors are memory-mapped
+    already) instead of receiving pickled copies.
 
     When using this code, please consider citing the following papers:
 
@@ -577,18 +1063,23 @@ class WmdSimilarity(interfaces.SimilarityABC):
         >>> query = 'Very good, you should seat outdoor.'
         >>> sims = instance[query]
     """
-    def __init__(self, corpus, w2v_model, num_best=None, normalize_w2v_and_replace=True, chunksize=256):
+    def __init__(self, corpus, w2v_model, num_best=None, normalize_w2v_and_replace=True, chunksize=256, workers=1):
         """
         corpus:                         List of lists of strings, as in gensim.models.word2vec.
         w2v_model:                      A trained word2vec model.
         num_best:                       Number of results to retrieve.
         normalize_w2v_and_replace:      Whether or not to normalize the word2vec vectors to
                                         length 1.
+        chunksize:                      Number of documents processed at once (by one worker).
+        workers:                        Number of worker processes used by queries.
         """
         self.corpus = corpus
         self.w2v_model = w2v_model
         self.num_best = num_best
         self.chunksize = chunksize
+        self.workers = workers
+        self.pool = None
+        self.tmpdir = None
 
         # Normalization of features is not possible, as corpus is a list (of lists) of strings.
         self.normalize = False
@@ -600,13 +1091,91 @@ class WmdSimilarity(interfaces.SimilarityABC):
             # Normalize vectors in word2vec class to length 1.
             w2v_model.init_sims(replace=True)
 
+        self.index_corpus()
+
+    def index_corpus(self):
+        """
+        Precompute the nBOW representation and word centroid of each corpus document. Call this again
+        if the corpus or the word vectors change.
+        """
+        self.close()  # the workers' copies of the arrays are out of date
+        wv = self.w2v_model.wv
+        # corpus words that have a vector without being in the vocabulary (fastText), and their vectors
+        self.oov_words = {}
+        nbows = [wv._nbow(document, self.oov_words) for document in self.corpus]
+        self.oov_vectors = wv._nbow_vectors(sorted(itervalues(self.oov_words)), self.oov_words)
+        self.extended_vectors = None
+        self.doc_offsets = numpy.zeros(len(self.corpus) + 1, dtype=numpy.int64)
+        numpy.cumsum([len(ids) for ids, _ in nbows], out=self.doc_offsets[1:])
+        # vocabulary indexes of the (unique) words of each document, and their normalized frequencies
+        self.doc_words = numpy.concatenate([ids for ids, _ in nbows] + [numpy.zeros(0, dtype=numpy.int64)])
+        self.doc_weights = numpy.concatenate([weights for _, weights in nbows] + [numpy.zeros(0)])
+        self.centroids = numpy.zeros((len(self.corpus), wv.syn0.shape[1]))
+        vectors = self.arrays()[0]
+        for docno, (ids, weights) in enumerate(nbows):
+            self.centroids[docno] = numpy.dot(weights, vectors[ids])
+        logger.info("indexed %i documents with %i words for WMD queries", len(self.corpus), len(self.doc_words))
+
     def __len__(self):
         return len(self.corpus)
 
+    def arrays(self):
+        """Return the (vectors, doc_offsets, doc_words, doc_weights, centroids) arrays used by `_wmd_chunk`."""
+        vectors = self.w2v_model.wv.syn0
+        if len(self.oov_vectors):
+            if self.extended_vectors is None:
+                # the vocabulary vectors, followed by those of `self.oov_words`
+                self.extended_vectors = numpy.concatenate([vectors, self.oov_vectors])
+            vectors = self.extended_vectors
+        return vectors, self.doc_offsets, self.doc_words, self.doc_weights, self.centroids
+
+    def get_pool(self):
+        """Return the pool of worker processes, starting it if needed."""
+        if self.pool is None:
+            import tempfile
+            self.tmpdir = tempfile.mkdtemp(prefix='wmd')
+            specs = []
+            for name, arr in zip(['vectors', 'doc_offsets', 'doc_words', 'doc_weights', 'centroids'], self.arrays()):
+                if not arr.size:
+                    specs.append((None, arr.dtype.str, arr.shape, 0))
+                    continue
+                # reuse memory-mapped files directly (but not views into them, whose offset is unknown)
+                if not (isinstance(arr, numpy.memmap) and isinstance(arr.base, mmap.mmap) and arr.flags.c_contiguous):
+                    fname = os.path.join(self.tmpdir, '%s.npy' % name)
+                    numpy.save(fname, numpy.ascontiguousarray(arr))
+                    arr = numpy.load(fname, mmap_mode='r')
+                specs.append((arr.filename, arr.dtype.str, arr.shape, arr.offset))
+            logger.info("starting %i WMD worker processes", self.workers)
+            self.pool = multiprocessing.Pool(self.workers, initializer=_init_wmd_worker, initargs=(specs,))
+        return self.pool
+
+    def close(self):
+        """Stop the worker processes (if any) and remove their temporary files."""
+        if getattr(self, 'pool', None) is not None:
+            self.pool.terminate()
+            self.pool = None
+        if getattr(self, 'tmpdir', None) is not None:
+            import shutil
+            shutil.rmtree(self.tmpdir, ignore_errors=True)
+            self.tmpdir = None
+
+    def __del__(self):
+        self.close()
+
+    def save(self, *args, **kwargs):
+        # the worker processes can't be stored, and `extended_vectors` is recreated from the model
+        kwargs['ignore'] = _extend_ignore(kwargs.get('ignore'), ['pool', 'tmpdir', 'extended_vectors'])
+        super(WmdSimilarity, self).save(*args, **kwargs)
+
     def get_similarities(self, query):
         """
         **Do not use this function directly; use the self[query] syntax instead.**
+
+        With `num_best` set, documents pruned by their lower bounds get similarity 0.
         """
+        if not PYEMD_EXT:
+            raise ImportError("Please install pyemd Python package to compute WMD.")
+
         if isinstance(query, numpy.ndarray):
             # Convert document indexes to actual documents.
             query = [self.corpus[i] for i in query]
@@ -614,13 +1183,30 @@ class WmdSimilarity(interfaces.SimilarityABC):
         if not isinstance(query[0], list):
             query = [query]
 
-        n_queries = len(query)
+        wv = self.w2v_model.wv
         result = []
-        for qidx in range(n_queries):
-            # Compute similarity for each query.
-            qresult = [self.w2v_model.wmdistance(document, query[qidx]) for document in self.corpus]
-            qresult = numpy.array(qresult)
-            qresult = 1./(1.+qresult)  # Similarity is the negative of the distance.
+        for document in query:
+            oov = dict(self.oov_words)  # new out-of-vocabulary words of the query don't go into the index
+            query_ids, query_weights = wv._nbow(document, oov)
+            query_vectors = wv._nbow_vectors(query_ids, oov)
+            chunks = [
+                (query_ids, query_weights, query_vectors, start, min(start + self.chunksize, len(self.corpus)),
+                 self.num_best)
+                for start in xrange(0, len(self.corpus), self.chunksize)]
+            if getattr(self, 'workers', 1) > 1 and len(chunks) > 1:
+                distances = itertools.chain.from_iterable(self.get_pool().imap_unordered(_wmd_worker, chunks))
+            else:
+                best = []  # shared by all chunks, so that later chunks are pruned by the best documents so far
+                distances = itertools.chain.from_iterable(
+                    _wmd_chunk(self.arrays(), *chunk, best=best) for chunk in chunks)
+            if self.num_best is not None:
+                # merge the `num_best` closest documents of each chunk
+                distances = heapq.nsmallest(self.num_best, distances, key=lambda item: item[1])
+
+            # Similarity is the negative of the distance; documents at infinite distance stay at 0.
+            qresult = numpy.zeros(len(self.corpus))
+            for docno, distance in distances:
+                qresult[docno] = 1. / (1. + distance)
 
             # Append single query result to list of all results.
             result.append(qresult)
@@ -660,6 +1246,7 @@ class SparseMatrixSimilarity(interfaces.SimilarityABC):
         self.normalize = True
         self.chunksize = chunksize
         self.maintain_sparsity = maintain_sparsity
+        self.deleted = numpy.array([], dtype=numpy.int64)
 
         if corpus is not None:
             logger.info("creating sparse index")
@@ -679,11 +1266,8 @@ class SparseMatrixSimilarity(interfaces.SimilarityABC):
                 num_terms = num_features
             if num_terms is None:
                 raise ValueError("refusing to guess the number of sparse features: specify num_features explicitly")
-            corpus = (matutils.scipy2sparse(v) if scipy.sparse.issparse(v) else
-                      (matutils.full2sparse(v) if isinstance(v, numpy.ndarray) else
-                       matutils.unitvec(v)) for v in corpus)
             self.index = matutils.corpus2csc(
-                corpus, num_terms=num_terms, num_docs=num_docs, num_nnz=num_nnz,
+                _sparse_documents(corpus), num_terms=num_terms, num_docs=num_docs, num_nnz=num_nnz,
                 dtype=dtype, printprogress=10000).T
 
             # convert to Compressed Sparse Row for efficient row slicing and multiplications
@@ -730,5 +1314,41 @@ class SparseMatrixSimilarity(interfaces.SimilarityABC):
         else:
             # otherwise, return a 2d matrix (#queries x #index)
             result = result.toarray().T
-        return result
+        return _drop_deleted(result, getattr(self, 'deleted', None))
+
+    def vectors(self, start=0, end=None):
+        """Return the vectors of the documents at positions `start` to `end` (default: all of them)."""
+        return self.index[start: end]
+
+    def update_documents(self, docnos, corpus):
+        """
+        Replace the index documents at positions `docnos` with the documents of `corpus`
+        (in the same order). Replacing a deleted document undeletes it.
+        """
+        docnos = _document_positions(docnos, len(self))
+        rows = matutils.corpus2csc(
+            _sparse_documents(corpus), num_terms=self.index.shape[1], num_docs=len(docnos),
+            dtype=self.index.dtype).T
+        # stack the new rows below the index, then pick them instead of the rows they replace
+        order = numpy.arange(len(self))
+        order[docnos] = len(self) + numpy.arange(len(docnos))
+        self.index = scipy.sparse.vstack([self.index, rows], format='csr')[order]
+        self.deleted = numpy.setdiff1d(self.deleted, docnos)
+
+    def delete_documents(self, docnos):
+        """
+        Delete the index documents at positions `docnos`. The positions of the other documents
+        don't change: deleted documents only get zero similarity to all queries (and so are
+        never returned with `num_best`), until `update_documents` replaces them.
+        """
+        self.deleted = numpy.union1d(self.deleted, _document_positions(docnos, len(self)))
+
+    def compact(self):
+        """Drop the non-zero entries of deleted documents, so that they don't have to be tracked anymore."""
+        if len(self.deleted):
+            keep = numpy.ones(len(self), dtype=self.index.dtype)
+            keep[self.deleted] = 0
+            self.index = (scipy.sparse.diags(keep) * self.index).tocsr()
+            self.index.eliminate_zeros()
+        self.deleted = numpy.array([], dtype=numpy.int64)
 #endclass SparseMatrixSimilarity
@@ -11,6 +11,7 @@ try:
 except ImportError:
     import pickle as _pickle
 
+from gensim import matutils
 from gensim.models.doc2vec import Doc2Vec
 from gensim.models.word2vec import Word2Vec
 try:
@@ -58,23 +59,22 @@ class AnnoyIndexer(object):
     def build_from_word2vec(self):
         """Build an Annoy index using word vectors from a Word2Vec model"""
 
-        self.model.init_sims()
-        return self._build_from_model(self.model.wv.syn0norm, self.model.wv.index2word
+        return self._build_from_model(self.model.wv.syn0, self.model.wv.index2word
                                       , self.model.vector_size)
 
     def build_from_doc2vec(self):
         """Build an Annoy index using document vectors from a Doc2Vec model"""
 
         docvecs = self.model.docvecs
-        docvecs.init_sims()
         labels = [docvecs.index_to_doctag(i) for i in range(0, docvecs.count)]
-        return self._build_from_model(docvecs.doctag_syn0norm, labels, self.model.vector_size)
+        return self._build_from_model(docvecs.doctag_syn0, labels, self.model.vector_size)
 
     def _build_from_model(self, vectors, labels, num_features):
         index = AnnoyIndex(num_features)
 
+        # normalize vector by vector, rather than requiring a normalized copy of all vectors
         for vector_num, vector in enumerate(vectors):
-            index.add_item(vector_num, vector)
+            index.add_item(vector_num, matutils.unitvec(vector))
 
         index.build(self.num_trees)
         self.index = index
@@ -0,0 +1,261 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Licensed under the GNU LGPL v2.1 - http://www.gnu.org/licenses/lgpl.html
+
+"""
+Similarity queries over sparse vectors (such as tf-idf or BM25 weights from `TfidfModel`)
+with an inverted index.
+
+`InvertedIndexSimilarity` stores, for each term, the list of documents containing it with
+their weights ("posting list"). A query only scores the documents sharing terms with it,
+term after term ("term-at-a-time"), instead of multiplying it against the whole index like
+`SparseMatrixSimilarity`. With `num_best` set, it also skips documents that can no longer
+make it into the top `num_best` ("MaxScore" pruning)::
+
+>>> index = InvertedIndexSimilarity(tfidf[corpus], num_features=len(dictionary), num_best=10)
+>>> index[tfidf[query]]
+[(4, 0.8), (2, 0.13), (3, 0.13)]
+
+>>> index.save(fname)
+>>> index = InvertedIndexSimilarity.load(fname, mmap='r')  # posting lists are memory-mapped
+
+"""
+
+import logging
+
+import numpy
+import scipy.sparse
+from six.moves import xrange, zip as izip
+
+from gensim import interfaces, utils, matutils
+from gensim.similarities.docsim import _sparse_documents
+
+
+logger = logging.getLogger(__name__)
+
+# keep the scores of a query in a dense array once more than this fraction of the index documents are candidates
+DENSE_FRACTION = 0.05
+
+
+class InvertedIndexSimilarity(interfaces.SimilarityABC):
+    """
+    Compute similarity (dot product of normalized vectors = cosine, by default) against a corpus
+    of sparse documents, by scoring only the documents that share terms with the query.
+
+    The posting lists are stored as a `scipy.sparse.csc_matrix` of #documents x #terms: the
+    documents and weights of term `t` are `index.indices[index.indptr[t]:index.indptr[t + 1]]`
+    and `index.data[...]`, sorted by document. Saved with `save()`, they can be memory-mapped
+    back with `load(fname, mmap='r')`, so that a query only reads the posting lists of its terms.
+
+    With `num_best` set, query terms are processed in order of decreasing maximum contribution
+    to any document score. As soon as the terms not processed yet can't add up to the `num_best`-th
+    best score found so far, no new document can reach the top `num_best`: the remaining terms are
+    only looked up for the current candidates, and candidates that can't make it are dropped. This
+    pruning needs non-negative weights (as in tf-idf and BM25); otherwise, all postings are scored.
+
+    See also `SparseMatrixSimilarity` in `gensim.similarities.docsim`.
+
+    """
+    def __init__(self, corpus, num_features=None, num_best=None, chunksize=256, dtype=numpy.float32, norm='l2'):
+        """
+        `num_features` is the number of features (terms) in the corpus; it is taken from the corpus
+        if it knows it (like `MmCorpus`). See `Similarity` for description of `num_best` and `chunksize`.
+
+        Documents in sparse gensim format are normalized to unit length by `norm`: 'l1', 'l2' or
+        None to index the weights as they are (e.g. for BM25 scores, also set `index.normalize = False`
+        to leave the query weights unchanged).
+
+        """
+        self.num_best = num_best
+        self.normalize = True
+        self.chunksize = chunksize
+        self.norm = norm
+
+        if corpus is not None:
+            num_docs = num_nnz = None
+            try:
+                # use the more efficient corpus generation version, if the input
+                # `corpus` is MmCorpus-like (knows its shape and number of non-zeroes).
+                num_terms, num_docs, num_nnz = corpus.num_terms, corpus.num_docs, corpus.num_nnz
+            except AttributeError:
+                num_terms = None
+            if num_features is not None:
+                num_terms = num_features
+            if num_terms is None:
+                raise ValueError("refusing to guess the number of sparse features: specify num_features explicitly")
+            logger.info("creating inverted index")
+            # the transposed (terms x documents) CSC matrix is a CSR matrix of documents x terms;
+            # converting it to CSC groups the entries by term, sorted by document within each term
+            self.index = matutils.corpus2csc(
+                _sparse_documents(corpus, norm), num_terms=num_terms, num_docs=num_docs, num_nnz=num_nnz,
+                dtype=dtype, printprogress=10000).T.tocsc()
+            self.index.sum_duplicates()
+
+            # the largest weight of each term, bounding its contribution to any document score
+            weights = numpy.abs(self.index.data)
+            self.max_weights = numpy.zeros(self.index.shape[1], dtype=dtype)
+            nonempty = numpy.diff(self.index.indptr) > 0
+            if weights.size:
+                self.max_weights[nonempty] = numpy.maximum.reduceat(weights, self.index.indptr[:-1][nonempty])
+            self.nonnegative = not (self.index.data < 0).any()
+            logger.info("created %r", self.index)
+
+    def __len__(self):
+        return self.index.shape[0]
+
+    def __str__(self):
+        return "%s<%i docs, %i features>" % (self.__class__.__name__, len(self), self.index.shape[1])
+
+    def query_vectors(self, query):
+        """
+        Return `query` (a document or a corpus, in sparse gensim, numpy or scipy.sparse format)
+        as a list of (term ids, weights) arrays, one per document, and whether it was a single document.
+        """
+        is_corpus, query = utils.is_corpus(query)
+        if scipy.sparse.issparse(query):
+            query = query.tocsr()
+            vectors = [
+                (query.indices[query.indptr[i]: query.indptr[i + 1]], query.data[query.indptr[i]: query.indptr[i + 1]])
+                for i in xrange(query.shape[0])]
+            return vectors, query.shape[0] == 1 and not is_corpus
+        if isinstance(query, numpy.ndarray):
+            rows = query.reshape(-1, query.shape[-1])
+            vectors = [(numpy.nonzero(row)[0], row[numpy.nonzero(row)[0]]) for row in rows]
+            return vectors, query.ndim == 1
+        vectors = []
+        for doc in (query if is_corpus else [query]):
+            doc = numpy.asarray(doc, dtype=float).reshape(-1, 2)
+            vectors.append((doc[:, 0].astype(numpy.int64), doc[:, 1]))
+        return vectors, not is_corpus
+
+    def score(self, term_ids, weights, num_best=None):
+        """
+        Return the (document ids, similarities) of the index documents that share terms with the
+        query vector (`term_ids`, `weights`).
+
+        With `num_best`, documents that can't be among the `num_best` most similar may be left out,
+        but the similarities returned for the `num_best` most similar documents are exact.
+
+        """
+        indptr, indices, data = self.index.indptr, self.index.indices, self.index.data
+        term_ids = numpy.asarray(term_ids, dtype=numpy.int64)
+        weights = numpy.asarray(weights, dtype=float)
+        known = (term_ids >= 0) & (term_ids < self.index.shape[1])
+        term_ids, weights = term_ids[known], weights[known]
+
+        # process the terms with the shortest posting lists first, so that the long lists of frequent
+        # terms are likely only looked up for the candidates; remaining[i] bounds the total contribution
+        # of terms i, i+1, ... to any document score
+        bounds = numpy.abs(weights) * self.max_weights[term_ids]
+        order = numpy.argsort(indptr[term_ids + 1] - indptr[term_ids], kind='mergesort')
+        term_ids, weights = term_ids[order], weights[order]
+        remaining = numpy.cumsum(bounds[order][::-1])[::-1]
+        prune = bool(num_best) and self.nonnegative and not (weights < 0).any()
+
+        docs, scores = numpy.zeros(0, dtype=indices.dtype), numpy.zeros(0)
+        accumulator = None  # scores of all index documents, once there are many candidates
+        # scores only grow, so an old `num_best`-th best score stays a valid threshold; only recompute it
+        # after scoring at least as many postings as it costs, to keep the cost of pruning in check
+        threshold, work = 0.0, 0
+        for i, (term_id, weight) in enumerate(izip(term_ids, weights)):
+            start, end = indptr[term_id], indptr[term_id + 1]
+            if start == end:
+                continue
+            candidates = scores if accumulator is None else accumulator
+            if prune and len(candidates) >= num_best:
+                if remaining[i] >= threshold and work >= len(candidates):
+                    threshold = numpy.partition(candidates, len(candidates) - num_best)[len(candidates) - num_best]
+                    work = 0
+                if remaining[i] < threshold:
+                    # no document outside the candidates can reach the `num_best` best scores anymore:
+                    # drop the candidates that can't either, and only look up the rest in the postings
+                    if accumulator is not None:
+                        docs = numpy.flatnonzero(accumulator)
+                        scores, accumulator = accumulator[docs], None
+                    alive = scores + remaining[i] >= threshold
+                    docs, scores = docs[alive], scores[alive]
+                    postings = indices[start: end]
+                    positions = numpy.searchsorted(postings, docs)
+                    found = positions < len(postings)
+                    found[found] = postings[positions[found]] == docs[found]
+                    scores[found] += weight * data[start + positions[found]]
+                    work += len(docs)
+                    continue
+            work += end - start
+            if accumulator is not None:
+                accumulator[indices[start: end]] += weight * data[start: end]
+                continue
+            # merge all postings of the term into the candidates: both are sorted by document, so a
+            # stable sort of the two (timsort) is linear; then sum the scores of each document
+            merged = numpy.concatenate([docs, indices[start: end]])
+            order = numpy.argsort(merged, kind='mergesort')
+            merged, merged_scores = merged[order], numpy.concatenate([scores, weight * data[start: end]])[order]
+            starts = numpy.concatenate([[0], numpy.flatnonzero(merged[1:] != merged[:-1]) + 1])
+            docs, scores = merged[starts], numpy.add.reduceat(merged_scores, starts)
+            if len(docs) > DENSE_FRACTION * len(self):
+                accumulator = numpy.zeros(len(self))
+                accumulator[docs] = scores
+        if accumulator is not None:
+            docs = numpy.flatnonzero(accumulator)
+            scores = accumulator[docs]
+        return docs, scores
+
+    def get_similarities(self, query):
+        """
+        Return similarity of sparse vector `query` to all documents in the corpus,
+        as a numpy array.
+
+        If `query` is a collection of documents, return a 2D array of similarities
+        of each document in `query` to all documents in the corpus (=batch query,
+        faster than processing each document in turn).
+
+        **Do not use this function directly; use the self[query] syntax instead.**
+
+        """
+        vectors, single = self.query_vectors(query)
+        result = numpy.zeros((len(vectors), len(self)), dtype=self.index.dtype)
+        for row, (term_ids, weights) in izip(result, vectors):
+            docs, scores = self.score(term_ids, weights)
+            row[docs] = scores
+        return result[0] if single else result
+
+    def __getitem__(self, query):
+        """
+        Get similarities of document `query` to all documents in the corpus, or of each
+        document of `query`, if it is a corpus. See `SimilarityABC`.
+
+        With `num_best` set, only the documents sharing terms with the query are ranked,
+        without creating a similarity array over the whole index.
+        """
+        if self.num_best is None:
+            return super(InvertedIndexSimilarity, self).__getitem__(query)
+
+        is_corpus, query = utils.is_corpus(query)
+        if self.normalize and not matutils.ismatrix(query):
+            query = [matutils.unitvec(v) for v in query] if is_corpus else matutils.unitvec(query)
+        vectors, single = self.query_vectors(query)
+        result = []
+        for term_ids, weights in vectors:
+            docs, scores = self.score(term_ids, weights, self.num_best)
+            magnitudes = numpy.abs(scores)
+            best = matutils.argsort(magnitudes, topn=self.num_best, reverse=True)
+            result.append([(int(docs[i]), float(scores[i])) for i in best if magnitudes[i] > 1e-9])
+        return result[0] if single else result
+
+    def __iter__(self):
+        """
+        For each index document, compute its similarity against all documents in the
+        index and yield the result.
+        """
+        # turn off query normalization (vectors in the index are already normalized)
+        norm, self.normalize = self.normalize, False
+        documents = self.index.tocsr()
+        chunksize = max(1, self.chunksize)
+        for chunk_start in xrange(0, len(self), chunksize):
+            chunk = documents[chunk_start: chunk_start + chunksize]
+            sims = self[chunk]
+            for sim in (sims if chunk.shape[0] > 1 else [sims]):
+                yield sim
+        self.normalize = norm
+#endclass InvertedIndexSimilarity
@@ -0,0 +1,189 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Licensed under the GNU LGPL v2.1 - http://www.gnu.org/licenses/lgpl.html
+
+"""
+Approximate nearest neighbour search over word or document vectors, in pure NumPy.
+
+`IvfIndexer` is an inverted file ("IVF") index: the normalized vectors are clustered
+by spherical k-means into `num_lists` lists, and a query only scans the vectors in the
+`num_probes` lists whose centroids are most similar to it. Use it the same way as
+`gensim.similarities.index.AnnoyIndexer`, but without any external dependency::
+
+>>> indexer = IvfIndexer(model, num_lists=100)
+>>> model.most_similar('science', topn=10, indexer=indexer)
+
+>>> indexer.save(fname)
+>>> indexer = IvfIndexer.load(fname, mmap='r')
+
+Increase `indexer.num_probes` for better recall at the cost of speed (with
+`num_probes == num_lists`, the results are exact). To see the recall/latency trade-off
+on your machine, run ``python -m gensim.test.ivfspeed``.
+
+"""
+
+import logging
+
+import numpy
+import scipy.sparse
+from six.moves import xrange
+
+from gensim import utils, matutils
+
+
+logger = logging.getLogger(__name__)
+
+BLOCK_SIZE = 4 * 1024 * 1024  # max. number of similarities computed at once while clustering
+
+
+def _nearest_centroids(vectors, centroids):
+    """Return the index of the most similar (=highest dot product) centroid, for each row of `vectors`."""
+    nearest = numpy.empty(len(vectors), dtype=numpy.int32)
+    block_size = max(1, BLOCK_SIZE // len(centroids))
+    for start in xrange(0, len(vectors), block_size):
+        block = vectors[start: start + block_size]
+        nearest[start: start + len(block)] = numpy.dot(block, centroids.T).argmax(axis=1)
+    return nearest
+
+
+def _normalize_rows(vectors):
+    """Return `vectors` scaled to unit length in place; rows of all zeros are left unchanged."""
+    lengths = numpy.sqrt((vectors ** 2).sum(axis=1))
+    lengths[lengths == 0.0] = 1.0
+    vectors /= lengths[:, numpy.newaxis]
+    return vectors
+
+
+class IvfIndexer(utils.SaveLoad):
+    """
+    Inverted file index over the normalized vectors of a Word2Vec/Doc2Vec model or KeyedVectors,
+    usable as the `indexer` argument of `most_similar`.
+
+    The index keeps its own copy of the vectors, reordered so that the vectors of each list are stored
+    contiguously. Saved with `save()`, all arrays can be memory-mapped back with `load(fname, mmap='r')`.
+
+    """
+    def __init__(self, model=None, num_lists=None, num_probes=10, iterations=10, sample_size=None, seed=1):
+        """
+        Build the index from `model` (Word2Vec, Doc2Vec or KeyedVectors instance), if given.
+
+        `num_lists` is the number of clusters; default is the square root of the number of vectors.
+        `num_probes` is the number of lists scanned per query; it can be changed at any time.
+        The k-means centroids are trained for `iterations` passes over a random sample of `sample_size`
+        vectors (default `256 * num_lists`), using random seed `seed`.
+
+        """
+        self.num_lists = num_lists
+        self.num_probes = num_probes
+        self.iterations = iterations
+        self.sample_size = sample_size
+        self.seed = seed
+        self.centroids = None
+        self.offsets = None  # vectors of list `i` are `vectors[offsets[i]:offsets[i + 1]]`
+        self.ids = None  # original position of each (reordered) vector
+        self.vectors = None
+        self.labels = None
+
+        if model is not None:
+            if hasattr(model, 'docvecs'):
+                self.build_from_doc2vec(model)
+            elif hasattr(model, 'wv'):
+                self.build_from_word2vec(model)
+            elif hasattr(model, 'syn0'):
+                self.build_from_keyedvectors(model)
+            else:
+                raise ValueError("Only a Word2Vec, Doc2Vec or KeyedVectors instance can be used")
+
+    def build_from_word2vec(self, model):
+        """Build the index from the word vectors of a Word2Vec model."""
+        return self.build_from_keyedvectors(model.wv)
+
+    def build_from_keyedvectors(self, wv):
+        """Build the index from the vectors of a KeyedVectors instance."""
+        return self.build(wv.syn0, wv.index2word)
+
+    def build_from_doc2vec(self, model):
+        """Build the index from the document vectors of a Doc2Vec model."""
+        docvecs = model.docvecs
+        labels = [docvecs.index_to_doctag(i) for i in xrange(docvecs.count)]
+        return self.build(docvecs.doctag_syn0, labels)
+
+    def build(self, vectors, labels):
+        """
+        Build the index from the 2D array `vectors`, one row per item; `labels[i]` is the label returned
+        for the item in row `i`. The rows are normalized to unit length in the index copy.
+        """
+        vectors = _normalize_rows(numpy.array(vectors, dtype=numpy.float32))
+        num_vectors = len(vectors)
+        if not num_vectors:
+            raise ValueError("cannot build an index over no vectors")
+        if len(labels) != num_vectors:
+            raise ValueError("got %i labels for %i vectors" % (len(labels), num_vectors))
+        num_lists = self.num_lists or int(numpy.sqrt(num_vectors))
+        self.num_lists = num_lists = max(1, min(num_lists, num_vectors))
+        random_state = utils.get_random_state(self.seed)
+
+        # train the centroids on a sample of the vectors
+        sample_size = min(num_vectors, self.sample_size or 256 * num_lists)
+        if sample_size < num_vectors:
+            sample = vectors[random_state.choice(num_vectors, sample_size, replace=False)]
+        else:
+            sample = vectors
+        logger.info(
+            "clustering %i of %i vectors into %i lists, %i iterations",
+            len(sample), num_vectors, num_lists, self.iterations)
+        centroids = sample[random_state.choice(len(sample), num_lists, replace=False)].copy()
+        for iteration in xrange(self.iterations):
+            assignments = _nearest_centroids(sample, centroids)
+            # sum up the vectors of each cluster, as a (sparse one-hot) matrix product
+            membership = scipy.sparse.csr_matrix(
+                (numpy.ones(len(sample), dtype=numpy.float32), (assignments, numpy.arange(len(sample)))),
+                shape=(num_lists, len(sample)))
+            centroids = numpy.asarray(membership.dot(sample), dtype=numpy.float32)
+            empty = numpy.flatnonzero(numpy.bincount(assignments, minlength=num_lists) == 0)
+            if len(empty):
+                # restart clusters that lost all their vectors from random sample vectors
+                centroids[empty] = sample[random_state.choice(len(sample), len(empty), replace=False)]
+            centroids = _normalize_rows(centroids)
+            logger.debug("k-means iteration #%i: %i empty lists restarted", iteration, len(empty))
+
+        # assign all vectors to their lists, and store each list contiguously
+        assignments = _nearest_centroids(vectors, centroids)
+        self.ids = numpy.argsort(assignments, kind='mergesort').astype(numpy.int64)
+        self.offsets = numpy.zeros(num_lists + 1, dtype=numpy.int64)
+        numpy.cumsum(numpy.bincount(assignments, minlength=num_lists), out=self.offsets[1:])
+        self.vectors = vectors[self.ids]
+        self.centroids = centroids
+        self.labels = labels
+        logger.info("built %s", self)
+        return self
+
+    def __str__(self):
+        return "%s<%i vectors, %i lists, %i probes>" % (
+            self.__class__.__name__, 0 if self.ids is None else len(self.ids), self.num_lists, self.num_probes)
+
+    def __len__(self):
+        return 0 if self.ids is None else len(self.ids)
+
+    def query(self, vector, num_neighbors):
+        """
+        Return the positions (in the vectors the index was built from) of the approximately `num_neighbors`
+        vectors most similar to `vector`, plus their cosine similarities, most similar first.
+        """
+        vector = numpy.asarray(vector, dtype=numpy.float32)
+        num_probes = max(1, min(self.num_probes, self.num_lists))
+        probes = matutils.argsort(numpy.dot(self.centroids, vector), topn=num_probes, reverse=True)
+        ranges = [(self.offsets[probe], self.offsets[probe + 1]) for probe in sorted(probes)]
+        positions = numpy.concatenate([numpy.arange(start, end) for start, end in ranges])
+        if len(positions) == self.offsets[-1]:
+            sims = numpy.dot(self.vectors, vector)
+        else:
+            sims = numpy.concatenate([numpy.dot(self.vectors[start:end], vector) for start, end in ranges])
+        best = matutils.argsort(sims, topn=num_neighbors, reverse=True)
+        return self.ids[positions[best]], sims[best]
+
+    def most_similar(self, vector, num_neighbors):
+        """Find the top-N most similar items, as a list of (label, cosine similarity) 2-tuples."""
+        ids, sims = self.query(matutils.unitvec(vector), num_neighbors)
+        return [(self.labels[item_id], float(sim)) for item_id, sim in zip(ids, sims)]
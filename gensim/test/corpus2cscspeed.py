@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Licensed under the GNU LGPL v2.1 - http://www.gnu.org/licenses/lgpl.html
+
+"""
+USAGE: %(program)s [NUMDOCS [NUMTERMS [DOCLENGTH]]]
+    Measure the speed of converting between sparse documents and numpy/scipy matrices in \
+gensim.matutils: corpus2csc (with and without the corpus shape known upfront, for documents \
+as lists of 2-tuples and as numpy arrays), and, on 10000 dense vectors of 300 topics, full2sparse, \
+sparse2full and corpus2dense. The corpus is NUMDOCS random documents (default 100000) of \
+DOCLENGTH non-zeros (default 50) over NUMTERMS features (default 100000).
+    This is a manual benchmark, like simspeed.py: it isn't run by the test suite and checks \
+nothing; compare its output before and after a change. test_matutils.py only checks that the \
+conversions process a block of documents at once.
+
+Example: ./corpus2cscspeed.py 100000 100000 50
+"""
+
+import logging
+import sys
+import os
+from time import time
+
+import numpy as np
+
+from gensim import matutils
+
+
+NUM_TOPICS = 300
+
+
+def timed(fnc):
+    """Return the seconds taken by calling `fnc`."""
+    start = time()
+    fnc()
+    return time() - start
+
+
+if __name__ == '__main__':
+    logging.basicConfig(format='%(asctime)s : %(levelname)s : %(message)s', level=logging.WARNING)
+
+    program = os.path.basename(sys.argv[0])
+    if len(sys.argv) > 1 and not sys.argv[1].isdigit():
+        print(globals()['__doc__'] % locals())
+        sys.exit(1)
+    num_docs = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    num_terms = int(sys.argv[2]) if len(sys.argv) > 2 else 100000
+    doc_length = int(sys.argv[3]) if len(sys.argv) > 3 else 50
+
+    random_state = np.random.RandomState(0)
+    termids = np.sort(random_state.randint(num_terms, size=(num_docs, doc_length)), axis=1)
+    weights = random_state.rand(num_docs, doc_length)
+    corpus = [list(zip(ids, values)) for ids, values in zip(termids.tolist(), weights.tolist())]
+    arrays = list(zip(termids, weights))
+    num_nnz = num_docs * doc_length
+    print("%i documents, %i features, %i non-zeros" % (num_docs, num_terms, num_nnz))
+
+    def report(name, taken, count, unit):
+        print("%s: %.2fs (%.0f %s/s)" % (name, taken, count / taken, unit))
+
+    report("corpus2csc", timed(lambda: matutils.corpus2csc(corpus)), num_docs, "documents")
+    report("corpus2csc, known shape", timed(lambda: matutils.corpus2csc(
+        corpus, num_terms=num_terms, num_docs=num_docs, num_nnz=num_nnz)), num_docs, "documents")
+    report("corpus2csc, numpy documents", timed(lambda: matutils.corpus2csc(arrays)), num_docs, "documents")
+
+    # dense round trips: fully dense topic vectors, as output by LSI or LDA
+    vectors = random_state.rand(10000, NUM_TOPICS)
+    topics = [matutils.full2sparse(vec) for vec in vectors]
+    report("full2sparse", timed(lambda: [matutils.full2sparse(vec) for vec in vectors]), len(vectors), "vectors")
+    report("sparse2full", timed(lambda: [matutils.sparse2full(doc, NUM_TOPICS) for doc in topics]), len(topics), "vectors")
+    report("corpus2dense", timed(lambda: matutils.corpus2dense(topics, NUM_TOPICS, num_docs=len(topics))), len(topics), "vectors")
@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Licensed under the GNU LGPL v2.1 - http://www.gnu.org/licenses/lgpl.html
+
+"""
+USAGE: %(program)s [NUMDOCS [DOCLENGTH [VOCABSIZE]]]
+    Measure the speed of converting tokenized documents to bag-of-words with \
+gensim.corpora.Dictionary: `doc2bow` one document at a time, compared against the original \
+per-token implementation, and `doc2bow_many` on chunks of 10000 documents, returning lists \
+of 2-tuples and CSR arrays. The corpus is NUMDOCS random documents (default 1000000) of \
+DOCLENGTH tokens (default 100) drawn from a Zipf distribution over VOCABSIZE words (default 100000).
+
+Example: ./doc2bowspeed.py 3000000 100 100000
+"""
+
+import logging
+import sys
+import os
+from collections import defaultdict
+from time import time
+
+import numpy as np
+
+from gensim import utils
+from gensim.corpora import Dictionary
+
+if sys.version_info[0] >= 3:
+    unicode = str
+
+
+CHUNKSIZE = 10000
+
+
+def doc2bow_reference(dictionary, document):
+    """The original doc2bow (without `allow_update`): check and count every token, then sort."""
+    counter = defaultdict(int)
+    for w in document:
+        counter[w if isinstance(w, unicode) else unicode(w, 'utf-8')] += 1
+    token2id = dictionary.token2id
+    result = dict((token2id[w], freq) for w, freq in counter.items() if w in token2id)
+    return sorted(result.items())
+
+
+def timed(fnc):
+    """Return the seconds taken by calling `fnc`."""
+    start = time()
+    fnc()
+    return time() - start
+
+
+if __name__ == '__main__':
+    logging.basicConfig(format='%(asctime)s : %(levelname)s : %(message)s', level=logging.WARNING)
+
+    program = os.path.basename(sys.argv[0])
+    if len(sys.argv) > 1 and not sys.argv[1].isdigit():
+        print(globals()['__doc__'] % locals())
+        sys.exit(1)
+    num_docs = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    doc_length = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    vocab_size = int(sys.argv[3]) if len(sys.argv) > 3 else 100000
+
+    random_state = np.random.RandomState(0)
+    words = [u'word%i' % i for i in range(vocab_size)]
+    texts = []
+    for start in range(0, num_docs, CHUNKSIZE):
+        ids = random_state.zipf(1.2, size=(min(CHUNKSIZE, num_docs - start), doc_length)) % vocab_size
+        texts.extend([words[i] for i in doc] for doc in ids.tolist())
+    num_tokens = num_docs * doc_length
+    print("%i documents, %i tokens" % (num_docs, num_tokens))
+
+    def report(name, taken):
+        print("%s: %.2fs (%.0f documents/s, %.0f tokens/s)" % (name, taken, num_docs / taken, num_tokens / taken))
+
+    dictionary = Dictionary()
+    report("add_documents", timed(lambda: dictionary.add_documents(texts, prune_at=None)))
+    report("doc2bow, reference", timed(lambda: [doc2bow_reference(dictionary, text) for text in texts]))
+    report("doc2bow", timed(lambda: [dictionary.doc2bow(text) for text in texts]))
+    report("doc2bow_many", timed(lambda: [
+        dictionary.doc2bow_many(chunk) for chunk in utils.chunkize_serial(texts, CHUNKSIZE)]))
+    report("doc2bow_many, as_csr", timed(lambda: [
+        dictionary.doc2bow_many(chunk, as_csr=True) for chunk in utils.chunkize_serial(texts, CHUNKSIZE)]))
@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Licensed under the GNU LGPL v2.1 - http://www.gnu.org/licenses/lgpl.html
+
+"""
+USAGE: %(program)s [NUMDOCS [DOCLENGTH [VOCABSIZE]]]
+    Measure the speed of converting tokenized documents to bag-of-words with \
+gensim.corpora.HashDictionary: `doc2bow` with the default adler32 hash and debug mappings, \
+and without debug mappings using murmurhash3, one document at a time and with `doc2bow_many` \
+on chunks of 10000 documents. The corpus is NUMDOCS random documents (default 100000) of \
+DOCLENGTH tokens (default 100) drawn from a Zipf distribution over VOCABSIZE words (default 100000).
+
+Example: ./hashdictspeed.py 1000000 100 100000
+"""
+
+import logging
+import sys
+import os
+from time import time
+
+import numpy as np
+
+from gensim import utils
+from gensim.corpora import hashdictionary
+from gensim.corpora.hashdictionary import HashDictionary, murmurhash3
+
+
+CHUNKSIZE = 10000
+
+
+def timed(fnc):
+    """Return the seconds taken by calling `fnc`."""
+    start = time()
+    fnc()
+    return time() - start
+
+
+if __name__ == '__main__':
+    logging.basicConfig(format='%(asctime)s : %(levelname)s : %(message)s', level=logging.WARNING)
+
+    program = os.path.basename(sys.argv[0])
+    if len(sys.argv) > 1 and not sys.argv[1].isdigit():
+        print(globals()['__doc__'] % locals())
+        sys.exit(1)
+    num_docs = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    doc_length = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    vocab_size = int(sys.argv[3]) if len(sys.argv) > 3 else 100000
+
+    random_state = np.random.RandomState(0)
+    words = [u'word%i' % i for i in range(vocab_size)]
+    texts = []
+    for start in range(0, num_docs, CHUNKSIZE):
+        ids = random_state.zipf(1.2, size=(min(CHUNKSIZE, num_docs - start), doc_length)) % vocab_size
+        texts.extend([words[i] for i in doc] for doc in ids.tolist())
+    num_tokens = num_docs * doc_length
+    print("%i documents, %i tokens, compiled murmurhash3: %s" % (
+        num_docs, num_tokens, hashdictionary._murmurhash3 is not None))
+
+    def report(name, taken):
+        print("%s: %.2fs (%.0f documents/s, %.0f tokens/s)" % (name, taken, num_docs / taken, num_tokens / taken))
+
+    dictionary = HashDictionary(id_range=2 ** 20)
+    report("doc2bow, adler32, debug", timed(lambda: [dictionary.doc2bow(text) for text in texts]))
+    dictionary = HashDictionary(id_range=2 ** 20, myhash=murmurhash3, debug=False)
+    report("doc2bow, murmurhash3", timed(lambda: [dictionary.doc2bow(text) for text in texts]))
+    report("doc2bow_many, murmurhash3", timed(lambda: [
+        dictionary.doc2bow_many(chunk) for chunk in utils.chunkize_serial(texts, CHUNKSIZE)]))
+    report("doc2bow_many, murmurhash3, as_csr", timed(lambda: [
+        dictionary.doc2bow_many(chunk, as_csr=True) for chunk in utils.chunkize_serial(texts, CHUNKSIZE)]))
+    dictionary.signed = True
+    report("doc2bow_many, murmurhash3, signed, as_csr", timed(lambda: [
+        dictionary.doc2bow_many(chunk, as_csr=True) for chunk in utils.chunkize_serial(texts, CHUNKSIZE)]))
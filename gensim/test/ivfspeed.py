@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Licensed under the GNU LGPL v2.1 - http://www.gnu.org/licenses/lgpl.html
+
+"""
+USAGE: %(program)s VECTORS [DIMENSIONS] [NUMQUERIES]
+    Run recall vs. latency test of the approximate IvfIndexer against brute force \
+most_similar. VECTORS is either a file in the word2vec C format (binary if it ends \
+with .bin), or the number of synthetic, clustered random vectors of DIMENSIONS \
+dimensions to generate. NUMQUERIES vectors (default 1000) of the index are used \
+as queries, and recall@10 is reported for an increasing number of probed lists.
+
+Example: ./ivfspeed.py GoogleNews-vectors-negative300.bin
+         ./ivfspeed.py 1000000 100
+"""
+
+import logging
+import sys
+import os
+from time import time
+
+import numpy as np
+
+from gensim.models.keyedvectors import KeyedVectors
+from gensim.similarities import IvfIndexer
+
+
+TOPN = 10
+
+
+def synthetic_vectors(num_vectors, dim, num_clusters=1000, seed=0):
+    """Random unit vectors scattered around `num_clusters` random centres (uniform vectors have no neighbours)."""
+    random_state = np.random.RandomState(seed)
+    centres = random_state.randn(num_clusters, dim).astype(np.float32)
+    kv = KeyedVectors()
+    kv.syn0 = centres[random_state.randint(num_clusters, size=num_vectors)]
+    kv.syn0 += random_state.randn(num_vectors, dim).astype(np.float32)
+    kv.index2word = [str(i) for i in range(num_vectors)]
+    for index, word in enumerate(kv.index2word):
+        kv.vocab.add(word, index=index, count=1)
+    return kv
+
+
+if __name__ == '__main__':
+    logging.basicConfig(format='%(asctime)s : %(levelname)s : %(message)s', level=logging.WARNING)
+
+    program = os.path.basename(sys.argv[0])
+    if len(sys.argv) < 2:
+        print(globals()['__doc__'] % locals())
+        sys.exit(1)
+    if os.path.exists(sys.argv[1]):
+        kv = KeyedVectors.load_word2vec_format(sys.argv[1], binary=sys.argv[1].endswith('.bin'))
+        args = sys.argv[2:]
+    else:
+        kv = synthetic_vectors(int(sys.argv[1]), int(sys.argv[2]))
+        args = sys.argv[3:]
+    num_queries = int(args[0]) if args else 1000
+    kv.init_sims()
+    queries = [kv.syn0norm[i] for i in np.random.RandomState(1).choice(len(kv.syn0norm), num_queries, replace=False)]
+    print("%i vectors x %i dimensions, %i queries" % (kv.syn0norm.shape + (num_queries,)))
+
+    start = time()
+    exact = [set(word for word, _ in kv.most_similar([query], topn=TOPN)) for query in queries]
+    brute_ms = 1000.0 * (time() - start) / num_queries
+    print("brute force: %.3f ms/query" % brute_ms)
+
+    start = time()
+    indexer = IvfIndexer(kv)
+    print("built %s in %.1fs" % (indexer, time() - start))
+    num_probes = 1
+    while num_probes <= indexer.num_lists:
+        indexer.num_probes = num_probes
+        start = time()
+        approx = [kv.most_similar([query], topn=TOPN, indexer=indexer) for query in queries]
+        taken_ms = 1000.0 * (time() - start) / num_queries
+        recall = np.mean([len(e.intersection(word for word, _ in a)) / float(TOPN) for e, a in zip(exact, approx)])
+        print("%4i probes: recall@%i %.3f, %.3f ms/query, speedup %.1fx" % (
+            num_probes, TOPN, recall, taken_ms, brute_ms / taken_ms))
+        num_probes *= 2
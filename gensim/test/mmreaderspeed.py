@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Licensed under the GNU LGPL v2.1 - http://www.gnu.org/licenses/lgpl.html
+
+"""
+USAGE: %(program)s CORPUS.mm [NUMDOCS]
+    Compare the speed of reading a corpus in Matrix Market format with the pure Python \
+parser and with the compiled parser from gensim.matutils_inner: iterating over the corpus, \
+iterating over it as numpy arrays (`iter_arrays`) and fetching NUMDOCS random documents by \
+their offset (default 10000; needs the CORPUS.mm.index file written by `MmCorpus.serialize`).
+
+Example: ./mmreaderspeed.py wiki_en_tfidf.mm
+"""
+
+import logging
+import sys
+import os
+from time import time
+
+import numpy as np
+
+from gensim import matutils
+from gensim.corpora import MmCorpus
+
+
+def timed(fnc):
+    """Return the seconds taken by calling `fnc`."""
+    start = time()
+    fnc()
+    return time() - start
+
+
+def consume(iterable):
+    for _ in iterable:
+        pass
+
+
+if __name__ == '__main__':
+    logging.basicConfig(format='%(asctime)s : %(levelname)s : %(message)s', level=logging.WARNING)
+
+    program = os.path.basename(sys.argv[0])
+    if len(sys.argv) < 2:
+        print(globals()['__doc__'] % locals())
+        sys.exit(1)
+    if matutils.parse_mm_entries is None:
+        print("the compiled parser gensim.matutils_inner is not available; build it with `python setup.py build_ext --inplace`")
+        sys.exit(1)
+
+    corpus = MmCorpus(sys.argv[1])
+    num_docs = int(sys.argv[2]) if len(sys.argv) > 2 else 10000
+    docnos = np.random.RandomState(0).randint(len(corpus), size=num_docs)
+    print(corpus)
+
+    parse_mm_entries = matutils.parse_mm_entries
+    for name, parser in [('python', None), ('compiled', parse_mm_entries)]:
+        matutils.parse_mm_entries = parser
+        taken = timed(lambda: consume(corpus))
+        line = "%s: iteration %.1fs (%.0f nnz/s)" % (name, taken, corpus.num_nnz / taken)
+        taken = timed(lambda: consume(corpus.iter_arrays()))
+        line += ", iter_arrays %.1fs (%.0f nnz/s)" % (taken, corpus.num_nnz / taken)
+        if corpus.index is not None:
+            taken = timed(lambda: [corpus[docno] for docno in docnos])
+            line += ", %i random documents %.2fs" % (num_docs, taken)
+        print(line)
+    matutils.parse_mm_entries = parse_mm_entries
@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Licensed under the GNU LGPL v2.1 - http://www.gnu.org/licenses/lgpl.html
+
+"""
+USAGE: %(program)s VECTORS QUESTIONS [RESTRICT_VOCAB]
+    Compare the memory footprint and analogy accuracy of quantized word vectors \
+against the original float32 vectors. VECTORS is a file in the word2vec C format \
+(binary if it ends with .bin), QUESTIONS a file of analogy questions like \
+questions-words.txt. Only the first RESTRICT_VOCAB words (default 30000) are used \
+to answer questions, as in `KeyedVectors.accuracy`.
+
+Example: ./quantizespeed.py GoogleNews-vectors-negative300.bin questions-words.txt
+"""
+
+import logging
+import sys
+import os
+from time import time
+
+from gensim.models.keyedvectors import KeyedVectors
+from gensim.models.quantizedvectors import QuantizedKeyedVectors
+
+
+def accuracy(kv, questions, restrict_vocab):
+    """Return the total analogy accuracy of `kv` and the seconds taken to compute it."""
+    start = time()
+    total = kv.accuracy(questions, restrict_vocab=restrict_vocab)[-1]
+    correct, incorrect = len(total['correct']), len(total['incorrect'])
+    return correct / float(max(1, correct + incorrect)), time() - start
+
+
+if __name__ == '__main__':
+    logging.basicConfig(format='%(asctime)s : %(levelname)s : %(message)s', level=logging.WARNING)
+
+    program = os.path.basename(sys.argv[0])
+    if len(sys.argv) < 3:
+        print(globals()['__doc__'] % locals())
+        sys.exit(1)
+    kv = KeyedVectors.load_word2vec_format(sys.argv[1], binary=sys.argv[1].endswith('.bin'))
+    questions = sys.argv[2]
+    restrict_vocab = int(sys.argv[3]) if len(sys.argv) > 3 else 30000
+    print("%i vectors x %i dimensions" % kv.syn0.shape)
+
+    kv.init_sims()
+    full_bytes = kv.syn0.nbytes + kv.syn0norm.nbytes
+    full_accuracy, taken = accuracy(kv, questions, restrict_vocab)
+    print("float32 syn0 + syn0norm: %i bytes, accuracy %.4f (%.1fs)" % (full_bytes, full_accuracy, taken))
+    kv.syn0norm = None
+
+    for method, kwargs in [('int8', {}), ('pq', {}), ('pq', {'num_subvectors': kv.syn0.shape[1] // 2})]:
+        start = time()
+        qv = QuantizedKeyedVectors.quantize(kv, method=method, **kwargs)
+        built = time() - start
+        quantized_accuracy, taken = accuracy(qv, questions, restrict_vocab)
+        print("%s%s: %i bytes (%.1fx smaller, built in %.1fs), accuracy %.4f (loss %.4f, %.1fs)" % (
+            method, ' %s' % kwargs if kwargs else '', qv.nbytes(), full_bytes / float(qv.nbytes()), built,
+            quantized_accuracy, full_accuracy - quantized_accuracy, taken))
@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Licensed under the GNU LGPL v2.1 - http://www.gnu.org/licenses/lgpl.html
+
+"""
+USAGE: %(program)s CORPUS_DENSE.mm [NUMDOCS [NUMQUERIES]]
+    Compare the memory footprint, query throughput and top-10 ranking agreement of \
+MatrixSimilarity indexes stored as float16 and int8 against float32. Only use the first \
+NUMDOCS documents of the corpus (or all if no NUMDOCS is given); the first NUMQUERIES \
+documents (default 1000) are used as queries, in chunks of 100.
+    A sample corpus can be downloaded from http://nlp.fi.muni.cz/projekty/gensim/wikismall.tgz
+
+Example: ./simprecisionspeed.py wikismall.dense.mm 100000
+"""
+
+import logging
+import sys
+import itertools
+import os
+from time import time
+
+import numpy as np
+
+import gensim
+
+
+TOPN = 10
+
+
+if __name__ == '__main__':
+    logging.basicConfig(format='%(asctime)s : %(levelname)s : %(message)s', level=logging.WARNING)
+
+    program = os.path.basename(sys.argv[0])
+    if len(sys.argv) < 2:
+        print(globals()['__doc__'] % locals())
+        sys.exit(1)
+
+    corpus = gensim.corpora.MmCorpus(sys.argv[1])
+    num_features = corpus.num_terms
+    if len(sys.argv) > 2:
+        corpus = list(itertools.islice(corpus, int(sys.argv[2])))
+    num_queries = int(sys.argv[3]) if len(sys.argv) > 3 else 1000
+    query = list(itertools.islice(corpus, num_queries))
+
+    results = {}
+    for dtype in [np.float32, np.float16, np.int8]:
+        index = gensim.similarities.MatrixSimilarity(corpus, num_features=num_features, dtype=dtype)
+        nbytes = index.index.nbytes + (index.scales.nbytes if index.scales is not None else 0)
+        start = time()
+        sims = np.vstack([index[chunk] for chunk in gensim.utils.chunkize_serial(query, 100)])
+        taken = time() - start
+        results[dtype] = sims
+        line = "%s: %i documents x %i features, %i bytes, %.1f queries/s" % (
+            np.dtype(dtype).name, len(index), num_features, nbytes, len(query) / taken)
+        if dtype is not np.float32:
+            expected = results[np.float32]
+            top = np.argsort(-sims, axis=1)[:, :TOPN]
+            expected_top = np.argsort(-expected, axis=1)[:, :TOPN]
+            overlap = np.mean([len(set(a) & set(b)) / float(TOPN) for a, b in zip(top, expected_top)])
+            line += ", top-%i agreement %.4f, max. similarity error %.5f" % (
+                TOPN, overlap, np.abs(sims - expected).max())
+        print(line)
@@ -16,10 +16,11 @@ import itertools
 
 import numpy as np
 
+from gensim import matutils, utils
 from gensim.utils import to_unicode
 from gensim.interfaces import TransformedCorpus
 from gensim.corpora import (bleicorpus, mmcorpus, lowcorpus, svmlightcorpus,
-                            ucicorpus, malletcorpus, textcorpus, indexedcorpus)
+                            ucicorpus, malletcorpus, textcorpus, indexedcorpus, csrcorpus)
 
 # needed because sample data files are located in the same folder
 module_path = os.path.dirname(__file__)
@@ -214,6 +215,17 @@ class CorpusTestCase(unittest.TestCase):
             self.assertRaises(RuntimeError, _get_slice, corpus_, set([1]))
             self.assertRaises(RuntimeError, _get_slice, corpus_, 1.0)
 
+    def test_iter_chunks(self):
+        fname = datapath('testcorpus.' + self.file_extension.lstrip('.'))
+        corpus = self.corpus_class(fname)
+        expected = matutils.corpus2csc(list(corpus), num_terms=12).toarray()
+        for chunksize in [1, 2, 4, 9, 100]:
+            chunks = list(corpus.iter_chunks(chunksize, num_terms=12))
+            self.assertEqual([chunk.shape[1] for chunk in chunks[:-1]], [chunksize] * (len(chunks) - 1))
+            self.assertTrue(all(0 < chunk.shape[1] <= chunksize and chunk.shape[0] == 12 for chunk in chunks))
+            self.assertTrue(np.allclose(expected, np.hstack([chunk.toarray() for chunk in chunks])))
+        self.assertEqual(np.float32, next(corpus.iter_chunks(2, num_terms=12, dtype=np.float32)).dtype)
+
 
 class TestMmCorpus(CorpusTestCase):
     def setUp(self):
@@ -231,6 +243,164 @@ class TestMmCorpus(CorpusTestCase):
         self.assertEqual(self.corpus.num_nnz, 28)
         self.assertEqual(tuple(self.corpus.index), (97, 121, 169, 201, 225, 249, 258, 276, 303))
 
+    def test_iter_arrays(self):
+        docs = list(self.corpus)
+        arrays = list(self.corpus.iter_arrays())
+        self.assertEqual(list(range(len(docs))), [docid for docid, _ in arrays])
+        for doc, (_, (termids, values)) in zip(docs, arrays):
+            self.assertEqual(termids.dtype, np.int64)
+            self.assertEqual(values.dtype, np.float64)
+            self.assertEqual(doc, list(zip(termids.tolist(), values.tolist())))
+
+    def test_iter_chunks_empty_documents(self):
+        # empty documents at the start and the end of the corpus don't appear in the file
+        corpus = [[], [(1, 0.5)], [], [(0, -1.25), (2, 1e-05), (11, 3.0)], [], []]
+        fname = testfile()
+        self.corpus_class.serialize(fname, corpus)
+        mm = self.corpus_class(fname)
+        expected = matutils.corpus2csc(corpus, num_terms=12).toarray()
+        parse_mm_entries, chunksize = matutils.parse_mm_entries, matutils.MM_CHUNKSIZE
+        try:
+            for matutils.parse_mm_entries, matutils.MM_CHUNKSIZE in [(None, chunksize), (parse_mm_entries, 7)]:
+                for size in [1, 2, 4, 6, 10]:
+                    chunks = list(mm.iter_chunks(size))
+                    self.assertEqual(sum(chunk.shape[1] for chunk in chunks), len(corpus))
+                    self.assertTrue(np.allclose(expected, np.hstack([chunk.toarray() for chunk in chunks])))
+        finally:
+            matutils.parse_mm_entries, matutils.MM_CHUNKSIZE = parse_mm_entries, chunksize
+
+    def test_write_corpus_workers(self):
+        # empty documents at the start, in the middle and at the end, and chunks split between them
+        corpus = [[], [(1, 0.5)], [], [], [(0, -1.25), (2, 1e-05), (11, 3.0)], [(4, 1e-15)], [(3, 2.0)], []]
+        fname = testfile()
+        expected_offsets = matutils.MmWriter.write_corpus(fname, corpus, index=True)
+        with open(fname, 'rb') as fin:
+            expected = fin.read()
+        for chunksize in [1, 2, 3, 100]:
+            offsets = matutils.MmWriter.write_corpus(
+                fname, iter(corpus), index=True, workers=2, chunksize=chunksize)
+            self.assertEqual(expected_offsets, offsets)
+            with open(fname, 'rb') as fin:
+                self.assertEqual(expected, fin.read())
+
+        self.corpus_class.serialize(fname, self.corpus, workers=2)
+        mm = self.corpus_class(fname)
+        self.assertEqual(list(self.corpus), list(mm))
+        self.assertEqual(list(self.corpus), [mm[i] for i in range(len(mm))])
+
+    def test_write_corpus_workers_metadata(self):
+        class CorpusWithMetadata(object):
+            metadata = False
+
+            def __iter__(self):
+                for docno, bow in enumerate([[(1, 0.5)], [], [(0, -1.25), (2, 3.0)]]):
+                    yield (bow, ('doc%i' % docno, 'en')) if self.metadata else bow
+
+        corpus = CorpusWithMetadata()
+        fname = testfile()
+        for workers in [1, 2]:
+            self.corpus_class.serialize(fname, corpus, metadata=True, workers=workers)
+            self.assertFalse(corpus.metadata)
+            self.assertEqual(list(self.corpus_class(fname)), list(corpus))
+            metadata = utils.unpickle(fname + '.metadata.cpickle')
+            self.assertEqual(metadata, {0: ('doc0', 'en'), 1: ('doc1', 'en'), 2: ('doc2', 'en')})
+            os.remove(fname + '.metadata.cpickle')
+
+    @unittest.skipIf(matutils.parse_mm_entries is None, "compiled Matrix Market parser not available")
+    def test_compiled_parser(self):
+        corpus = [[(1, 0.5)], [], [(0, -1.25), (2, 1e-05), (11, 3.0)], [(3, 1.0)] * 0, [(4, 2.0)], []]
+        fname = testfile()
+        self.corpus_class.serialize(fname, corpus)
+        mm = self.corpus_class(fname)
+        parse_mm_entries, chunksize = matutils.parse_mm_entries, matutils.MM_CHUNKSIZE
+        try:
+            matutils.parse_mm_entries = None
+            expected = list(mm), [mm[i] for i in range(len(mm))]
+            matutils.parse_mm_entries = parse_mm_entries
+            # documents split across chunks are glued back together
+            for matutils.MM_CHUNKSIZE in [1, 7, 4096]:
+                self.assertEqual(expected, (list(mm), [mm[i] for i in range(len(mm))]))
+        finally:
+            matutils.parse_mm_entries, matutils.MM_CHUNKSIZE = parse_mm_entries, chunksize
+
+        # documents are columns of a matrix that is not transposed
+        with open(fname, 'wb') as fout:
+            fout.write(b'%%MatrixMarket matrix coordinate real general\n3 2 3\n2 1 0.5\n\n1 2 1.5\n3 2 -2\n')
+        self.assertEqual(
+            list(matutils.MmReader(fname, transposed=False)),
+            [(0, [(1, 0.5)]), (1, [(0, 1.5), (2, -2.0)])])
+
+        with open(fname, 'ab') as fout:
+            fout.write(b'1 1 1.0\n')
+        self.assertRaises(AssertionError, list, matutils.MmReader(fname, transposed=False))
+        with open(fname, 'ab') as fout:
+            fout.write(b'7 1\n')
+        self.assertRaises(ValueError, list, matutils.MmReader(fname, transposed=False))
+
+
+class TestCsrCorpus(CorpusTestCase):
+    def setUp(self):
+        self.corpus_class = csrcorpus.CsrCorpus
+        self.corpus = self.corpus_class(datapath('testcorpus.csr'))
+        self.file_extension = '.csr'
+
+    def tearDown(self):
+        super(TestCsrCorpus, self).tearDown()
+        for ext in ['.indptr.npy', '.indices.npy', '.data.npy']:
+            try:
+                os.remove(testfile() + ext)
+            except OSError:
+                pass
+
+    def test_empty_input(self):
+        self.corpus_class.serialize(testfile(), [])
+        corpus = self.corpus_class(testfile())
+        self.assertEqual(len(corpus), 0)
+        self.assertEqual(list(corpus), [])
+
+    def test_serialize_compressed(self):
+        # the arrays are memory-mapped => no compressed output
+        pass
+
+    def test_load(self):
+        self.assertEqual(self.corpus.num_docs, 9)
+        self.assertEqual(self.corpus.num_terms, 12)
+        self.assertEqual(self.corpus.num_nnz, 28)
+        self.assertTrue(isinstance(self.corpus.data, np.memmap))
+        self.assertEqual(list(mmcorpus.MmCorpus(datapath('testcorpus.mm'))), list(self.corpus))
+        self.assertEqual(list(self.corpus), list(self.corpus_class(datapath('testcorpus.csr'), mmap=None)))
+
+    def test_slicing(self):
+        docs = list(self.corpus)
+        for slice_ in [slice(2, 5), slice(None, None, -2), [8, 0, 3], np.asarray([-1, 1])]:
+            sliced = self.corpus[slice_]
+            # sub-corpora share the arrays of the corpus, and can be sliced again
+            self.assertTrue(sliced.data is self.corpus.data)
+            expected = [docs[i] for i in np.arange(len(docs))[slice_]]
+            self.assertEqual(expected, list(sliced))
+            self.assertEqual(expected, [sliced[i] for i in range(len(sliced))])
+            self.assertEqual(expected[1:], list(sliced[1:]))
+            self.assertEqual(sum(len(doc) for doc in expected), sliced.num_nnz)
+
+    def test_corpus2csc(self):
+        docs = list(self.corpus)
+        expected = matutils.corpus2csc(docs, num_terms=12, dtype=np.float32)
+        for corpus, columns in [(self.corpus, slice(None)), (self.corpus[3:7], slice(3, 7)), (self.corpus[[5, 2]], [5, 2])]:
+            result = matutils.corpus2csc(corpus, dtype=np.float32)
+            self.assertEqual(expected[:, columns].shape, result.shape)
+            self.assertEqual(0, abs(expected[:, columns] - result).max())
+        # contiguous documents are not copied
+        self.assertTrue(np.shares_memory(matutils.corpus2csc(self.corpus[3:7], dtype=np.float32).data, self.corpus.data))
+        self.assertEqual(matutils.corpus2csc(self.corpus, num_terms=20).shape, (20, 9))
+
+    def test_save_dtype(self):
+        corpus = [[(1, 0.1)], [], [(0, 2.0), (3, 1.0 / 3)]]
+        self.corpus_class.serialize(testfile(), corpus, id2word={0: 'a', 1: 'b', 2: 'c', 3: 'd', 4: 'e'}, dtype=np.float64)
+        corpus2 = self.corpus_class(testfile())
+        self.assertEqual(corpus2.data.dtype, np.float64)
+        self.assertEqual(corpus, list(corpus2))
+        self.assertEqual(corpus2.num_terms, 5)
+
 
 class TestSvmLightCorpus(CorpusTestCase):
     def setUp(self):
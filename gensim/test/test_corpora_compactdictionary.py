@@ -0,0 +1,150 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Licensed under the GNU LGPL v2.1 - http://www.gnu.org/licenses/lgpl.html
+
+"""
+Unit tests for the `corpora.CompactDictionary` class.
+"""
+
+
+import logging
+import tempfile
+import unittest
+import os
+
+import numpy as np
+
+from gensim.corpora import Dictionary
+from gensim.corpora.compactdictionary import CompactDictionary, CountMinSketch
+from gensim.models import TfidfModel
+
+
+def get_tmpfile(suffix):
+    return os.path.join(tempfile.gettempdir(), suffix)
+
+
+class TestCompactDictionary(unittest.TestCase):
+    def setUp(self):
+        self.texts = [
+                ['human', 'interface', 'computer'],
+                ['survey', 'user', 'computer', 'system', 'response', 'time'],
+                ['eps', 'user', 'interface', 'system'],
+                ['system', 'human', 'system', 'eps'],
+                ['user', 'response', 'time'],
+                ['trees'],
+                ['graph', 'trees'],
+                ['graph', 'minors', 'trees'],
+                ['graph', 'minors', 'survey']]
+
+    def assertSameCounts(self, d, expected):
+        self.assertEqual(len(d), len(expected))
+        self.assertEqual(dict((d[tokenid], df) for tokenid, df in d.dfs.items()),
+                         dict((expected[tokenid], df) for tokenid, df in expected.dfs.items()))
+        self.assertEqual((d.num_docs, d.num_pos, d.num_nnz), (expected.num_docs, expected.num_pos, expected.num_nnz))
+
+    def testBuild(self):
+        d = CompactDictionary(self.texts)
+        self.assertSameCounts(d, Dictionary(self.texts))
+        self.assertEqual(d.df_error, 0)
+
+        # ids in order of decreasing document frequency, ties broken by token
+        self.assertEqual([d[tokenid] for tokenid in range(4)], ['graph', 'system', 'trees', 'user'])
+        self.assertEqual(d.docfreqs.tolist(), sorted(d.docfreqs.tolist(), reverse=True))
+        self.assertEqual(dict((token, d[tokenid]) for token, tokenid in d.token2id.items()),
+                         dict((token, token) for token in d.token2id))
+        self.assertRaises(KeyError, d.__getitem__, len(d))
+
+        # counting in several chunks and in several calls gives the same result
+        f = CompactDictionary()
+        f.add_documents(iter(self.texts[:4]), chunksize=3)
+        f.add_documents(self.texts[4:], chunksize=1)
+        self.assertEqual(d.token2id, f.token2id)
+        self.assertSameCounts(d, f)
+
+    def testDoc2bow(self):
+        d, expected = CompactDictionary(self.texts), Dictionary(self.texts)
+        texts = self.texts + [[], ['trees', 'unknown', 'trees']]
+        for text in texts:
+            self.assertEqual(
+                sorted((d[tokenid], count) for tokenid, count in d.doc2bow(text)),
+                sorted((expected[tokenid], count) for tokenid, count in expected.doc2bow(text)))
+        self.assertEqual(d.doc2bow_many(texts), [d.doc2bow(text) for text in texts])
+        self.assertRaises(NotImplementedError, d.doc2bow, self.texts[0], allow_update=True)
+
+    def testPruning(self):
+        # long tail: every document has 3 frequent tokens and 10 tokens seen once
+        texts = [['a', 'b', 'c'] + ['rare%i_%i' % (docno, i) for i in range(10)] for docno in range(100)]
+        texts[-1].append('late')
+        d = CompactDictionary(prune_at=20, sketch_width=2 ** 12)
+        d.add_documents(texts, chunksize=5)
+        self.assertTrue(len(d) <= 20)
+        self.assertEqual([d[tokenid] for tokenid in range(3)], ['a', 'b', 'c'])
+        self.assertEqual(d.docfreqs[:3].tolist(), [100, 100, 100])
+        # the true document frequency of each kept token is within `df_error`
+        self.assertTrue(d.df_error >= 1)
+        true_dfs = Dictionary(texts)
+        for tokenid, df in d.dfs.items():
+            true_df = true_dfs.dfs[true_dfs.token2id[d[tokenid]]]
+            self.assertTrue(true_df <= df <= true_df + d.df_error)
+        self.assertEqual(d.num_docs, 100)
+
+    def testCountMinSketch(self):
+        sketch = CountMinSketch(width=2 ** 4, depth=3)
+        items = ['item%i' % i for i in range(100)]
+        counts = np.arange(100)
+        positions = sketch.positions(items)
+        self.assertEqual(positions.shape, (3, 100))
+        self.assertTrue((positions >= 0).all() and (positions < 2 ** 4).all())
+        sketch.add(positions, counts)
+        sketch.add(positions[:, :10], counts[:10])
+        expected = counts.copy()
+        expected[:10] *= 2
+        self.assertTrue((sketch.estimate(positions) >= expected).all())
+        self.assertRaises(ValueError, CountMinSketch, width=100)
+
+    def testFilter(self):
+        d, expected = CompactDictionary(self.texts), Dictionary(self.texts)
+        d.filter_extremes(no_below=2, no_above=1.0, keep_n=4)
+        expected.filter_extremes(no_below=2, no_above=1.0, keep_n=4)
+        self.assertSameCounts(d, expected)
+        self.assertEqual(d.keys(), [0, 1, 2, 3])
+
+        d = CompactDictionary(self.texts)
+        d.filter_extremes(no_below=3, no_above=1.0, keep_tokens=['human', 'survey'])
+        self.assertEqual(set(d.token2id), set(['graph', 'trees', 'human', 'system', 'user', 'survey']))
+
+        d = CompactDictionary(self.texts)
+        d.filter_n_most_frequent(4)
+        self.assertEqual(sorted(d.dfs.values()), [2] * 8)
+        d.filter_tokens(bad_ids=[0])
+        self.assertEqual(len(d), 7)
+
+    def testMergeCounts(self):
+        d = CompactDictionary(self.texts[:3])
+        d.merge_counts(Dictionary(self.texts[3:]))
+        self.assertSameCounts(d, Dictionary(self.texts))
+        self.assertEqual(d.token2id, CompactDictionary(self.texts).token2id)
+
+    def testSaveLoad(self):
+        tmpf = get_tmpfile('gensim_compactdictionary.tst')
+        d = CompactDictionary(self.texts)
+        d.save(tmpf)
+        loaded = CompactDictionary.load(tmpf)
+        self.assertEqual(d.token2id, loaded.token2id)
+        self.assertEqual(d.docfreqs.tolist(), loaded.docfreqs.tolist())
+        self.assertEqual(loaded.sketch, None)
+        self.assertEqual(loaded.doc2bow(self.texts[1]), d.doc2bow(self.texts[1]))
+        os.remove(tmpf)
+
+    def testTfidf(self):
+        # `dfs` can be used in place of a Dictionary's
+        d = CompactDictionary(self.texts)
+        tfidf = TfidfModel(dictionary=d)
+        self.assertEqual(len(tfidf.idfs), len(d))
+        self.assertTrue(tfidf[d.doc2bow(self.texts[0])])
+
+
+if __name__ == '__main__':
+    logging.basicConfig(format='%(asctime)s : %(levelname)s : %(message)s', level=logging.DEBUG)
+    unittest.main()
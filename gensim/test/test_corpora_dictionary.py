@@ -115,6 +115,31 @@ class TestDictionary(unittest.TestCase):
         f.merge_with(g)
         self.assertEqual(sorted(d.token2id.keys()), sorted(f.token2id.keys()))
 
+    def testMergeCounts(self):
+        d = Dictionary(self.texts)
+        f = Dictionary(self.texts[:3])
+        f.merge_counts(Dictionary(self.texts[3:]))
+        self.assertEqual(d.token2id, f.token2id)
+        self.assertEqual(d.dfs, f.dfs)
+        self.assertEqual((d.num_docs, d.num_pos, d.num_nnz), (f.num_docs, f.num_pos, f.num_nnz))
+
+    def testBuildWorkers(self):
+        d = Dictionary(self.texts)
+        for chunksize in [1, 2, 4, 100]:
+            f = Dictionary()
+            f.add_documents(iter(self.texts), workers=2, chunksize=chunksize)
+            self.assertEqual(d.token2id, f.token2id)
+            self.assertEqual(d.dfs, f.dfs)
+            self.assertEqual((d.num_docs, d.num_pos, d.num_nnz), (f.num_docs, f.num_pos, f.num_nnz))
+
+        # pruning is checked before each chunk is merged
+        f = Dictionary()
+        f.add_documents(self.texts, prune_at=3, workers=2, chunksize=3)
+        # the 3 most frequent tokens of the first 6 documents, and the new tokens of the last 3 documents
+        expected = ['computer', 'graph', 'interface', 'minors', 'survey', 'trees', 'user']
+        self.assertEqual(sorted(f.token2id), expected)
+        self.assertEqual(f.num_docs, 9)
+
     def testFilter(self):
         d = Dictionary(self.texts)
         d.filter_extremes(no_below=2, no_above=1.0, keep_n=4)
@@ -179,6 +204,33 @@ class TestDictionary(unittest.TestCase):
         # unicode must be converted to utf8
         self.assertEqual(d.doc2bow([u'\u017elu\u0165ou\u010dk\xfd']), [(0, 1)])
 
+        # utf8 and unicode versions of the same token are counted together
+        self.assertEqual(d.doc2bow([u'\u017elu\u0165ou\u010dk\xfd', u'\u017elu\u0165ou\u010dk\xfd'.encode('utf8')]), [(0, 2)])
+
+    def test_doc2bow_many(self):
+        d = Dictionary(self.texts[:5])
+        texts = self.texts + [[], ['trees', 'human', 'unknown', 'human']]
+        expected = [d.doc2bow(text) for text in texts]
+        self.assertEqual(d.doc2bow_many(texts), expected)
+        self.assertEqual(d.doc2bow_many(iter(texts)), expected)
+        self.assertRaises(TypeError, d.doc2bow_many, ["\u017elu\u0165ou\u010dk\u00fd"])
+        self.assertEqual(d.doc2bow_many([]), [])
+        self.assertEqual(d.doc2bow_many(iter(text) for text in texts), expected)
+        utf8 = [[w.encode('utf8') for w in text] for text in texts]
+        self.assertEqual(d.doc2bow_many(utf8), expected)
+
+        result = d.doc2bow_many(texts, as_csr=True)
+        self.assertEqual(result.shape, (len(texts), len(d)))
+        self.assertEqual([list(zip(row.indices.tolist(), row.data.tolist())) for row in result], expected)
+
+        # updating the dictionary gives the same ids and counts as `doc2bow`
+        d, f = Dictionary(self.texts[:5]), Dictionary(self.texts[:5])
+        expected = [d.doc2bow(text, allow_update=True) for text in texts]
+        self.assertEqual(f.doc2bow_many(texts, allow_update=True), expected)
+        self.assertEqual(d.token2id, f.token2id)
+        self.assertEqual(d.dfs, f.dfs)
+        self.assertEqual((d.num_docs, d.num_pos, d.num_nnz), (f.num_docs, f.num_pos, f.num_nnz))
+
     def test_saveAsText_and_loadFromText(self):
         """`Dictionary` can be saved as textfile and loaded again from textfile. """
         tmpf = get_tmpfile('dict_test.txt')
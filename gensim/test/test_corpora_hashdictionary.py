@@ -14,7 +14,10 @@ import unittest
 import os
 import zlib
 
-from gensim.corpora.hashdictionary import HashDictionary
+import numpy as np
+
+from gensim.corpora import hashdictionary
+from gensim.corpora.hashdictionary import HashDictionary, murmurhash3
 
 
 # sample data files are located in the same folder
@@ -177,6 +180,60 @@ class TestHashDictionary(unittest.TestCase):
         d2 = d.load(tmpf)
         self.assertEqual(len(d), len(d2))
 
+    def testDoc2bowIterator(self):
+        # documents may be iterators, not only lists
+        d = HashDictionary(myhash=zlib.adler32)
+        self.assertEqual(d.doc2bow(iter(['a', 'b', 'a']), allow_update=True), [(22626, 2), (24163, 1)])
+        self.assertEqual((d.num_docs, d.num_pos, d.num_nnz), (1, 3, 2))
+        d.debug = False
+        self.assertEqual(d.doc2bow_many([iter(['a', 'b', 'a'])]), [[(22626, 2), (24163, 1)]])
+
+    def testMurmurhash3(self):
+        # reference values of the 32bit x86 MurmurHash3
+        self.assertEqual(murmurhash3(b''), 0)
+        self.assertEqual(murmurhash3(b'', seed=1), 0x514e28b7)
+        self.assertEqual(murmurhash3(b'hello'), 0x248bfa47)
+        self.assertEqual(murmurhash3(b'The quick brown fox jumps over the lazy dog'), 0x2e4ff723)
+        self.assertEqual(murmurhash3(u'hello'), murmurhash3(b'hello'))
+        # the compiled and pure Python versions agree
+        words = [b'', b'a', b'ab', b'abc', b'abcd', b'abcde', u'žloťoučký koníček'.encode('utf8')]
+        for seed in [0, 7, 0x9747b28c]:
+            expected = [hashdictionary._murmurhash3_py(word, seed) for word in words]
+            self.assertEqual([murmurhash3(word, seed) for word in words], expected)
+            self.assertEqual(hashdictionary.hash_tokens(words, seed).tolist(), expected)
+
+    def testDoc2bowMany(self):
+        texts = self.texts + [[], ['trees', 'trees', u'žloťoučký']]
+        for debug in [True, False]:
+            d = HashDictionary(id_range=7, myhash=murmurhash3, debug=debug)
+            bows = d.doc2bow_many(texts, allow_update=True)
+            self.assertEqual(bows, [d.doc2bow(text) for text in texts])
+            self.assertEqual((d.num_docs, d.num_pos), (2 * len(texts), 2 * sum(len(text) for text in texts)))
+            csr = d.doc2bow_many(texts, as_csr=True)
+            self.assertEqual(csr.shape, (len(texts), 7))
+            for docno, bow in enumerate(bows):
+                self.assertEqual(list(zip(csr[docno].indices.tolist(), csr[docno].data.tolist())), bow)
+            self.assertEqual(d.doc2bow_many([]), [])
+            self.assertEqual(d.doc2bow_many([], as_csr=True).shape, (0, 7))
+        # ids don't depend on the hashing path
+        d = HashDictionary(self.texts, myhash=murmurhash3)
+        for token, tokenid in d.token2id.items():
+            self.assertEqual(tokenid, murmurhash3(token) % d.id_range)
+        self.assertEqual(d.doc2bow(['human', 'computer']), HashDictionary(myhash=murmurhash3, debug=False).doc2bow(['human', 'computer']))
+
+    def testSigned(self):
+        d = HashDictionary(self.texts, id_range=1, myhash=murmurhash3, signed=True)
+        signs = dict((token, d.doc2bow([token])[0][1]) for token in d.token2id)
+        self.assertEqual(set(signs.values()), set([-1, 1]))
+        # with a single id, the signed counts of all words add up
+        for text in self.texts:
+            expected = sum(signs[token] for token in text)
+            self.assertEqual(d.doc2bow(text), [(0, expected)] if expected else [])
+        d.debug = False
+        csr = d.doc2bow_many(self.texts, as_csr=True)
+        self.assertEqual(csr.nnz, sum(1 for text in self.texts if d.doc2bow(text)))
+        self.assertTrue(np.all(csr.data != 0))
+
 
 
 if __name__ == '__main__':
@@ -152,6 +152,19 @@ class TestDoc2VecModel(unittest.TestCase):
         # input not empty, but rather completely filtered out
         self.assertRaises(RuntimeError, doc2vec.Doc2Vec, list_corpus, min_count=10000)
 
+    def test_norms_only(self):
+        """Test docvecs similarities normalized on the fly match those with doctag_syn0norm"""
+        model = doc2vec.Doc2Vec(DocsLeeCorpus(), size=24, min_count=2, iter=5, seed=42, workers=1)
+        expected = model.docvecs.most_similar(0, topn=5)
+        expected_odd = model.docvecs.doesnt_match([0, 1, 2, 3])
+        model.docvecs.init_sims(norms_only=True)
+        self.assertTrue(model.docvecs.doctag_syn0norm is None)
+        self.assertTrue(np.allclose(
+            [sim for _, sim in model.docvecs.most_similar(0, topn=5)], [sim for _, sim in expected]))
+        self.assertEqual(len(model.docvecs.most_similar(0, topn=5, clip_start=10, clip_end=50)), 5)
+        self.assertEqual(model.docvecs.doesnt_match([0, 1, 2, 3]), expected_odd)
+        self.assertTrue(model.docvecs.doctag_syn0norm is None)
+
     def test_similarity_unseen_docs(self):
         """Test similarity of out of training sentences"""
         rome_str = ['rome', 'italy']
@@ -15,6 +15,7 @@ import tempfile
 
 import numpy
 
+from gensim import similarities
 from gensim.models.wrappers import fasttext
 from gensim.models import keyedvectors
 
@@ -309,6 +310,19 @@ class TestFastText(unittest.TestCase):
         dist = self.test_model.wmdistance(doc, ngrams_absent_doc)
         self.assertEqual(float('inf'), dist)
 
+    def testWmdSimilarity(self):
+        """Tests WmdSimilarity for corpus documents and queries with out-of-vocab words"""
+        corpus = [['night', 'payment'], ['nights', 'forests', 'payments'], ['a!@', 'b#$'], ['forests', 'night']]
+        query = ['payments', 'forest', 'night']
+        expected = [1. / (1. + self.test_model.wmdistance(query, doc)) for doc in corpus]
+        for workers in [1, 2]:
+            index = similarities.WmdSimilarity(
+                corpus, self.test_model, normalize_w2v_and_replace=False, chunksize=2, workers=workers)
+            self.assertTrue(numpy.allclose(index[query], expected))
+            index.num_best = 2
+            self.assertEqual([docno for docno, _ in index[query]], list(numpy.argsort(expected)[::-1][:2]))
+            index.close()
+
     def testDoesntMatch(self):
         """Tests doesnt_match for list of out-of-vocab words"""
         oov_words = ['nights', 'forests', 'payments']
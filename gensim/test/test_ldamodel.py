@@ -340,6 +340,18 @@ class TestLdaModel(unittest.TestCase, basetests.TestBaseTopicModel):
          # FIXME: Fails on osx and win
          # self.assertTrue(1 in result[0])
 
+    def testSparseChunks(self):
+        # training on MmCorpus goes through `iter_chunks`, on a plain list through lists of documents
+        for kwargs in [dict(chunksize=2), dict(chunksize=4, alpha='auto', eta='auto', eval_every=1)]:
+            model1 = self.class_(self.corpus, id2word=dictionary, num_topics=2, passes=2, random_state=0, **kwargs)
+            model2 = self.class_(list(self.corpus), id2word=dictionary, num_topics=2, passes=2, random_state=0, **kwargs)
+            self.assertTrue(np.allclose(model1.expElogbeta, model2.expElogbeta))
+            self.assertTrue(np.allclose(model1.alpha, model2.alpha))
+            self.assertEqual(model1.num_updates, model2.num_updates)
+            gamma1, _ = model1.inference(matutils.corpus2csc(self.corpus, num_terms=len(dictionary)))
+            gamma2, _ = model2.inference(list(self.corpus))
+            self.assertEqual(gamma1.shape, (9, 2))
+            self.assertTrue(np.allclose(gamma1, gamma2))
 
     def testPasses(self):
         # long message includes the original error message with a custom one
@@ -508,6 +520,9 @@ class TestLdaMulticore(TestLdaModel):
     def testAlphaAuto(self):
         self.assertRaises(RuntimeError, self.class_, alpha='auto')
 
+    def testSparseChunks(self):
+        self.skipTest("multicore workers are sent lists of documents, and the order in which they finish varies")
+
 
 #endclass TestLdaMulticore
 
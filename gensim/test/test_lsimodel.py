@@ -123,6 +123,16 @@ class TestLsiModel(unittest.TestCase, basetests.TestBaseTopicModel):
         vec2 = matutils.sparse2full(model2[doc], model2.num_topics)
         self.assertTrue(np.allclose(abs(vec1), abs(vec2), atol=1e-5))  # the two LSI representations must equal up to sign
 
+    def testSparseChunks(self):
+        # MmCorpus is fed to the decomposition by `iter_chunks`, a plain list by corpus2csc
+        for kwargs in [dict(chunksize=2), dict(chunksize=4, onepass=False, power_iters=2)]:
+            model1 = lsimodel.LsiModel(self.corpus, num_topics=2, **kwargs)
+            model2 = lsimodel.LsiModel(list(self.corpus), num_topics=2, id2word=self.model.id2word, **kwargs)
+            self.assertTrue(np.allclose(model1.projection.s, model2.projection.s))
+            self.assertTrue(np.allclose(abs(model1.projection.u), abs(model2.projection.u)))
+            self.assertEqual(model1.docs_processed, model2.docs_processed)
+
+
     def testPersistence(self):
         fname = testfile()
         model = self.model
@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Licensed under the GNU LGPL v2.1 - http://www.gnu.org/licenses/lgpl.html
+
+"""
+Automated tests for the conversions between sparse documents and matrices in gensim.matutils.
+"""
+
+
+import logging
+import unittest
+
+import numpy as np
+
+from gensim import matutils
+
+
+CORPUS = [[(1, 0.5), (4, 2.0)], [], [(0, -1.0), (2, 1e-05), (3, 3.0)], [(2, 7.0)], []]
+EXPECTED = np.array([
+    [0, 0, -1, 0, 0],
+    [0.5, 0, 0, 0, 0],
+    [0, 0, 1e-05, 7, 0],
+    [0, 0, 3, 0, 0],
+    [2, 0, 0, 0, 0],
+])
+
+
+class TestCorpusConversions(unittest.TestCase):
+    def test_corpus2csc(self):
+        result = matutils.corpus2csc(CORPUS)
+        self.assertEqual(result.shape, (5, 5))
+        self.assertEqual(result.dtype, np.float64)
+        self.assertTrue(np.allclose(result.toarray(), EXPECTED))
+
+        # the corpus may be a non-repeatable stream
+        result = matutils.corpus2csc(iter(CORPUS), num_terms=6, num_docs=5, num_nnz=6, dtype=np.float32)
+        self.assertEqual(result.shape, (6, 5))
+        self.assertEqual(result.dtype, np.float32)
+        self.assertTrue(np.allclose(result.toarray()[:5], EXPECTED))
+
+        self.assertRaises(AssertionError, matutils.corpus2csc, CORPUS, num_terms=5, num_docs=5, num_nnz=7)
+        self.assertRaises(AssertionError, matutils.corpus2csc, CORPUS, num_terms=5, num_docs=4, num_nnz=6)
+        self.assertEqual(matutils.corpus2csc([]).shape, (0, 0))
+
+    def test_corpus2csc_blocks(self):
+        # documents are converted in blocks of about CORPUS_BLOCKSIZE non-zeros
+        blocksize = matutils.CORPUS_BLOCKSIZE
+        try:
+            for matutils.CORPUS_BLOCKSIZE in [1, 2, 3, 7]:
+                self.assertTrue(np.allclose(matutils.corpus2csc(CORPUS).toarray(), EXPECTED))
+                self.assertTrue(np.allclose(
+                    matutils.corpus2csc(CORPUS, num_terms=5, num_docs=5, num_nnz=6).toarray(), EXPECTED))
+                self.assertTrue(np.allclose(matutils.corpus2dense(CORPUS, 5, num_docs=5), EXPECTED))
+        finally:
+            matutils.CORPUS_BLOCKSIZE = blocksize
+
+    def test_block_conversion(self):
+        # guards the speedup of corpus2csc and corpus2dense (see corpus2cscspeed.py): a block of documents
+        # is converted with a single `_documents2arrays` call, and not by `sparse2full` document by document
+        calls = []
+        documents2arrays, sparse2full = matutils._documents2arrays, matutils.sparse2full
+
+        def counted(docs, *args, **kwargs):
+            calls.append(len(docs))
+            return documents2arrays(docs, *args, **kwargs)
+
+        corpus = CORPUS * 100
+        matutils._documents2arrays, matutils.sparse2full = counted, None
+        try:
+            self.assertTrue(np.allclose(matutils.corpus2csc(corpus).toarray(), np.tile(EXPECTED, 100)))
+            self.assertTrue(np.allclose(matutils.corpus2dense(corpus, 5), np.tile(EXPECTED, 100)))
+        finally:
+            matutils._documents2arrays, matutils.sparse2full = documents2arrays, sparse2full
+        self.assertEqual(calls, [len(corpus), len(corpus)])
+
+    def test_numpy_documents(self):
+        # documents as 2d arrays of (feature id, weight) rows, or (feature ids, weights) pairs of arrays
+        pairs = [(np.array([i for i, _ in doc], dtype=int), np.array([w for _, w in doc])) for doc in CORPUS]
+        rows = [np.array(doc).reshape(-1, 2) for doc in CORPUS]
+        mixed = [CORPUS[0], pairs[1], rows[2], CORPUS[3], rows[4]]
+        for corpus in [pairs, rows, mixed]:
+            self.assertTrue(np.allclose(matutils.corpus2csc(corpus).toarray(), EXPECTED))
+            self.assertTrue(np.allclose(matutils.corpus2dense(corpus, 5), EXPECTED))
+            for doc, column in zip(corpus, EXPECTED.T):
+                self.assertTrue(np.allclose(matutils.sparse2full(doc, 5), column))
+
+    def test_corpus2dense(self):
+        result = matutils.corpus2dense(CORPUS, 5)
+        self.assertEqual(result.dtype, np.float32)
+        self.assertTrue(np.allclose(result, EXPECTED))
+        result = matutils.corpus2dense(iter(CORPUS), 6, num_docs=5, dtype=np.float64)
+        self.assertEqual(result.shape, (6, 5))
+        self.assertTrue(np.allclose(result[:5], EXPECTED))
+        self.assertFalse(result[5].any())
+        self.assertRaises(AssertionError, matutils.corpus2dense, CORPUS, 5, num_docs=4)
+        self.assertRaises(AssertionError, matutils.corpus2dense, CORPUS, 5, num_docs=6)
+
+    def test_sparse2full(self):
+        self.assertTrue(np.allclose(matutils.sparse2full(CORPUS[2], 5), EXPECTED[:, 2]))
+        self.assertEqual(matutils.sparse2full(CORPUS[2], 5).dtype, np.float32)
+        # float feature ids, generators and empty documents
+        self.assertTrue(np.allclose(matutils.sparse2full(((float(i), w) for i, w in CORPUS[0]), 5), EXPECTED[:, 0]))
+        self.assertFalse(matutils.sparse2full([], 3).any())
+        # for repeated feature ids, the last value wins
+        self.assertEqual(matutils.sparse2full([(1, 2.0), (1, 3.0)], 2).tolist(), [0.0, 3.0])
+
+    def test_full2sparse(self):
+        vec = np.array([0.0, 1.5, 1e-12, -2.0])
+        for result in [matutils.full2sparse(vec), matutils.full2sparse(vec.tolist())]:
+            self.assertEqual(result, [(1, 1.5), (3, -2.0)])
+            self.assertTrue(all(type(i) is int and type(w) is float for i, w in result))
+        self.assertEqual(matutils.full2sparse(vec, eps=1.6), [(3, -2.0)])
+        self.assertEqual(matutils.full2sparse_clipped(vec, 1), [(3, -2.0)])
+        self.assertEqual(matutils.full2sparse_clipped(vec, 0), [])
+        self.assertEqual(matutils.full2sparse(matutils.sparse2full(CORPUS[2], 5), eps=1e-3), [(0, -1.0), (3, 3.0)])
+
+
+if __name__ == '__main__':
+    logging.basicConfig(format='%(asctime)s : %(levelname)s : %(message)s', level=logging.DEBUG)
+    unittest.main()
@@ -247,6 +247,25 @@ class TestShardedCorpus(unittest.TestCase):
         self.assertTrue(iscorp, "Is the object returned by list notation "
                                 "a gensim corpus?")
 
+    def test_iter_chunks(self):
+
+        expected = self.corpus[0:len(self.corpus)]
+        for sparse_serialization in [False, True]:
+            corpus = ShardedCorpus(self.tmp_fname, self.data, shardsize=100,
+                                   dim=self.dim, sparse_serialization=sparse_serialization,
+                                   gensim=True, overwrite=True)
+            chunks = list(corpus.iter_chunks(70))
+            self.assertEqual([70] * 14 + [20], [chunk.shape[1] for chunk in chunks])
+            self.assertTrue(all(isinstance(chunk, sparse.csc_matrix) for chunk in chunks))
+            self.assertTrue(np.allclose(expected.T, sparse.hstack(chunks).toarray()))
+            # retrieval mode of the corpus is restored
+            self.assertTrue(corpus.gensim)
+            self.assertFalse(corpus.sparse_retrieval)
+
+            chunk = next(corpus.iter_chunks(70, num_terms=self.dim + 5, dtype=np.float32))
+            self.assertEqual((self.dim + 5, 70), chunk.shape)
+            self.assertEqual(np.float32, chunk.dtype)
+
     def test_resize(self):
 
         dataset = ShardedCorpus(self.tmp_fname, self.data, shardsize=100,
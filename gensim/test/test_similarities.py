@@ -134,6 +134,53 @@ class _TestSimilarityABC(object):
         if self.cls == similarities.Similarity:
             index.destroy()
 
+    def testUpdateDelete(self):
+        if self.cls in (similarities.WmdSimilarity, similarities.InvertedIndexSimilarity):
+            return
+
+        if self.cls == similarities.Similarity:
+            index = self.cls(None, corpus, num_features=len(dictionary), shardsize=4)
+        else:
+            index = self.cls(corpus, num_features=len(dictionary))
+        index.update_documents([1, 6], [corpus[8], corpus[0]])
+        index.delete_documents([2, 8])
+        index.update_documents([8], [corpus[3]])  # undelete
+        self.assertEqual(len(index), len(corpus))
+        self.assertRaises(ValueError, index.delete_documents, [len(corpus)])
+
+        # the same index, built from scratch; deleted documents become empty
+        changed = list(corpus)
+        changed[1], changed[2], changed[6], changed[8] = corpus[8], [], corpus[0], corpus[3]
+        expected = similarities.MatrixSimilarity(changed, num_features=len(dictionary))[corpus]
+
+        def check():
+            index.num_best = None
+            self.assertTrue(numpy.allclose(index[corpus], expected))
+            self.assertTrue(numpy.allclose(index[corpus[0]], expected[0]))
+            index.num_best = 3
+            for doc, row in zip(index[corpus], expected):
+                self.assertTrue(numpy.allclose([sim for _, sim in doc], sorted(row[row > 0], reverse=True)[:3]))
+                self.assertTrue(all(docno != 2 for docno, _ in doc))
+
+        check()
+        index.compact()
+        check()
+        if self.cls == similarities.Similarity:
+            index.delete_documents([0])
+            index.update_documents([5], [corpus[6]])
+            changed[0], changed[5] = [], corpus[6]
+            expected = similarities.MatrixSimilarity(changed, num_features=len(dictionary))[corpus]
+            self.assertRaises(ValueError, index.vector_by_id, 0)
+            check()
+            index.compact(background=True).join()
+            check()
+            self.assertFalse(index.updated)
+            self.assertTrue(all(len(shard.deleted) == 0 for shard in index.shards))
+            index.add_documents(corpus[:1])
+            changed.append(corpus[0])
+            expected = similarities.MatrixSimilarity(changed, num_features=len(dictionary))[corpus]
+            check()
+            index.destroy()
 
     def testIter(self):
         if self.cls == similarities.Similarity:
@@ -175,7 +222,7 @@ class _TestSimilarityABC(object):
             self.assertTrue(len(index.shards) == len(index2.shards))
             index.destroy()
         else:
-            if isinstance(index, similarities.SparseMatrixSimilarity):
+            if scipy.sparse.issparse(index.index):
                 # hack SparseMatrixSim indexes so they're easy to compare
                 index.index = index.index.todense()
                 index2.index = index2.index.todense()
@@ -200,7 +247,7 @@ class _TestSimilarityABC(object):
             self.assertTrue(len(index.shards) == len(index2.shards))
             index.destroy()
         else:
-            if isinstance(index, similarities.SparseMatrixSimilarity):
+            if scipy.sparse.issparse(index.index):
                 # hack SparseMatrixSim indexes so they're easy to compare
                 index.index = index.index.todense()
                 index2.index = index2.index.todense()
@@ -227,7 +274,7 @@ class _TestSimilarityABC(object):
             self.assertTrue(len(index.shards) == len(index2.shards))
             index.destroy()
         else:
-            if isinstance(index, similarities.SparseMatrixSimilarity):
+            if scipy.sparse.issparse(index.index):
                 # hack SparseMatrixSim indexes so they're easy to compare
                 index.index = index.index.todense()
                 index2.index = index2.index.todense()
@@ -254,7 +301,7 @@ class _TestSimilarityABC(object):
             self.assertTrue(len(index.shards) == len(index2.shards))
             index.destroy()
         else:
-            if isinstance(index, similarities.SparseMatrixSimilarity):
+            if scipy.sparse.issparse(index.index):
                 # hack SparseMatrixSim indexes so they're easy to compare
                 index.index = index.index.todense()
                 index2.index = index2.index.todense()
@@ -283,7 +330,7 @@ class _TestSimilarityABC(object):
             self.assertTrue(len(index.shards) == len(index2.shards))
             index.destroy()
         else:
-            if isinstance(index, similarities.SparseMatrixSimilarity):
+            if scipy.sparse.issparse(index.index):
                 # hack SparseMatrixSim indexes so they're easy to compare
                 index.index = index.index.todense()
                 index2.index = index2.index.todense()
@@ -311,6 +358,27 @@ class TestMatrixSimilarity(unittest.TestCase, _TestSimilarityABC):
     def setUp(self):
         self.cls = similarities.MatrixSimilarity
 
+    def testReducedPrecision(self):
+        """float16 and int8 indexes give (almost) the same similarities as float32, also when mmap'ed"""
+        expected = self.cls(corpus, num_features=len(dictionary))
+        full = expected[corpus]
+        fname = testfile()
+        for dtype, itemsize in [(numpy.float16, 2), (numpy.int8, 1)]:
+            index = self.cls(corpus, num_features=len(dictionary), dtype=dtype)
+            self.assertEqual(index.index.dtype.itemsize, itemsize)
+            self.assertTrue(numpy.allclose(index[corpus], full, atol=0.01))
+            self.assertTrue(numpy.allclose(index[corpus[0]], full[0], atol=0.01))
+            self.assertTrue(numpy.allclose(list(index), full, atol=0.01))
+            self.assertTrue(numpy.allclose(index.vectors(), expected.index, atol=0.01))
+
+            index.save(fname, sep_limit=0)
+            index2 = self.cls.load(fname, mmap='r')
+            self.assertEqual(index2.index.dtype, index.index.dtype)
+            self.assertTrue(numpy.allclose(index2[corpus], index[corpus]))
+
+            index.update_documents([1], [corpus[0]])
+            self.assertTrue(numpy.allclose(index[corpus[0]][[0, 1]], [1.0, 1.0], atol=0.01))
+
 class TestWmdSimilarity(unittest.TestCase, _TestSimilarityABC):
     def setUp(self):
         self.cls = similarities.WmdSimilarity
@@ -354,6 +422,46 @@ class TestWmdSimilarity(unittest.TestCase, _TestSimilarityABC):
         cond = sum(numpy.diff(sims2) < 0) == len(sims2) - 1
         self.assertTrue(cond)
 
+    def testPruning(self):
+        """Check pruned `num_best` queries agree with the exact WMD, however the corpus is chunked."""
+        if not PYEMD_EXT:
+            return
+
+        for chunksize in (1, 4, 256):
+            index = self.cls(texts, self.w2v_model, chunksize=chunksize)
+            for query in [texts[0], ['graph', 'survey', 'survey', 'unknown'], ['trees']]:
+                exact = numpy.array([self.w2v_model.wmdistance(document, query) for document in texts])
+                self.assertTrue(numpy.allclose(index[query], 1. / (1. + exact)))
+                for num_best in (1, 3):
+                    index.num_best = num_best
+                    expected = matutils.full2sparse_clipped(1. / (1. + exact), num_best)
+                    sims = index[query]
+                    self.assertEqual([docno for docno, _ in sims], [docno for docno, _ in expected])
+                    self.assertTrue(numpy.allclose([sim for _, sim in sims], [sim for _, sim in expected]))
+                index.num_best = None
+
+    def testParallel(self):
+        """Check queries computed by worker processes give the same results."""
+        if not PYEMD_EXT:
+            return
+
+        index = self.cls(texts, self.w2v_model, chunksize=2)
+        parallel = self.cls(texts, self.w2v_model, chunksize=2, workers=2)
+        self.assertTrue(numpy.allclose(parallel[texts[:3]], index[texts[:3]]))
+        pool = parallel.pool
+        self.assertTrue(pool is not None)
+        parallel.num_best = index.num_best = 3
+        self.assertEqual(parallel[texts[4]], index[texts[4]])
+        self.assertTrue(parallel.pool is pool)  # the workers are reused by later queries
+        parallel.close()
+        self.assertTrue(parallel.pool is None)
+        self.assertEqual(parallel[texts[4]], index[texts[4]])
+        fname = testfile()
+        parallel.save(fname, ignore=['w2v_model'])  # the workers are left out even with a custom `ignore`
+        parallel2 = self.cls.load(fname)
+        self.assertTrue(parallel2.pool is None and parallel2.w2v_model is None)
+        parallel.close()
+
     def testChunking(self):
         # Override testChunking.
 
@@ -406,6 +514,38 @@ class TestSparseMatrixSimilarity(unittest.TestCase, _TestSimilarityABC):
         numpy.testing.assert_array_equal(dense_sims, sparse_sims.todense())
 
 
+class TestInvertedIndexSimilarity(unittest.TestCase, _TestSimilarityABC):
+    def setUp(self):
+        self.cls = similarities.InvertedIndexSimilarity
+
+    def testPruning(self):
+        """num_best results are exact, with and without pruning, compared to SparseMatrixSimilarity"""
+        rng = numpy.random.RandomState(0)
+        docs = [list(zip(sorted(rng.choice(50, rng.randint(1, 10), replace=False)), rng.rand(10)))
+                for _ in range(300)]
+        num_features = 50
+        expected = similarities.SparseMatrixSimilarity(docs, num_features=num_features)
+        index = self.cls(docs, num_features=num_features)
+        queries = docs[:20] + [[(3, 0.5), (49, 2.0)], [], [(7, -1.0), (8, 1.0)]]
+        full = expected[queries]
+        self.assertTrue(numpy.allclose(index[queries], full, atol=1e-6))
+        for num_best in [0, 1, 5, 1000]:
+            index.num_best = expected.num_best = num_best
+            for sims, expected_sims, row in zip(index[queries], expected[queries], full):
+                self.assertEqual(len(sims), len(expected_sims))
+                self.assertTrue(numpy.allclose([sim for _, sim in sims], [sim for _, sim in expected_sims], atol=1e-6))
+                self.assertTrue(numpy.allclose([sim for _, sim in sims], [row[docno] for docno, _ in sims], atol=1e-6))
+
+    def testRawWeights(self):
+        """with norm=None and no query normalization, similarities are plain dot products (e.g. BM25)"""
+        index = self.cls(corpus, num_features=len(dictionary), norm=None)
+        index.normalize = False
+        dense = numpy.array([matutils.sparse2full(doc, len(dictionary)) for doc in corpus])
+        self.assertTrue(numpy.allclose(index[corpus], numpy.dot(dense, dense.T)))
+        index.num_best = 2
+        self.assertEqual([docno for docno, _ in index[corpus[3]]], [3, 2])
+
+
 class TestSimilarity(unittest.TestCase, _TestSimilarityABC):
     def setUp(self):
         self.cls = similarities.Similarity
@@ -427,6 +567,86 @@ class TestSimilarity(unittest.TestCase, _TestSimilarityABC):
         self.assertTrue(numpy.allclose(expected, sims))
         index.destroy()
 
+    def testReducedPrecision(self):
+        """dense shards can be stored as int8; reopened shards keep their vectors"""
+        dense = numpy.array([matutils.unitvec(matutils.sparse2full(doc, len(dictionary))) for doc in corpus])
+        expected = numpy.dot(dense, dense.T)
+        index = self.cls(None, dense[:4], num_features=len(dictionary), shardsize=3, dtype=numpy.int8)
+        _ = index[dense[0]]  # forces shard close
+        index.add_documents(dense[4:])  # reopens the incomplete int8 shard
+        self.assertTrue(all(shard.get_index().index.dtype == numpy.int8 for shard in index.shards))
+        self.assertTrue(numpy.allclose(index[dense], expected, atol=0.01))
+        self.assertTrue(numpy.allclose(list(index), expected, atol=0.01))
+        self.assertTrue(numpy.allclose(index.vector_by_id(6), dense[6], atol=0.01))
+        index.destroy()
+
+    def testTopnMerge(self):
+        """test merging the top num_best arrays of all shards against the full similarity rows"""
+        index = self.cls(None, corpus, num_features=len(dictionary), shardsize=2)
+        full = index[corpus]
+        for num_best in [0, 1, 3, 1000]:
+            index.num_best = num_best
+            sims = index[corpus]
+            self.assertEqual(len(sims), len(corpus))
+            for row, doc_sims in zip(full, sims):
+                expected = sorted(row[row > 1e-9], reverse=True)[:num_best]
+                self.assertTrue(numpy.allclose([sim for _, sim in doc_sims], expected))
+                self.assertTrue(numpy.allclose([row[docno] for docno, _ in doc_sims], expected))
+            self.assertEqual(index[corpus[2]], sims[2])
+        index.destroy()
+
+    def testCompactConcurrent(self):
+        """test updating and deleting documents while a background compaction is running"""
+        index = self.cls(None, corpus, num_features=len(dictionary), shardsize=4)
+        index.update_documents([1, 6], [corpus[8], corpus[0]])
+        index.delete_documents([2])
+        changed = list(corpus)
+        changed[1], changed[2], changed[6] = corpus[8], [], corpus[0]
+
+        class Interrupted(index.shards[0].cls):
+            @classmethod
+            def load(cls, *args, **kwargs):
+                # runs in the compaction thread, after it took its snapshot of the first shard
+                index.delete_documents([1, 7])
+                index.update_documents([2, 3], [corpus[4], corpus[5]])
+                return super(Interrupted, cls).load(*args, **kwargs)
+
+        index.shards[0].cls = Interrupted
+        index.compact(background=True).join()
+        changed[1], changed[2], changed[3], changed[7] = [], corpus[4], corpus[5], []
+        expected = similarities.MatrixSimilarity(changed, num_features=len(dictionary))[corpus]
+        self.assertTrue(numpy.allclose(index[corpus], expected))
+        self.assertEqual(sorted(index.updated), [2, 3])
+        index.compact()
+        self.assertTrue(numpy.allclose(index[corpus], expected))
+        self.assertFalse(index.updated)
+        index.destroy()
+
+    def testParallel(self):
+        """test querying the shards with a persistent pool of threads"""
+        index = self.cls(None, corpus, num_features=len(dictionary), shardsize=2)
+        parallel = self.cls(None, corpus, num_features=len(dictionary), shardsize=2, workers=3)
+        self.assertTrue(numpy.allclose(parallel[corpus[0]], index[corpus[0]]))
+        executor = parallel.executor
+        self.assertTrue(executor is not None)
+        self.assertTrue(numpy.allclose(parallel[corpus], index[corpus]))
+        parallel.num_best = index.num_best = 3
+        self.assertEqual(parallel[corpus[1]], index[corpus[1]])
+        self.assertEqual(parallel[corpus], index[corpus])
+        self.assertTrue(parallel.executor is executor)  # the threads are reused by later queries
+
+        fname = testfile()
+        parallel.save(fname)
+        parallel2 = self.cls.load(fname)
+        self.assertTrue(parallel2.executor is None)
+        parallel.save(fname, ignore='overlay')  # the threads are left out even with a custom `ignore`
+        parallel2 = self.cls.load(fname)
+        self.assertTrue(parallel2.executor is None)
+        self.assertEqual(parallel2[corpus[1]], index[corpus[1]])
+        parallel2.close()
+        parallel.destroy()
+        index.destroy()
+
     def testMmapCompressed(self):
         pass
         # turns out this test doesn't exercise this because there are no arrays
@@ -485,7 +705,7 @@ class TestWord2VecAnnoyIndexer(unittest.TestCase):
         self.assertRaises(IOError, test_index.load, fname='test-index')
 
     def assertVectorIsSimilarToItself(self, model, index):
-        vector = model.wv.syn0norm[0]
+        vector = matutils.unitvec(model.wv.syn0[0])
         label = model.wv.index2word[0]
         approx_neighbors = index.most_similar(vector, 1)
         word, similarity = approx_neighbors[0]
@@ -494,7 +714,7 @@ class TestWord2VecAnnoyIndexer(unittest.TestCase):
         self.assertEqual(similarity, 1.0)
 
     def assertApproxNeighborsMatchExact(self, model, index):
-        vector = model.wv.syn0norm[0]
+        vector = matutils.unitvec(model.wv.syn0[0])
         approx_neighbors = model.most_similar([vector], topn=5, indexer=index)
         exact_neighbors = model.most_similar(positive=[vector], topn=5)
 
@@ -579,6 +799,65 @@ class TestDoc2VecAnnoyIndexer(unittest.TestCase):
         self.assertEqual(self.index.num_trees, self.index2.num_trees)
 
 
+class TestIvfIndexer(unittest.TestCase):
+
+    def setUp(self):
+        self.w2v = word2vec.Word2Vec(texts, min_count=1, seed=42)
+        self.d2v = doc2vec.Doc2Vec(sentences, min_count=1, seed=42)
+
+    def testWord2Vec(self):
+        index = similarities.IvfIndexer(self.w2v, num_lists=4, num_probes=1)
+        self.assertEqual(len(index), len(self.w2v.wv.vocab))
+        self.assertEqual(index.offsets[-1], len(index))
+        self.assertEqual(sorted(index.ids), list(range(len(index))))
+
+        vector = matutils.unitvec(self.w2v.wv.syn0[0])
+        word, similarity = index.most_similar(vector, 1)[0]
+        self.assertEqual(word, self.w2v.wv.index2word[0])
+        self.assertAlmostEqual(similarity, 1.0, places=5)
+
+        # probing all lists gives the exact results
+        index.num_probes = index.num_lists
+        approx_neighbors = self.w2v.most_similar([vector], topn=5, indexer=index)
+        exact_neighbors = self.w2v.most_similar(positive=[vector], topn=5)
+        self.assertEqual([word for word, _ in approx_neighbors], [word for word, _ in exact_neighbors])
+        self.assertTrue(numpy.allclose(
+            [sim for _, sim in approx_neighbors], [sim for _, sim in exact_neighbors], atol=1e-6))
+
+    def testKeyedVectors(self):
+        index = similarities.IvfIndexer(self.w2v.wv, num_lists=100)
+        self.assertEqual(index.num_lists, len(self.w2v.wv.vocab))  # at most one list per vector
+        self.assertEqual(len(self.w2v.wv.most_similar('graph', topn=3, indexer=index)), 3)
+
+    def testDoc2Vec(self):
+        index = similarities.IvfIndexer(self.d2v, num_probes=100)
+        vector = matutils.unitvec(self.d2v.docvecs.doctag_syn0[0])
+        doc, similarity = index.most_similar(vector, 1)[0]
+        self.assertEqual(doc, 0)
+        self.assertAlmostEqual(similarity, 1.0, places=5)
+        approx_neighbors = self.d2v.docvecs.most_similar([vector], topn=5, indexer=index)
+        exact_neighbors = self.d2v.docvecs.most_similar(positive=[vector], topn=5)
+        self.assertEqual([doc for doc, _ in approx_neighbors], [doc for doc, _ in exact_neighbors])
+
+    def testPersistence(self):
+        fname = testfile()
+        index = similarities.IvfIndexer(self.w2v, num_lists=3)
+        index.save(fname, sep_limit=0)
+        vector = matutils.unitvec(self.w2v.wv.syn0[1])
+        for mmap in (None, 'r'):
+            index2 = similarities.IvfIndexer.load(fname, mmap=mmap)
+            self.assertEqual(index.labels, index2.labels)
+            self.assertEqual(index.num_probes, index2.num_probes)
+            self.assertTrue(numpy.allclose(index.vectors, index2.vectors))
+            self.assertEqual(index.most_similar(vector, 5), index2.most_similar(vector, 5))
+        self.assertTrue(isinstance(index2.vectors, numpy.memmap))
+
+    def testInvalidInput(self):
+        self.assertRaises(ValueError, similarities.IvfIndexer, object())
+        self.assertRaises(ValueError, similarities.IvfIndexer().build, numpy.zeros((0, 5)), [])
+        self.assertRaises(ValueError, similarities.IvfIndexer().build, numpy.ones((3, 5)), ['a'])
+
+
 if __name__ == '__main__':
     logging.basicConfig(format='%(asctime)s : %(levelname)s : %(message)s', level=logging.DEBUG)
     unittest.main()
@@ -77,6 +77,15 @@ class TestTfidfModel(unittest.TestCase):
         model2 = tfidfmodel.TfidfModel(dictionary=dictionary)
         self.assertEqual(model1.idfs, model2.idfs)
 
+    def testSparseChunks(self):
+        # MmCorpus counts document frequencies from `iter_chunks`, a plain list document by document
+        model1 = tfidfmodel.TfidfModel(self.corpus)
+        model2 = tfidfmodel.TfidfModel(list(self.corpus))
+        self.assertEqual(model1.dfs, model2.dfs)
+        self.assertEqual(model1.idfs, model2.idfs)
+        self.assertEqual((model1.num_docs, model1.num_nnz), (model2.num_docs, model2.num_nnz))
+        self.assertTrue(all(isinstance(termid, int) for termid in model1.dfs))
+
 
     def testPersistence(self):
         fname = testfile()
@@ -9,12 +9,16 @@ Automated tests for checking the WikiCorpus
 """
 
 
+import bz2
 import os
+import re
 import sys
+import tempfile
 import types
 import logging
 import unittest
 
+from gensim.corpora import wikicorpus
 from gensim.corpora.wikicorpus import WikiCorpus
 
 
@@ -25,6 +29,39 @@ FILENAME_U = 'bgwiki-latest-pages-articles-shortened.xml.bz2'
 
 logger = logging.getLogger(__name__)
 
+
+def get_tmpfile(suffix):
+    return os.path.join(tempfile.gettempdir(), suffix)
+
+
+def make_multistream(fname, fname_out, index_fname_out, pages_per_stream=10):
+    """
+    Recompress the dump `fname` as a multistream dump, the way Wikimedia does: a stream with the
+    header, streams of `pages_per_stream` pages, and a stream with the footer. Also write the index.
+
+    Return the offsets of all streams.
+    """
+    with bz2.BZ2File(fname) as fin:
+        xml = fin.read()
+    pages = [match.group(0) for match in re.finditer(b'  <page>.*?</page>\n', xml, re.DOTALL)]
+    header, footer = xml[:xml.find(b'  <page>')], xml[xml.rfind(b'</page>\n') + len(b'</page>\n'):]
+    offsets, offset = [], 0
+    with open(fname_out, 'wb') as fout:
+        with bz2.BZ2File(index_fname_out, 'w') as findex:
+            groups = [pages[start: start + pages_per_stream] for start in range(0, len(pages), pages_per_stream)]
+            for group in [[header]] + groups + [[footer]]:
+                data = b''.join(group)
+                if group in groups:
+                    for page in group:
+                        pageid = re.search(b'<id>(.*?)</id>', page).group(1)
+                        findex.write(b'%i:' % offset + pageid + b':title\n')
+                data = bz2.compress(data)
+                fout.write(data)
+                offsets.append(offset)
+                offset += len(data)
+    return offsets
+
+
 class TestWikiCorpus(unittest.TestCase):
 
     # #TODO: sporadic failure to be investigated
@@ -52,6 +89,15 @@ class TestWikiCorpus(unittest.TestCase):
         self.assertTrue(u'anarchism' in next(l))
         self.assertTrue(u'autism' in next(l))
 
+    def test_dictionary_workers(self):
+        """
+        The dictionary counted by several processes is the same as the one counted by one.
+        """
+        serial = WikiCorpus(datapath(FILENAME), processes=1).dictionary
+        parallel = WikiCorpus(datapath(FILENAME), processes=1, dictionary_workers=2).dictionary
+        self.assertEqual(parallel.token2id, serial.token2id)
+        self.assertEqual(parallel.dfs, serial.dfs)
+
     def test_unicode_element(self):
         """
         First unicode article in this sample is
@@ -62,6 +108,62 @@ class TestWikiCorpus(unittest.TestCase):
         l = wc.get_texts()
         self.assertTrue(u'папа' in next(l))
 
+    def test_multistream(self):
+        """
+        Multistream dumps are parsed in parallel, with the same result as single stream dumps.
+        """
+        fname, index_fname = get_tmpfile('gensim_multistream.xml.bz2'), get_tmpfile('gensim_multistream-index.txt.bz2')
+        offsets = make_multistream(datapath(FILENAME), fname, index_fname)
+        expected = list(WikiCorpus(datapath(FILENAME), processes=1, dictionary={}).get_texts())
+        self.assertEqual(wikicorpus.find_streams(datapath(FILENAME)), [0])
+        self.assertFalse(wikicorpus.is_multistream(datapath(FILENAME)))
+        self.assertTrue(wikicorpus.is_multistream(fname))
+        # the first stream doesn't end within the probed bytes: treated as a single stream dump
+        self.assertFalse(wikicorpus.is_multistream(fname, probe_bytes=10))
+
+        streams = wikicorpus.find_streams(fname, bufsize=1000)
+        self.assertEqual(streams, offsets)
+        # the index doesn't list the footer stream, which holds no pages
+        self.assertEqual(wikicorpus.find_streams(fname, index_fname), offsets[:-1])
+
+        chunk_bytes, wikicorpus.STREAM_CHUNK_BYTES = wikicorpus.STREAM_CHUNK_BYTES, 10000
+        try:
+            wc = WikiCorpus(fname, processes=2, dictionary={})
+            self.assertEqual(wc.streams, None)  # not located until the first iteration
+            self.assertEqual(list(wc.get_texts()), expected)
+            self.assertEqual(wc.streams, streams)
+            wc = WikiCorpus(fname, processes=2, dictionary={}, index_fname=index_fname, ordered=False)
+            self.assertEqual(sorted(wc.get_texts()), sorted(expected))
+        finally:
+            wikicorpus.STREAM_CHUNK_BYTES = chunk_bytes
+        os.remove(fname)
+        os.remove(index_fname)
+
+    def test_resume(self):
+        """
+        Iteration can be resumed from `position`, in single and multistream dumps.
+        """
+        fname, index_fname = get_tmpfile('gensim_resume.xml.bz2'), get_tmpfile('gensim_resume-index.txt.bz2')
+        make_multistream(datapath(FILENAME), fname, index_fname)
+        chunk_bytes, wikicorpus.STREAM_CHUNK_BYTES = wikicorpus.STREAM_CHUNK_BYTES, 10000
+        try:
+            for dump in [datapath(FILENAME), fname]:
+                wc = WikiCorpus(dump, processes=2, dictionary={})
+                texts, positions = [], []
+                for text in wc.get_texts():
+                    texts.append(text)
+                    positions.append(wc.position)
+                self.assertEqual(len(set(positions)), len(texts))
+                for docno in [0, 1, 7, len(texts) - 2]:
+                    self.assertEqual(list(wc.get_texts(positions[docno])), texts[docno + 1:])
+                self.assertEqual(list(wc.get_texts(positions[-1])), [])
+        finally:
+            wikicorpus.STREAM_CHUNK_BYTES = chunk_bytes
+        wc = WikiCorpus(fname, processes=2, dictionary={}, ordered=False)
+        self.assertRaises(ValueError, list, wc.get_texts(positions[0]))
+        os.remove(fname)
+        os.remove(index_fname)
+
 if __name__ == '__main__':
     logging.basicConfig(format='%(asctime)s : %(levelname)s : %(message)s', level=logging.DEBUG)
     unittest.main()
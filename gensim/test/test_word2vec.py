@@ -16,13 +16,15 @@ import tempfile
 import itertools
 import bz2
 import sys
+import pickle
+from copy import deepcopy
 
 import numpy as np
 
 from gensim import utils, matutils
 from gensim.utils import check_output
 from subprocess import PIPE
-from gensim.models import word2vec, keyedvectors
+from gensim.models import word2vec, keyedvectors, quantizedvectors
 from testfixtures import log_capture
 
 try:
@@ -242,6 +244,66 @@ class TestWord2VecModel(unittest.TestCase):
         half_precision_model_kv = keyedvectors.KeyedVectors.load_word2vec_format(testfile(), binary=True, datatype=np.float16)
         self.assertEquals(binary_model_kv.syn0.nbytes, half_precision_model_kv.syn0.nbytes * 2)
 
+    def testWord2VecFormatSmallChunks(self):
+        """Test loading word2vec format in chunks smaller than a single vector."""
+        model = word2vec.Word2Vec(sentences, min_count=1)
+        for binary in (True, False):
+            model.wv.save_word2vec_format(testfile(), binary=binary)
+            expected = keyedvectors.KeyedVectors.load_word2vec_format(testfile(), binary=binary)
+            for chunk_size in (1, 7, 300, 10 ** 6):
+                kv = keyedvectors.KeyedVectors.load_word2vec_format(testfile(), binary=binary, chunk_size=chunk_size)
+                self.assertEqual(kv.index2word, expected.index2word)
+                self.assertTrue(np.allclose(kv.syn0, expected.syn0))
+                self.assertTrue(np.allclose(kv['human'], model['human'], atol=1e-6))
+            limited = keyedvectors.KeyedVectors.load_word2vec_format(testfile(), binary=binary, limit=5, chunk_size=7)
+            self.assertEqual(limited.index2word, expected.index2word[:5])
+
+    def testWord2VecFormatDuplicateWords(self):
+        """Test that only the first occurrence of a duplicate word is kept."""
+        tfile = testfile()
+        with utils.smart_open(tfile, 'wb') as fout:
+            fout.write(b"4 2\nhuman 1.0 2.0\ngraph 3.0 4.0\nhuman 5.0 6.0\ntree 7.0 8.0\n")
+        kv = keyedvectors.KeyedVectors.load_word2vec_format(tfile, binary=False, chunk_size=10)
+        self.assertEqual(kv.index2word, ['human', 'graph', 'tree'])
+        self.assertTrue(np.allclose(kv.syn0, [[1.0, 2.0], [3.0, 4.0], [7.0, 8.0]]))
+        self.assertEqual(kv.vocab['tree'].index, 2)
+
+    def testPersistenceMmappableFormat(self):
+        """Test storing/loading vectors in the memory-mappable flat-array format."""
+        model = word2vec.Word2Vec(sentences, min_count=1)
+        vocab = model.wv.vocab.pop('graph')  # rename to a non-ascii word
+        model.wv.vocab[u'žluťoučký'] = vocab
+        model.wv.index2word[vocab.index] = u'žluťoučký'
+        model.wv.save_mmappable(testfile())
+        for mmap in ['r', None]:
+            kv = keyedvectors.KeyedVectors.load_mmappable(testfile(), mmap=mmap)
+            self.assertEqual(len(kv.vocab), len(model.wv.vocab))
+            self.assertEqual(list(kv.index2word), model.wv.index2word)
+            self.assertEqual(kv.index2word[-1], model.wv.index2word[-1])
+            self.assertEqual(kv.index2word[1:3], model.wv.index2word[1:3])
+            for word, vocab in model.wv.vocab.items():
+                self.assertTrue(word in kv)
+                self.assertEqual(kv.vocab[word].index, vocab.index)
+                self.assertEqual(kv.vocab[word].count, vocab.count)
+                self.assertTrue(np.allclose(kv[word], model[word]))
+            self.assertFalse('nonexistent' in kv)
+            self.assertFalse(None in kv.vocab)
+            self.assertRaises(KeyError, kv.word_vec, 'nonexistent')
+            self.assertEqual(kv.most_similar('human', topn=5), model.wv.most_similar('human', topn=5))
+            self.assertAlmostEqual(kv.similarity('human', 'trees'), model.wv.similarity('human', 'trees'), places=5)
+        self.assertTrue(isinstance(keyedvectors.KeyedVectors.load_mmappable(testfile()).syn0, np.memmap))
+
+    def testPersistenceMmappableFormatNormsOnly(self):
+        """Test storing/loading only the vector norms instead of the normalized vectors, in the flat-array format."""
+        model = word2vec.Word2Vec(sentences, min_count=1)
+        model.wv.save_mmappable(testfile(), norms_only=True)
+        kv = keyedvectors.KeyedVectors.load_mmappable(testfile())
+        self.assertTrue(kv.syn0norm is None)
+        self.assertTrue(isinstance(kv.syn0_norms, np.memmap))
+        expected = model.wv.most_similar('human', topn=5)
+        self.assertTrue(np.allclose([sim for _, sim in kv.most_similar('human', topn=5)], [sim for _, sim in expected]))
+        self.assertTrue(kv.syn0norm is None)
+
     def testNoTrainingCFormat(self):
         model = word2vec.Word2Vec(sentences, min_count=1)
         model.init_sims()
@@ -354,6 +416,58 @@ class TestWord2VecModel(unittest.TestCase):
         # input not empty, but rather completely filtered out
         self.assertRaises(RuntimeError, word2vec.Word2Vec, corpus, min_count=total_words+1)
 
+    def testCompactVocab(self):
+        """Test the array-backed vocabulary behaves like a dict of Vocab objects."""
+        vocab = keyedvectors.CompactVocab()
+        vocab['a'] = keyedvectors.Vocab(index=1, count=5, sample_int=2**32, code=[0, 1], point=[7, 8])
+        vocab.add('b', index=0, count=None)
+        vocab['c'] = keyedvectors.Vocab(index=2, count=1)
+        vocab['b'].count = 3
+        vocab['b'].count += 1
+        vocab['c'].code, vocab['c'].point = np.array([1, 1, 0], dtype=np.uint8), np.array([1, 2, 3], dtype=np.uint32)
+        vocab['a'].code = [1, 0]
+        self.assertEqual(len(vocab), 3)
+        self.assertEqual(vocab['b'].count, 4)
+        self.assertEqual((vocab['a'].index, vocab['a'].count), (1, 5))
+        self.assertEqual(vocab['a'].sample_int, keyedvectors.MAX_SAMPLE_INT)
+        self.assertEqual(list(vocab['a'].code), [1, 0])
+        self.assertEqual(list(vocab['a'].point), [7, 8])
+        self.assertEqual(list(vocab['c'].point), [1, 2, 3])
+        self.assertFalse(hasattr(vocab['b'], 'code'))
+        self.assertTrue(vocab['b'] < vocab['a'])
+        self.assertEqual(sorted(vocab), ['a', 'b', 'c'])
+
+        del vocab['a']
+        self.assertFalse('a' in vocab)
+        restored = pickle.loads(pickle.dumps(vocab, protocol=2))
+        vocab.save(testfile())
+        loaded = keyedvectors.CompactVocab.load(testfile())
+        for other in (vocab, restored, loaded):
+            self.assertEqual(sorted(other), ['b', 'c'])
+            self.assertEqual((other['b'].index, other['b'].count), (0, 4))
+            self.assertEqual((other['c'].index, other['c'].count), (2, 1))
+            self.assertEqual(list(other['c'].code), [1, 1, 0])
+            self.assertEqual(list(other['c'].point), [1, 2, 3])
+        self.assertEqual(len(vocab.codes), 3)  # trimmed storage of the deleted word
+
+    def testTrainingWithDictVocab(self):
+        """Test models with a plain dict of Vocab objects (e.g. loaded from older versions) still train the same."""
+        for hs, negative in ((1, 0), (0, 5)):
+            model = word2vec.Word2Vec(size=10, min_count=1, hs=hs, negative=negative, seed=42, workers=1)
+            model.build_vocab(sentences)
+            self.assertTrue(isinstance(model.wv.vocab, keyedvectors.CompactVocab))
+            dict_model = deepcopy(model)
+            dict_model.wv.vocab = dict(
+                (word, keyedvectors.Vocab(**dict(
+                    (attr, getattr(v, attr)) for attr in ('index', 'count', 'sample_int', 'code', 'point')
+                    if hasattr(v, attr))))
+                for word, v in model.wv.vocab.items())
+            for m in (model, dict_model):
+                m.train(sentences, total_examples=len(sentences), epochs=1)
+            self.assertTrue(np.allclose(model.wv.syn0, dict_model.wv.syn0))
+            if hs:
+                self.assertTrue(np.allclose(model.score(sentences), dict_model.score(sentences)))
+
     def testTraining(self):
         """Test word2vec training."""
         # build vocabulary, don't train yet
@@ -409,6 +523,110 @@ class TestWord2VecModel(unittest.TestCase):
         w2v_accuracy = model.accuracy(datapath('questions-words.txt'))
         kv_accuracy = model.wv.accuracy(datapath('questions-words.txt'))
         self.assertEqual(w2v_accuracy, kv_accuracy)
+        # the batched look-ups find the same answers as one `most_similar` call per question
+        for case_insensitive in (True, False):
+            batched = model.wv.accuracy(datapath('questions-words.txt'), case_insensitive=case_insensitive)
+            one_by_one = model.wv.accuracy(
+                datapath('questions-words.txt'), most_similar=keyedvectors.KeyedVectors.most_similar,
+                case_insensitive=case_insensitive)
+            self.assertEqual([s['section'] for s in batched], [s['section'] for s in one_by_one])
+            total, total_one_by_one = batched[-1], one_by_one[-1]
+            self.assertEqual(
+                sorted(total['correct'] + total['incorrect']),
+                sorted(total_one_by_one['correct'] + total_one_by_one['incorrect']))
+            # near-ties may be broken differently, due to different float rounding
+            self.assertTrue(abs(len(total['correct']) - len(total_one_by_one['correct'])) <= 2)
+
+    def testNormsOnly(self):
+        """Test normalizing on the fly gives the same similarities as with syn0norm, without creating syn0norm"""
+        model = word2vec.Word2Vec(LeeCorpus(), min_count=2, seed=42, workers=1)
+        wv = deepcopy(model.wv)
+        wv.init_sims(norms_only=True)
+        self.assertTrue(wv.syn0norm is None)
+        self.assertTrue(np.allclose(wv.syn0_norms, np.sqrt((wv.syn0 ** 2).sum(axis=1))))
+        model.wv.init_sims()
+        for restrict_vocab in (None, 100):
+            self.assertTrue(np.allclose(
+                wv.most_similar('war', topn=False, restrict_vocab=restrict_vocab),
+                model.wv.most_similar('war', topn=False, restrict_vocab=restrict_vocab), atol=1e-6))
+        self.assertEqual(
+            [word for word, _ in wv.most_similar(['man', 'queen'], ['woman'])],
+            [word for word, _ in model.wv.most_similar(['man', 'queen'], ['woman'])])
+        self.assertTrue(np.allclose(wv.word_vec('war', use_norm=True), model.wv.word_vec('war', use_norm=True)))
+        self.assertTrue(wv.doesnt_match(['war', 'terrorism', 'police']) in ['war', 'terrorism', 'police'])
+        self.assertAlmostEqual(wv.n_similarity(['war'], ['police', 'fire']), model.wv.n_similarity(['war'], ['police', 'fire']))
+        for query, result in zip(['war', 'police'], wv.most_similar_batch([['war'], ['police']], topn=3)):
+            expected = wv.most_similar(query, topn=3)
+            self.assertTrue(np.allclose([sim for _, sim in result], [sim for _, sim in expected], atol=1e-5))
+        wv.accuracy(datapath('questions-words.txt'))
+        self.assertTrue(wv.syn0norm is None)
+
+        # switching modes drops the other one
+        wv.init_sims(replace=True)
+        self.assertTrue(wv.syn0_norms is None)
+        model.wv.init_sims(norms_only=True)
+        self.assertTrue(model.wv.syn0norm is None)
+        model.clear_sims()
+        self.assertTrue(model.wv.syn0_norms is None)
+
+    def testMostSimilarBatch(self):
+        """Test batched most_similar gives the same results as one most_similar call per query."""
+        model = word2vec.Word2Vec(LeeCorpus(), min_count=2, seed=42, workers=1)
+        positive = [['war'], 'terrorism', ['man', 'queen'], [model.wv['police'], ('crime', 2.0)]]
+        negative = [[], [], ['woman'], ['fire']]
+        for restrict_vocab in (None, 200):
+            for topn in (1, 10):
+                batched = model.wv.most_similar_batch(positive, negative, topn=topn, restrict_vocab=restrict_vocab)
+                self.assertEqual(len(batched), len(positive))
+                for pos, neg, result in zip(positive, negative, batched):
+                    expected = model.wv.most_similar(pos, neg, topn=topn, restrict_vocab=restrict_vocab)
+                    dists = model.wv.most_similar(pos, neg, topn=False, restrict_vocab=restrict_vocab)
+                    # near-ties may come out in a different order, due to different float rounding
+                    self.assertTrue(np.allclose([sim for _, sim in result], [sim for _, sim in expected], atol=1e-5))
+                    for word, sim in result:
+                        self.assertAlmostEqual(sim, dists[model.wv.vocab[word].index], places=5)
+        # input words are never returned, even if fewer than topn results remain
+        result = model.wv.most_similar_batch([['war', 'police']], topn=len(model.wv.vocab))[0]
+        self.assertEqual(len(result), len(model.wv.vocab) - 2)
+        self.assertEqual(model.wv.most_similar_batch([]), [])
+        self.assertRaises(ValueError, model.wv.most_similar_batch, [['war']], [])
+
+    def testQuantizedVectors(self):
+        """Test quantized vectors approximate the original ones, and answer queries from the codes alone"""
+        model = word2vec.Word2Vec(LeeCorpus(), min_count=2, seed=42, workers=1)
+        for method, kwargs in [('int8', {}), ('pq', {'num_centroids': 16}), ('pq', {'num_subvectors': 50})]:
+            qv = quantizedvectors.QuantizedKeyedVectors.quantize(model.wv, method=method, **kwargs)
+            self.assertTrue(qv.nbytes() < model.wv.syn0.nbytes / 2)
+            self.assertEqual(qv.index2word, model.wv.index2word)
+            self.assertTrue(np.allclose(qv.norms, np.sqrt((model.wv.syn0 ** 2).sum(axis=1)), rtol=1e-5))
+            for word in ('war', 'terrorism', 'police'):
+                self.assertTrue(np.dot(matutils.unitvec(qv[word]), matutils.unitvec(model.wv[word])) > 0.9)
+                norm = qv.norms[qv.vocab[word].index]
+                self.assertTrue(np.allclose(qv.word_vec(word), qv.word_vec(word, use_norm=True) * norm))
+
+            # the distances computed from the codes match those of the reconstructed vectors
+            reconstructed = qv.dequantize().syn0 / qv.norms[:, np.newaxis]
+            query = matutils.unitvec(qv.word_vec('war', use_norm=True))
+            self.assertTrue(np.allclose(qv.most_similar('war', topn=False), np.dot(reconstructed, query), atol=1e-5))
+            self.assertEqual(len(qv.most_similar('war', topn=5, restrict_vocab=100)), 5)
+            batched = qv.most_similar_batch([['war'], ['man', 'queen']], [[], ['woman']], topn=3)
+            self.assertEqual(batched[0], qv.most_similar('war', topn=3))
+            self.assertEqual(
+                [s['section'] for s in qv.accuracy(datapath('questions-words.txt'))],
+                [s['section'] for s in model.wv.accuracy(datapath('questions-words.txt'))])
+            self.assertTrue(qv.syn0norm is None)
+
+            fname = testfile()
+            qv.save(fname, sep_limit=0)
+            for mmap in (None, 'r'):
+                qv2 = quantizedvectors.QuantizedKeyedVectors.load(fname, mmap=mmap)
+                self.assertEqual(qv.most_similar('war'), qv2.most_similar('war'))
+                self.assertTrue(np.allclose(qv['war'], qv2['war']))
+            self.assertTrue(isinstance(qv2.codes, np.memmap))
+
+        self.assertRaises(ValueError, quantizedvectors.QuantizedKeyedVectors.quantize, model.wv, method='fp16')
+        self.assertRaises(
+            ValueError, quantizedvectors.QuantizedKeyedVectors.quantize, model.wv, method='pq', num_subvectors=7)
 
     def testEvaluateWordPairs(self):
         """Test Spearman and Pearson correlation coefficients give sane results on similarity datasets"""
@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Licensed under the GNU LGPL v2.1 - http://www.gnu.org/licenses/lgpl.html
+
+"""
+USAGE: %(program)s NUMWORDS DIMENSIONS [OUTPUT_DIR]
+    Run speed test of KeyedVectors.load_word2vec_format on a synthetic file of NUMWORDS \
+random vectors of DIMENSIONS dimensions, in both the binary and the text C format. \
+The buffered loader is compared against a reference reader that parses the file \
+byte-by-byte and value-by-value.
+
+Example: ./w2vloadspeed.py 3000000 300 /tmp
+"""
+
+import logging
+import sys
+import os
+from time import time
+
+import numpy as np
+
+from gensim import utils
+from gensim.models.keyedvectors import KeyedVectors
+
+
+def write_synthetic(fname, num_words, dim, binary):
+    """Store `num_words` random vectors in word2vec C format, in chunks (the matrix never lives in RAM)."""
+    with utils.smart_open(fname, 'wb') as fout:
+        fout.write(utils.to_utf8("%s %s\n" % (num_words, dim)))
+        for start in range(0, num_words, 100000):
+            block = np.random.rand(min(100000, num_words - start), dim).astype(np.float32) - 0.5
+            for no, row in enumerate(block):
+                word = utils.to_utf8("%s_%i" % ('word' * (no % 4), start + no))  # words of varying length
+                if binary:
+                    fout.write(word + b" " + row.tostring())
+                else:
+                    fout.write(word + b" " + utils.to_utf8(' '.join("%f" % val for val in row)) + b"\n")
+
+
+def load_reference(fname, binary):
+    """The original loader: read binary words one byte at a time, convert text values one by one."""
+    with utils.smart_open(fname) as fin:
+        num_words, dim = map(int, fin.readline().split())
+        syn0 = np.zeros((num_words, dim), dtype=np.float32)
+        index2word = []
+        binary_len = np.dtype(np.float32).itemsize * dim
+        for line_no in range(num_words):
+            if binary:
+                word = []
+                while True:
+                    ch = fin.read(1)
+                    if ch == b' ':
+                        break
+                    if ch != b'\n':
+                        word.append(ch)
+                index2word.append(utils.to_unicode(b''.join(word)))
+                syn0[line_no] = np.fromstring(fin.read(binary_len), dtype=np.float32)
+            else:
+                parts = utils.to_unicode(fin.readline().rstrip()).split(" ")
+                index2word.append(parts[0])
+                syn0[line_no] = list(map(np.float32, parts[1:]))
+    return index2word, syn0
+
+
+if __name__ == '__main__':
+    logging.basicConfig(format='%(asctime)s : %(levelname)s : %(message)s', level=logging.WARNING)
+
+    program = os.path.basename(sys.argv[0])
+    if len(sys.argv) < 3:
+        print(globals()['__doc__'] % locals())
+        sys.exit(1)
+    num_words, dim = int(sys.argv[1]), int(sys.argv[2])
+    output_dir = sys.argv[3] if len(sys.argv) > 3 else '.'
+
+    for binary in [True, False]:
+        fname = os.path.join(output_dir, 'w2vloadspeed_%ix%i.%s' % (num_words, dim, 'bin' if binary else 'txt'))
+        if not os.path.exists(fname):
+            write_synthetic(fname, num_words, dim, binary)
+        size_mb = os.path.getsize(fname) / 1024.0 / 1024.0
+
+        start = time()
+        kv = KeyedVectors.load_word2vec_format(fname, binary=binary)
+        taken_fast = time() - start
+
+        start = time()
+        index2word, syn0 = load_reference(fname, binary)
+        taken_ref = time() - start
+
+        assert kv.index2word == index2word
+        assert np.allclose(kv.syn0, syn0)
+        print("%s format, %i x %i (%.1f MB): buffered %.2fs (%.1f MB/s), reference %.2fs (%.1f MB/s), speedup %.1fx" % (
+            'binary' if binary else 'text', num_words, dim, size_mb,
+            taken_fast, size_mb / taken_fast, taken_ref, size_mb / taken_ref, taken_ref / taken_fast))
@@ -248,7 +248,13 @@ setup(
             include_dirs=[model_dir]),
         Extension('gensim.models.doc2vec_inner',
             sources=['./gensim/models/doc2vec_inner.c'],
-            include_dirs=[model_dir])
+            include_dirs=[model_dir]),
+        Extension('gensim.matutils_inner',
+            sources=['./gensim/matutils_inner.c'],
+            include_dirs=[gensim_dir]),
+        Extension('gensim.corpora.hashdictionary_inner',
+            sources=['./gensim/corpora/hashdictionary_inner.c'],
+            include_dirs=[gensim_dir])
     ],
     cmdclass=cmdclass,
     packages=find_packages(),